@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 16:31:12 2026
+
+@author: Alanis Zeoli
+
+Objective: Time the analysis, the ingestion of the climate files and the
+charts over the meteorological files of the Meteo folder, and flag the
+regressions compared to a saved baseline
+
+Benchmarks:
+    import = import of the analysis modules (main, sweep, grid) in a new interpreter
+    humidity = computation of w from T_dry and RH (psychrometrics.humidity_ratio)
+    feasibility_analysis = main.feasibility_analysis without chart, from the file to the recommended mode
+    main = methodology.main without chart, including the boundary model
+    main_chart = methodology.main with chart (Agg backend)
+    zone_def = classification of the hours with methodology.zone_def, mode after mode
+    classify = classification of the hours with methodology.classify
+    plot_diagram = psychrometric_diagram.plot_diagram
+
+The boundary models and the CoolProp results cached in memory are cleared
+before each run, so that their construction is timed in every run.
+
+Outputs (for each benchmark):
+    time = median time of one run over all the files [s]
+    throughput = number of hours processed per second
+    peak_memory = peak memory allocated by Python during one run [MB] (tracemalloc)
+
+Usage:
+    python benchmark.py                  Runs the benchmarks and compares them to the baseline
+    python benchmark.py --save           Runs the benchmarks and saves them as the new baseline
+    python benchmark.py --only main      Runs only some of the benchmarks
+"""
+
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+baseline_file = 'benchmark_baseline.json'
+meteo_folder = 'Meteo'
+
+# Empties the caches of boundary models and CoolProp results kept in memory
+def clear_caches():
+    import methodology
+    import properties
+
+    methodology.cached_boundary_model.cache_clear()
+    properties.clear()
+
+# Returns the median time [s] and the peak memory [MB] of a function, the caches being cleared before each run
+def measure(function,repeat=3):
+    times = []
+    for _ in range(repeat):
+        clear_caches()
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter()-start)
+
+    # The memory is measured on a separate run, tracemalloc slowing down the execution
+    clear_caches()
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return float(np.median(times)), peak/1e6
+
+def import_time():
+    code = ("import time; start = time.perf_counter(); import main, sweep, grid; "
+            "print(time.perf_counter()-start)")
+    output = subprocess.run([sys.executable,'-c',code],capture_output=True,text=True,check=True).stdout
+    return float(output.split()[-1])
+
+# Returns the benchmarks as dictionnaries of functions and number of hours processed by each of them
+def benchmarks():
+    import pandas as pd
+
+    import climate_store
+    import main as feasibility
+    import methodology
+    import psychrometrics
+
+    meteo_files = sorted(glob.glob(os.path.join(meteo_folder,'*.csv')))
+    climate_data = [climate_store.load(path,['T_dry','w','RH'],mmap_mode=None) for path in meteo_files]
+    nb_hours = sum(len(data['T_dry']) for data in climate_data)
+
+    components = feasibility.default_components()
+    params = feasibility.resolve_params({})
+    model = methodology.get_boundary_model(components,params)
+    frames = [pd.DataFrame({'T_dry': data['T_dry'], 'w': data['w']}) for data in climate_data]
+
+    def humidity():
+        for data in climate_data:
+            psychrometrics.humidity_ratio(data['T_dry'],'RH',data['RH'])
+
+    def analysis():
+        for path in meteo_files:
+            feasibility.feasibility_analysis(meteo_file_path=path,components=components,params=dict(params),chart='no',verbose='no')
+
+    def main_no_chart():
+        for data in frames:
+            methodology.main(components,params,climate_data=data,chart='no',verbose='no')
+
+    def main_chart():
+        import matplotlib.pyplot as plt
+        for data in frames:
+            methodology.main(climate_data=data,chart='yes',verbose='no',model=model)
+            plt.close('all')
+
+    def zone_def():
+        for data in climate_data:
+            cooling_zone = np.arange(0,len(data['w']),1)
+            for mode in model.mode_list:
+                cooling_zone, mode_zone, nb_hours_mode = methodology.zone_def(data['T_dry'],data['w'],model.lim[mode],cooling_zone)
+
+    def classify():
+        for data in climate_data:
+            methodology.classify(data['T_dry'],data['w'],model)
+
+    def plot_diagram():
+        import matplotlib.pyplot as plt
+        import psychrometric_diagram as psychro
+        for _ in meteo_files:
+            fig, ax = plt.subplots()
+            psychro.plot_diagram(ax)
+            plt.close(fig)
+
+    functions = {
+        'humidity': humidity,
+        'feasibility_analysis': analysis,
+        'main': main_no_chart,
+        'main_chart': main_chart,
+        'zone_def': zone_def,
+        'classify': classify,
+        'plot_diagram': plot_diagram
+        }
+    return functions, nb_hours
+
+def run(only=None,repeat=3):
+    import matplotlib
+    matplotlib.use('Agg')
+
+    results = {}
+    if only is None or 'import' in only:
+        results['import'] = {'time': import_time(), 'throughput': None, 'peak_memory': None}
+
+    functions, nb_hours = benchmarks()
+    for name in functions:
+        if only is not None and name not in only:
+            continue
+        duration, peak = measure(functions[name],repeat)
+        results[name] = {'time': duration, 'throughput': nb_hours/duration, 'peak_memory': peak}
+    return results
+
+# Returns the benchmarks whose time increased by more than tolerance compared to the baseline
+def regressions(results,baseline,tolerance=0.2):
+    slower = {}
+    for name in results:
+        if name in baseline and results[name]['time'] > (1+tolerance)*baseline[name]['time']:
+            slower[name] = results[name]['time']/baseline[name]['time']
+    return slower
+
+def report(results,baseline=None):
+    for name in results:
+        result = results[name]
+        line = name.ljust(22)+format(result['time'],'9.4f')+" s"
+        if result['throughput'] is not None:
+            line = line+format(result['throughput'],'14.3e')+" h/s"+format(result['peak_memory'],'9.1f')+" MB"
+        if baseline is not None and name in baseline:
+            line = line+"   ("+format(result['time']/baseline[name]['time'],'.2f')+"x baseline)"
+        print(line)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmarks of the feasibility analysis')
+    parser.add_argument('--save',action='store_true',help='save the results as the new baseline')
+    parser.add_argument('--only',nargs='+',help='names of the benchmarks to run')
+    parser.add_argument('--repeat',type=int,default=3,help='number of timed runs of each benchmark')
+    parser.add_argument('--tolerance',type=float,default=0.2,help='relative slowdown flagged as a regression')
+    args = parser.parse_args()
+
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    results = run(args.only,args.repeat)
+
+    baseline = None
+    if os.path.exists(baseline_file):
+        with open(baseline_file) as file:
+            baseline = json.load(file)
+    report(results,baseline)
+
+    if args.save:
+        if baseline is not None:
+            baseline.update(results)
+            results = baseline
+        with open(baseline_file,'w') as file:
+            json.dump(results,file,indent=1)
+        print("Baseline saved in "+baseline_file)
+    elif baseline is not None:
+        slower = regressions(results,baseline,args.tolerance)
+        for name in slower:
+            print("Regression: "+name+" is "+format(slower[name],'.2f')+" times slower than the baseline")
+        if slower:
+            sys.exit(1)
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 14:10:33 2026
+
+@author: Alanis Zeoli
+
+Objective: Geometry of the limit lines (w = m*T+p) for arrays of lines at once,
+used to build the boundaries of many sets of components and parameters
+
+Inputs:
+    m, p = coefficients of the lines (scalars or arrays that can be broadcast together)
+    tol = tolerance on the temperature at the intersection with the saturation curve [°C]
+
+Method:
+    The saturation curve is the polynomial T(w) of methodology.saturation,
+    evaluated with the Horner scheme. Its intersection with each line is found
+    with Newton steps on f(T) = T_sat(m*T+p)-T, safeguarded by a bisection
+    bracket on [T_min, T_max] so that every line converges.
+"""
+
+import numpy as np
+
+# Coefficients of the saturation curve T(w) [°C], from the highest to the lowest degree
+saturation_coef = [7.2356e12, -1.2955e12, 9.5015e10, -3.6881e9, 8.2083e7, -1.0783e6, 9.1033e3, -22.7387]
+
+# Temperature of the saturation curve based on spec. humidity
+def saturation(w):
+    w = np.asarray(w,dtype=float)
+    T = np.zeros_like(w)
+    for coef in saturation_coef:
+        T = T*w + coef
+    return T
+
+# Derivative dT/dw of the saturation curve
+def saturation_derivative(w):
+    w = np.asarray(w,dtype=float)
+    N = len(saturation_coef)
+    dT = np.zeros_like(w)
+    for i, coef in enumerate(saturation_coef[:-1]):
+        dT = dT*w + (N-1-i)*coef
+    return dT
+
+# Returns m and p coefficients of the lines between (T1,w1) and (T2,w2)
+def linear_interp(T1,w1,T2,w2):
+    T1, w1, T2, w2 = np.broadcast_arrays(*[np.asarray(value,dtype=float) for value in (T1,w1,T2,w2)])
+    m = (w2-w1)/(T2-T1)
+    p = w1 - m*T1
+    return m, p
+
+# Returns the couples (T,w) at the intersection between two sets of lines
+def lines_intersection(m1,p1,m2,p2):
+    T = (np.asarray(p2,dtype=float)-p1)/(np.asarray(m1,dtype=float)-m2)
+    w = m1*T + p1
+    return T, w
+
+# Returns the couples (T,w) at the intersection between lines and vertical lines T = T_v
+def vertical_intersection(T_v,m,p):
+    T = np.asarray(T_v,dtype=float)+np.zeros_like(np.asarray(m,dtype=float)*p)
+    w = m*T + p
+    return T, w
+
+# Returns the couples (T,w) at the intersection between lines and the saturation curve
+def curve_intersection(m,p,tol=1e-6,T_min=0,T_max=50,max_iter=100):
+    m, p = np.broadcast_arrays(np.asarray(m,dtype=float),np.asarray(p,dtype=float))
+    lower = np.full(m.shape,float(T_min))
+    upper = np.full(m.shape,float(T_max))
+    T = (lower+upper)/2
+
+    for _ in range(max_iter):
+        w = m*T + p
+        f = saturation(w) - T
+        converged = np.abs(f) <= tol
+        if converged.all():
+            break
+
+        # Points below the curve are on the lower side of the bracket
+        lower = np.where(f>0,T,lower)
+        upper = np.where(f<0,T,upper)
+
+        df = saturation_derivative(w)*m - 1
+        with np.errstate(divide='ignore',invalid='ignore'):
+            T_newton = T - f/df
+
+        # Newton step if it stays in the bracket, bisection otherwise
+        inside = np.isfinite(T_newton) & (T_newton>lower) & (T_newton<upper)
+        T = np.where(converged,T,np.where(inside,T_newton,(lower+upper)/2))
+
+    w = m*T + p
+    return T, w
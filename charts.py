@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 13:26:50 2026
+
+@author: Alanis Zeoli
+
+Objective: Render the psychrometric chart of every combination of climate
+files, sets of components and operational parameters without any display,
+in parallel
+
+Inputs:
+    climates, periods, meteo_files, components, params, hum: Same as in sweep.run_sweep
+    folder: Folder in which the figures are written (default = 'Figures')
+    formats: List of file formats among 'png' and 'svg' (default = ['png'])
+    layer: 'points' to plot one marker per hour or 'density' to plot one hexagonal 2D histogram per mode (default = 'points')
+    workers: Number of worker processes (default = number of CPUs, 1 = everything runs in the current process)
+    chunk_size: Number of charts drawn by a worker on the same climate file
+
+Output:
+    files: Dataframe with one row per chart, containing the run description (see sweep.py) and the path of each figure
+
+The figures are drawn on Agg canvases without pyplot, so the backend of the
+current process is left unchanged. The PNG files are blitted on a chart
+rendered once per task (see methodology.save_charts), the other formats are
+saved from the complete figure.
+"""
+
+import os
+
+import pandas as pd
+
+# Import own functions
+import climate_store
+import main as feasibility
+import methodology
+import sweep
+
+# Returns the file name of a chart, without extension
+def chart_name(case,run,variant):
+    if case['climate'] is not None:
+        name = case['climate']+'_'+case['period']
+    else:
+        name = os.path.splitext(os.path.basename(case['meteo_file_path']))[0]
+    return name+'_variant'+str(variant)+'_run'+str(run)
+
+# Draws the charts of a list of configurations on a single climate file
+def render_case(case,runs,folder,formats=('png',),layer='points',hum='yes'):
+    import matplotlib
+
+    import plot_default
+
+    try:
+        climate_data = climate_store.load(case['meteo_file_path'],['T_dry','w'])
+    except OSError:
+        print("Error: File "+case['meteo_file_path']+" cannot be found.")
+        return []
+    T_out = climate_data['T_dry']
+    w_out = climate_data['w']
+
+    results = []
+    descriptions = []
+    for run, variant, components, params in runs:
+        params = feasibility.resolve_params(dict(params))
+        model = methodology.get_boundary_model(components,params,hum)
+        labels, counts = methodology.classify(T_out,w_out,model)
+        results.append((model,T_out,w_out,labels))
+
+        description = dict(case)
+        description['run'] = run
+        description['variant'] = variant
+        description['name'] = chart_name(case,run,variant)
+        descriptions.append(description)
+
+    for file_format in formats:
+        file_paths = [os.path.join(folder,description['name']+'.'+file_format) for description in descriptions]
+
+        if file_format == 'png':
+            methodology.save_charts(results,file_paths,layer)
+        else:
+            with matplotlib.rc_context(plot_default.rc_params()):
+                fig, ax, ax2 = methodology.chart_axes(display='no')
+                for result, file_path in zip(results,file_paths):
+                    artists = methodology.draw_modes(ax,ax2,*result,layer=layer)
+                    fig.savefig(file_path)
+                    for artist in artists:
+                        artist.remove()
+
+        for description, file_path in zip(descriptions,file_paths):
+            description['file_'+file_format] = file_path
+
+    for description in descriptions:
+        del description['name']
+    return descriptions
+
+def render_charts(climates=None,periods=None,meteo_files=None,components=None,params=None,hum='yes',folder='Figures',formats=('png',),layer='points',workers=None,chunk_size=20):
+    for file_format in formats:
+        if file_format not in ['png','svg']:
+            raise ValueError(file_format+" is not a valid format, it should be 'png' or 'svg'")
+    os.makedirs(folder,exist_ok=True)
+
+    # Each task draws a chunk of charts on one climate file
+    tasks = sweep.sweep_tasks(climates,periods,meteo_files,components,params,chunk_size)
+    rows = sweep.run_tasks(render_case,tasks,(folder,formats,layer,hum),workers)
+
+    files = pd.DataFrame(rows)
+    return files
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 18:45:37 2026
+
+@author: Alanis Zeoli
+
+Objective: Command-line batch runner of the feasibility analysis, for scripted
+runs over many climates and configurations
+
+Usage:
+    python cli.py --climates 0A 4A --periods present future --spec spec.json --output results.csv
+    python cli.py --files "Stations/*.csv" --workers 8 --no-chart --output results.json
+
+Arguments:
+    --climates: Climate zones of climate_zones.cities ('all' for all of them)
+    --periods: Periods of climate_zones.TMYs (default = all of them)
+    --files: Paths or glob patterns of meteorological files analysed in addition to the climate zones
+    --spec: JSON file describing the configurations, with the optional keys:
+        components = set of components or list of sets, a set being a dictionnary {name: {"type": type, "epsilon": value}},
+            the type being DEC, IEC, D-IEC or DW and epsilon its default value if not given (see methodology.component_types)
+        params = operational parameters, dictionnary of lists of values or list of dictionnaries (see sweep.py)
+        hum = 'yes' if the humidification of the building is accepted
+    --workers: Number of worker processes (default = number of CPUs)
+    --output: Result file, CSV or JSON depending on its extension (default = results.csv)
+    --no-chart: Does not draw the psychrometric charts
+    --figures: Folder of the charts (default = Figures)
+    --layer: Layer of the hours in the charts, 'points' or 'density' (default = density)
+
+Output:
+    Table of sweep.run_sweep (one row per run and mode) and, if charts are drawn, a table of the chart files next to it (<output>_charts.<ext>)
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+
+# Import own functions
+import climate_zones
+import methodology
+
+# Returns the component described in a spec file, with the default effectiveness of its type if not given
+def spec_component(name,description):
+    type_name = description.get('type')
+    if type_name not in methodology.component_types:
+        raise ValueError(str(type_name)+" is not a valid type for the component "+name+", it should be "+', '.join(methodology.component_types))
+
+    epsilon = description.get('epsilon')
+    if epsilon is None:
+        epsilon = methodology.component_types[type_name]
+    if not isinstance(epsilon,(int,float)) or not 0 < epsilon < 1:
+        raise ValueError("The effectiveness of the component "+name+" should be a number between 0 and 1")
+    return methodology.component(type_name,epsilon)
+
+# Returns the sets of components, the parameters and hum described in a spec file
+def read_spec(spec_file=None):
+    spec = {}
+    if spec_file is not None:
+        with open(spec_file) as file:
+            spec = json.load(file)
+
+    component_sets = spec.get('components')
+    if component_sets is not None:
+        if isinstance(component_sets,dict):
+            component_sets = [component_sets]
+        component_sets = [{name: spec_component(name,component_set[name]) for name in component_set} for component_set in component_sets]
+    return component_sets, spec.get('params'), spec.get('hum','yes')
+
+# Returns the list of files matching paths or glob patterns
+def expand_files(patterns):
+    files = []
+    for pattern in patterns or []:
+        matches = sorted(glob.glob(pattern))
+        if not matches:
+            raise FileNotFoundError("No meteorological file matches "+pattern)
+        files.extend(matches)
+    return files
+
+def write_table(table,file_path):
+    if os.path.splitext(file_path)[1].lower() == '.json':
+        table.to_json(file_path,orient='records',indent=1)
+    else:
+        table.to_csv(file_path,index=False)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Feasibility analysis of passive and evaporative cooling modes')
+    parser.add_argument('--climates',nargs='+',help="climate zones ("+', '.join(climate_zones.cities)+") or 'all'")
+    parser.add_argument('--periods',nargs='+',choices=list(climate_zones.TMYs),help='periods of the climate zones')
+    parser.add_argument('--files',nargs='+',help='meteorological files or glob patterns')
+    parser.add_argument('--spec',help='JSON file with the components, params and hum')
+    parser.add_argument('--workers',type=int,default=None,help='number of worker processes')
+    parser.add_argument('--output',default='results.csv',help='result file (.csv or .json)')
+    parser.add_argument('--no-chart',dest='chart',action='store_false',help='do not draw the charts')
+    parser.add_argument('--figures',default='Figures',help='folder of the charts')
+    parser.add_argument('--layer',default='density',choices=['points','density'],help='layer of the hours in the charts')
+    args = parser.parse_args(argv)
+
+    if args.climates is not None and 'all' in args.climates:
+        args.climates = list(climate_zones.cities.keys())
+    for climate in args.climates or []:
+        if climate not in climate_zones.cities:
+            parser.error(climate+" is not a valid climate zone")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # The analysis modules are imported once the arguments are valid
+    import charts
+    import sweep
+
+    try:
+        components, params, hum = read_spec(args.spec)
+        meteo_files = expand_files(args.files)
+    except ValueError as error:
+        print("Error: "+error.args[0])
+        return 2
+    except OSError as error:
+        if error.filename is not None:
+            print("Error: File "+str(error.filename)+" cannot be read ("+str(error.strerror)+").")
+        else:
+            print("Error: "+str(error))
+        return 2
+    climates = args.climates
+    if climates is None and not meteo_files:
+        climates = list(climate_zones.cities.keys())
+
+    results = sweep.run_sweep(climates=climates,periods=args.periods,meteo_files=meteo_files,components=components,
+                              params=params,hum=hum,workers=args.workers)
+    write_table(results,args.output)
+
+    if args.chart:
+        files = charts.render_charts(climates=climates,periods=args.periods,meteo_files=meteo_files,components=components,
+                                     params=params,hum=hum,folder=args.figures,layer=args.layer,workers=args.workers)
+        name, extension = os.path.splitext(args.output)
+        write_table(files,name+'_charts'+extension)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 21:30:16 2026
+
+@author: Alanis Zeoli
+
+Objective: Compare the present (TMY 2001-2020) and future (TMY 2041-2060)
+feasibility of every climate zone in one run: the parameters are resolved and
+the boundaries are built once, and the hours of all the zones and periods are
+classified together
+
+Inputs:
+    climates: List of climate zones taken from climate_zones.cities (default = all zones)
+    components, params, hum: Same as in main.py (default = main.default_components(), default parameters, 'yes')
+    periods: Periods that are compared, the second one minus the first one (default = ('present', 'future'))
+    verbose: 'yes' to print the change of recommended components of each zone
+
+Outputs:
+    hours: Dataframe with one row per zone and mode, containing:
+        climate, city, mode
+        hours_<period> = number of hours in the mode for each period
+        delta = difference of hours between the two periods
+    recommendation: Dataframe with one row per zone, containing:
+        climate, city
+        mode_<period>, components_<period> = recommended mode and its components for each period
+        changed = True if the recommended mode is different
+"""
+
+import numpy as np
+import pandas as pd
+
+# Import own functions
+import climate_store
+import climate_zones
+import main as feasibility
+import methodology
+import profiling
+
+def paired_analysis(climates=None,components=None,params=None,hum='yes',periods=('present','future'),verbose='yes'):
+    if climates is None:
+        climates = list(climate_zones.cities.keys())
+    if components is None:
+        components = feasibility.default_components()
+    params = feasibility.resolve_params(None if params is None else dict(params))
+
+    # One boundary model for all the zones and periods
+    with profiling.span('boundaries'):
+        model = methodology.get_boundary_model(components,params,hum)
+    mode_list = model.mode_list
+    nb_modes = len(mode_list)
+
+    # Climate data of all the zones and periods, the missing zones are skipped
+    cases, T_out, w_out = [], [], []
+    for climate in climates:
+        climate_data = {}
+        for period in periods:
+            meteo_file_path = climate_zones.meteo_file_path(climate,period)
+            try:
+                climate_data[period] = climate_store.load(meteo_file_path,['T_dry','w'])
+            except OSError:
+                print("Error: File "+meteo_file_path+" cannot be found.")
+                break
+        if len(climate_data) < len(periods):
+            continue
+
+        for period in periods:
+            cases.append((climate,period))
+            T_out.append(np.asarray(climate_data[period]['T_dry'],dtype=float))
+            w_out.append(np.asarray(climate_data[period]['w'],dtype=float))
+
+    # Classification of all the hours at once, counted per case
+    nb_data = np.array([len(T) for T in T_out],dtype=np.int64)
+    case_index = np.repeat(np.arange(len(cases)),nb_data)
+    with profiling.span('classification',int(nb_data.sum())):
+        labels = methodology.classify(np.concatenate(T_out) if cases else np.empty(0),
+                                      np.concatenate(w_out) if cases else np.empty(0),model)[0]
+    counts = np.bincount(case_index*(nb_modes+1)+labels,minlength=len(cases)*(nb_modes+1)).reshape(len(cases),nb_modes+1)[:,:nb_modes]
+
+    hour_rows, recommendation_rows = [], []
+    for k in range(0,len(cases),len(periods)):
+        climate = cases[k][0]
+        description = {'climate': climate, 'city': climate_zones.cities[climate]}
+
+        for i, mode in enumerate(mode_list):
+            row = dict(description)
+            row['mode'] = mode
+            for n, period in enumerate(periods):
+                row['hours_'+period] = int(counts[k+n,i])
+            row['delta'] = int(counts[k+len(periods)-1,i]-counts[k,i])
+            hour_rows.append(row)
+
+        row = dict(description)
+        for n, period in enumerate(periods):
+            nb_hours_modes = {mode: int(counts[k+n,i]) for i, mode in enumerate(mode_list)}
+            mode_rec = feasibility.recommended_mode(nb_hours_modes,model.component_dict,nb_data[k+n])
+            row['mode_'+period] = mode_rec
+            row['components_'+period] = ', '.join(model.component_dict[mode_rec])
+        row['changed'] = row['mode_'+periods[0]] != row['mode_'+periods[-1]]
+        recommendation_rows.append(row)
+
+        if verbose == 'yes':
+            if row['changed']:
+                print(climate+" ("+description['city']+"): "+row['mode_'+periods[0]]+" -> "+row['mode_'+periods[-1]])
+            else:
+                print(climate+" ("+description['city']+"): "+row['mode_'+periods[0]]+" (unchanged)")
+
+    hours = pd.DataFrame(hour_rows)
+    recommendation = pd.DataFrame(recommendation_rows)
+    return hours, recommendation
+
+
+if __name__ == '__main__':
+    hours, recommendation = paired_analysis()
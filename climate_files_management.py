@@ -5,53 +5,111 @@ Created on Thu Mar  6 09:51:06 2025
 @author: Alanis Zeoli
 
 Objective: Modify the meteorological files to include the spec. humidity
+
+Each file of the folder is read (separator ',' or ';'), its relative humidity
+is converted to [-] if it is given in [%], and the spec. humidity w is computed
+from RH, T_wb or T_dp and inserted after T_wb (or T_dry). Files whose column w
+is already consistent with their humidity data are left untouched, so the
+preprocessing can be run any number of times. The new file is written next to
+the original one and renamed over it, so an interruption never leaves a
+partial file.
+
+Usage:
+    python climate_files_management.py [folder] [--pattern "*.csv"] [--workers N]
 """
 
-import pandas as pd
+import argparse
+import glob
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
-from CoolProp.CoolProp import HAPropsSI
-
-# From the location determine the file to be read
-cities = {
-    '0A': 'Singapore',
-    '0B': 'Abu Dhabi',
-    '1A': 'Guayaquil',
-    '2A': 'Sao Paulo',
-    '3A': 'Buenos Aires',
-    '3B': 'Los Angeles',
-    '4A': 'Brussels',
-    '4C': 'Vancouver',
-    '5A': 'Copenhagen',
-    '6A': 'Montreal'    
-    }
-
-TMYs = {
-    'present': '2001-2020',
-    'future': '2041-2060'
-    }
-
-# For each file, recreate file name
-for zone in cities:
-    city = cities[zone]
-    city_str = city.replace(' ','_')
-    
-    for period in TMYs:
-        TMY = TMYs[period]
-        
-        filename = zone + '_' + city_str + '_TMY_' + TMY
-        filepath = 'Meteo/' + filename + '.csv'
-    
-        climate_data = pd.read_csv(filepath,sep=';')
+import pandas as pd
+
+import psychrometrics
+
+# Reads a meteorological file with ',' or ';' as separator
+def read_file(file_path):
+    climate_data = pd.read_csv(file_path)
+    if len(climate_data.columns) == 1:
+        climate_data = pd.read_csv(file_path,sep=';')
+    return climate_data
+
+# Adds or updates the column w of a meteorological file, returns what has been done
+def preprocess_file(file_path):
+    P_atm = 101325
+
+    try:
+        climate_data = read_file(file_path)
+    except (OSError,ValueError) as error:
+        return 'error: '+str(error)
+
+    if 'T_dry' not in climate_data.columns:
+        return 'error: there is no column T_dry'
+
+    modified = False
+    if 'RH' in climate_data.columns and climate_data['RH'].max() > 1.5: # Relative humidity in %
         climate_data['RH'] = climate_data['RH']/100
-        nb_data = len(climate_data['T_dry'])
-    
-        # Compute specific humidity
-        P_atm = 101325
-        w_out = np.zeros((nb_data,1))
-    
-        for h in range(nb_data):
-            w_out[h] = HAPropsSI('W','T',climate_data['T_dry'][h]+273.15,'RH',climate_data['RH'][h],'P',P_atm)
-            
-        climate_data.insert(6,'w',w_out)
-        
-        climate_data.to_csv(filepath, index=False)
\ No newline at end of file
+        modified = True
+
+    humidity = None
+    for var in ['RH','T_wb','T_dp']:
+        if var in climate_data.columns:
+            humidity = var
+            break
+
+    if humidity is None:
+        if 'w' in climate_data.columns:
+            return 'up to date'
+        return 'error: there is no column RH, T_wb or T_dp'
+
+    w_out = psychrometrics.humidity_ratio(climate_data['T_dry'].to_numpy(),humidity,climate_data[humidity].to_numpy(),P_atm)
+
+    if 'w' in climate_data.columns:
+        if not modified and np.allclose(climate_data['w'].to_numpy(),w_out,rtol=0,atol=1e-5,equal_nan=True):
+            return 'up to date'
+        climate_data['w'] = w_out
+    else:
+        previous = 'T_wb' if 'T_wb' in climate_data.columns else 'T_dry'
+        climate_data.insert(climate_data.columns.get_loc(previous)+1,'w',w_out)
+
+    # Atomic replacement of the file
+    folder = os.path.dirname(os.path.abspath(file_path))
+    descriptor, tmp_path = tempfile.mkstemp(dir=folder,suffix='.tmp')
+    try:
+        with os.fdopen(descriptor,'w',newline='') as file:
+            climate_data.to_csv(file,index=False)
+        shutil.copymode(file_path,tmp_path)
+        os.replace(tmp_path,file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return 'updated'
+
+# Preprocesses all the meteorological files of a folder in parallel, returns what has been done for each file
+def preprocess(folder='Meteo',pattern='*.csv',workers=None):
+    file_paths = sorted(glob.glob(os.path.join(folder,pattern)))
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers == 1 or len(file_paths) <= 1:
+        status = [preprocess_file(file_path) for file_path in file_paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            status = list(executor.map(preprocess_file,file_paths))
+    return dict(zip(file_paths,status))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Add the spec. humidity w to meteorological files')
+    parser.add_argument('folder',nargs='?',default='Meteo',help='folder of the meteorological files')
+    parser.add_argument('--pattern',default='*.csv',help='glob pattern of the files in the folder')
+    parser.add_argument('--workers',type=int,default=None,help='number of worker processes')
+    args = parser.parse_args()
+
+    status = preprocess(args.folder,args.pattern,args.workers)
+    for file_path in status:
+        print(file_path+": "+status[file_path])
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 11:48:15 2026
+
+@author: Alanis Zeoli
+
+Objective: Binary columnar copy of the meteorological files, so that the CSV
+files are parsed only once and the columns can be memory-mapped by any number
+of processes
+
+Each meteorological file is converted into a folder of the cache containing one
+.npy file per numerical column (w is computed if it is not in the file) and a
+description of the source file. The copy is rebuilt when the size or the
+modification time of the source file changes and its content is different.
+
+The copies are kept in a folder cache next to each meteorological file, or in
+cache_folder if it is set. If a copy cannot be written (read-only folder, full
+disk...), the columns are read from the file without it.
+
+A rebuilt copy is written in a new subfolder and the description, which gives
+the subfolder of the current columns, is replaced at once: the processes that
+are reading the previous columns are not affected, and the previous subfolders
+are only removed once they are older than stale_age.
+
+Inputs:
+    meteo_file_path: Path of the meteorological file (see main.py for the columns)
+    columns: List of the columns to load (default = all the numerical columns)
+    mmap_mode: Memory-map mode used by np.load (default = 'r', None to load the columns in memory)
+
+Output:
+    climate_data: Dictionnary of arrays, one per column
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+# Import own functions
+import psychrometrics
+
+cache_folder = None # Folder of the copies (None = folder cache next to each meteorological file)
+info_file = 'source.json'
+stale_age = 3600 # Age after which the previous columns of a rebuilt copy are removed [s]
+
+# Returns the SHA-256 digest of a file
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path,'rb') as file:
+        for block in iter(lambda: file.read(1 << 20),b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+# Returns the folder of the cache containing the columns of a meteorological file
+def store_path(meteo_file_path):
+    source = os.path.abspath(meteo_file_path)
+    name = os.path.splitext(os.path.basename(source))[0]
+    key = hashlib.sha256(source.encode()).hexdigest()[:12] # Files with the same name in different folders are kept apart
+    folder = cache_folder
+    if folder is None:
+        folder = os.path.join(os.path.dirname(source),'cache')
+    return os.path.join(folder,name+'_'+key)
+
+# Error raised when the copy of a meteorological file cannot be written, with the columns read from the file
+class copy_error(OSError):
+    def __init__(self,message,climate_data,info):
+        super().__init__(message)
+        self.climate_data = climate_data
+        self.info = info
+
+# Returns the description of the source file stored with its columns (None if there is none)
+def read_info(path):
+    try:
+        with open(os.path.join(path,info_file)) as file:
+            return json.load(file)
+    except (OSError,ValueError):
+        return None
+
+# Replaces the description of the source file at once
+def write_info(path,info):
+    file, tmp_path = tempfile.mkstemp(dir=path,suffix='.json')
+    try:
+        with os.fdopen(file,'w') as file:
+            json.dump(info,file,indent=1)
+        os.replace(tmp_path,os.path.join(path,info_file))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+# Returns the folder of the current columns of a copy (the columns of the older copies are next to the description)
+def columns_path(path,info):
+    return os.path.join(path,info.get('folder',''))
+
+# Removes the columns of the previous copies that are older than stale_age
+def remove_stale(path,info):
+    now = time.time()
+    for name in os.listdir(path):
+        entry = os.path.join(path,name)
+        if name in [info_file,info['folder']]:
+            continue
+        try:
+            if now-os.stat(entry).st_mtime < stale_age:
+                continue
+            if os.path.isdir(entry):
+                shutil.rmtree(entry,ignore_errors=True)
+            else:
+                os.remove(entry)
+        except OSError:
+            pass
+
+# Reads a meteorological file, returns its numerical columns (w is computed if needed) and their description
+def read_source(meteo_file_path):
+    stat = os.stat(meteo_file_path)
+
+    climate_data = pd.read_csv(meteo_file_path)
+    if 'w' not in climate_data.columns:
+        for var in ['RH','T_wb','T_dp']:
+            if var in climate_data.columns:
+                w = psychrometrics.humidity_ratio(climate_data['T_dry'].to_numpy(),var,climate_data[var].to_numpy())
+                climate_data.insert(climate_data.columns.get_loc('T_dry')+1,'w',w)
+                break
+
+    columns = [col for col in climate_data.columns if pd.api.types.is_numeric_dtype(climate_data[col])]
+    info = {'source': os.path.abspath(meteo_file_path),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': file_hash(meteo_file_path),
+            'nb_data': len(climate_data),
+            'columns': columns}
+    return {col: np.ascontiguousarray(climate_data[col].to_numpy()) for col in columns}, info
+
+# Converts a meteorological file into one .npy file per numerical column
+# Raises copy_error if the reading succeeds but the copy cannot be written
+def build(meteo_file_path,path=None):
+    if path is None:
+        path = store_path(meteo_file_path)
+    climate_data, info = read_source(meteo_file_path)
+
+    # The columns are written in a new subfolder, which becomes the current one when the description is replaced
+    folder = None
+    try:
+        os.makedirs(path,exist_ok=True)
+        folder = tempfile.mkdtemp(dir=path,prefix='columns_')
+        info['folder'] = os.path.basename(folder)
+        for col in info['columns']:
+            np.save(os.path.join(folder,col+'.npy'),climate_data[col])
+        write_info(path,info)
+    except BaseException as error:
+        if folder is not None:
+            shutil.rmtree(folder,ignore_errors=True)
+        if isinstance(error,OSError):
+            info.pop('folder',None)
+            raise copy_error("The copy of "+meteo_file_path+" cannot be written in "+path+" ("+str(error)+")",climate_data,info) from error
+        raise
+
+    remove_stale(path,info)
+    return info
+
+# Returns the description of the up-to-date copy of a meteorological file, built only if needed
+def update(meteo_file_path):
+    path = store_path(meteo_file_path)
+    info = read_info(path)
+    stat = os.stat(meteo_file_path)
+
+    if info is not None and info['size'] == stat.st_size:
+        if info['mtime_ns'] == stat.st_mtime_ns:
+            return path, info
+        if info['sha256'] == file_hash(meteo_file_path): # Touched but not modified, the new time is recorded
+            info['mtime_ns'] = stat.st_mtime_ns
+            try:
+                write_info(path,info)
+            except OSError: # The copy can still be used, the content being checked again next time
+                pass
+            return path, info
+    return path, build(meteo_file_path,path)
+
+# The errors of reading the file are raised (OSError), the columns are read without the copy if it cannot be written
+def load(meteo_file_path,columns=None,mmap_mode='r'):
+    try:
+        path, info = update(meteo_file_path)
+        in_memory = None
+    except copy_error as error:
+        print("Warning: "+error.args[0]+", the file is read without it.")
+        info, in_memory = error.info, error.climate_data
+
+    if columns is None:
+        columns = info['columns']
+    for col in columns:
+        if col not in info['columns']:
+            raise KeyError("There is no column "+col+" in "+meteo_file_path)
+
+    if in_memory is not None:
+        return {col: in_memory[col] for col in columns}
+    folder = columns_path(path,info)
+    climate_data = {col: np.load(os.path.join(folder,col+'.npy'),mmap_mode=mmap_mode) for col in columns}
+    return climate_data
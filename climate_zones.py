@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 10:05:21 2026
+
+@author: Alanis Zeoli
+
+Objective: Catalog of the climate zones and periods available in the Meteo folder
+
+    cities: climate zone (ASHRAE 169) and its reference city
+    TMYs: period and the corresponding years of the typical meteorological year
+"""
+
+cities = {
+    '0A': 'Singapore',
+    '0B': 'Abu Dhabi',
+    '1A': 'Guayaquil',
+    '2A': 'Sao Paulo',
+    '3A': 'Buenos Aires',
+    '3B': 'Los Angeles',
+    '4A': 'Brussels',
+    '4C': 'Vancouver',
+    '5A': 'Copenhagen',
+    '6A': 'Montreal'
+    }
+
+TMYs = {
+    'present': '2001-2020',
+    'future': '2041-2060'
+    }
+
+meteo_folder = 'Meteo/'
+
+# Returns the path of the meteorological file of a climate zone and a period (KeyError if unknown)
+def meteo_file_path(climate,period='present'):
+    city = cities[climate]
+    city_str = city.replace(' ','_')
+    TMY = TMYs[period]
+
+    filename = climate + '_' + city_str + '_TMY_' + TMY
+    return meteo_folder + filename + '.csv'
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 18:12:09 2026
+
+@author: Alanis Zeoli
+
+Objective: Find the value of one design variable (component effectiveness or
+operational parameter) at which the system starts to guarantee the indoor
+thermal comfort, i.e. the passive modes cover more than min_comfort of the hours
+(same criterion as main.recommended_mode)
+
+Inputs:
+    climate_data: Dataframe or dictionnary with the columns T_dry and w
+    key: Design variable, either epsilon_<name> for the component <name> or an operational parameter (e.g. T_su_max)
+    bounds: Interval [low, high] in which the value is searched (default = the physically valid part of [0.05, 0.99] for an effectiveness)
+    components, params, hum: Same as in main.py, the value of key being replaced during the search
+    min_comfort: Minimum fraction of the hours in a passive mode (default = 0.98)
+    tol: Width of the final interval (default = 1e-3)
+    nb_candidates: Number of values evaluated at once at each iteration (default = 16)
+
+Output:
+    value: Limit value of the design variable on the feasible side (low if the comfort is reached
+        in the whole interval), None if the comfort is reached nowhere in the interval
+    side: 'above' if the comfort is reached from value up to high, 'below' if it is reached from low up to value
+
+Method:
+    The feasibility is assumed to change only once in the interval. At each
+    iteration, the limits of nb_candidates values inside the bracket are built
+    at once (methodology.boundary_coefficients) and classified together
+    (grid.classify_grid), then the bracket shrinks to the interval between the
+    last value on one side and the first value on the other side. The values
+    leading to non-physical states (e.g. a very low effectiveness of the DEC)
+    are considered as not feasible.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Import own functions
+import climate_store
+import climate_zones
+import grid
+import main as feasibility
+import methodology
+
+# Returns for each value of the design variable if the comfort criterion is reached (False for the non-physical values)
+def feasible(T_out,w_out,key,values,components,params,hum='yes',min_comfort=0.98):
+    point_components, point_params = grid.grid_arrays([key],[values],components,params)
+    vertical, m, p, w_in, valid = methodology.boundary_coefficients(point_components,point_params,hum)[1:]
+
+    reached = np.zeros(len(valid),dtype=bool)
+    if valid.any():
+        counts = grid.classify_grid(T_out,w_out,vertical,m[valid],p[valid],w_in[valid],hum)
+        comfort_hours = counts[:,:-1].sum(axis=1) # All the modes but active cooling
+        reached[valid] = comfort_hours > min_comfort*len(T_out)
+    return reached
+
+# Returns the part of the interval [low, high] in which the limits can be built, checked on nb_values values
+def valid_bounds(key,low,high,components,params,hum='yes',nb_values=100):
+    values = np.linspace(low,high,nb_values)
+    point_components, point_params = grid.grid_arrays([key],[values],components,params)
+    valid = methodology.boundary_coefficients(point_components,point_params,hum)[-1]
+    if not valid.any():
+        return None
+    return [float(values[valid].min()),float(values[valid].max())]
+
+def solve_threshold(climate_data,key,bounds=None,components=None,params=None,hum='yes',min_comfort=0.98,tol=1e-3,nb_candidates=16):
+    if components is None:
+        components = feasibility.default_components()
+    if params is None:
+        params = {}
+    if bounds is None:
+        if not key.startswith('epsilon_'):
+            raise ValueError("The bounds of "+key+" should be given")
+        bounds = valid_bounds(key,0.05,0.99,components,params,hum)
+        if bounds is None:
+            return None, None
+
+    T_out = np.asarray(climate_data['T_dry'],dtype=float)
+    w_out = np.asarray(climate_data['w'],dtype=float)
+    low, high = float(bounds[0]), float(bounds[1])
+
+    ends = feasible(T_out,w_out,key,[low,high],components,params,hum,min_comfort)
+    if ends[0] and ends[1]: # Feasible in the whole interval
+        return low, 'above'
+    if not ends[0] and not ends[1]:
+        return None, None
+    increasing = bool(ends[1]) # Comfort reached at the high end of the interval
+
+    while high-low > tol:
+        candidates = np.linspace(low,high,nb_candidates+2)[1:-1]
+        reached = feasible(T_out,w_out,key,candidates,components,params,hum,min_comfort)
+
+        # The new bracket ends at the first value on the other side of the limit
+        values = np.concatenate(([low],candidates,[high]))
+        side = np.concatenate(([not increasing],reached,[increasing]))
+        change = int(np.argmax(side != side[0]))
+        low, high = values[change-1], values[change]
+
+    if increasing:
+        return float(high), 'above'
+    return float(low), 'below'
+
+# Returns the limit value of a design variable for each climate zone and period (see sweep.climate_cases)
+def solve_climates(key,bounds=None,climates=None,periods=None,components=None,params=None,hum='yes',min_comfort=0.98,tol=1e-3):
+    if climates is None:
+        climates = list(climate_zones.cities.keys())
+    if periods is None:
+        periods = list(climate_zones.TMYs.keys())
+
+    rows = []
+    for climate in climates:
+        for period in periods:
+            climate_data = climate_store.load(climate_zones.meteo_file_path(climate,period),['T_dry','w'])
+            value, side = solve_threshold(climate_data,key,bounds,components,params,hum,min_comfort,tol)
+            rows.append({'climate': climate, 'period': period, key: value, 'side': side})
+    return pd.DataFrame(rows)
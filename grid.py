@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 11:02:37 2026
+
+@author: Alanis Zeoli
+
+Objective: Evaluate the number of hours in each operation mode on a grid of
+operational parameters and component effectiveness values, for one climate,
+by classifying all the hours against all the grid points at once
+
+Inputs:
+    climate_data: Dataframe with the columns T_dry and w (see main.load_climate_data)
+    grid: Dictionnary of lists of values, all combined together. The keys can be:
+        <param> = operational parameter (T_su_min, T_su_max, T_reg, T_in, RH_in, w_in, T_wb_in)
+        epsilon_<name> = effectiveness of the component <name> of the set of components
+    components: Dictionnary of components (default = main.default_components())
+    params: Operational parameters that are common to all the grid points (default = {})
+    hum: 'yes' if the humidification of the building is accepted (default = 'yes')
+
+Output:
+    hours: Array of shape (len(grid[key_1]), ..., len(grid[key_n]), len(mode_list)) with the number of hours in each mode
+        (nan for the grid points leading to non-physical states, e.g. a very low effectiveness)
+    axes: Dictionnary of the values of each dimension of the grid, in the order of the dimensions
+    mode_list: Operation modes corresponding to the last dimension of hours
+
+The limits of all the grid points are built at once (methodology.boundary_coefficients),
+then all the hours are classified against all the grid points (classify_grid).
+"""
+
+import numpy as np
+
+# Import own functions
+import main as feasibility
+import methodology
+
+indoor_params = ['T_in','RH_in','w_in','T_wb_in']
+
+# Returns the components and parameters of many configurations at once, the values of each key being arrays of the same length
+def grid_arrays(keys,values,components,params):
+    components = dict(components)
+    params = dict(params)
+
+    for key, value in zip(keys,values):
+        if key.startswith('epsilon_'):
+            name = key[len('epsilon_'):]
+            if name not in components:
+                raise KeyError(name+" is not a component of the set of components")
+            components[name] = methodology.component_array(components[name].type,value)
+        else:
+            params[key] = np.asarray(value,dtype=float)
+
+    # The indoor conditions are resolved once for each distinct combination of the varying ones
+    varying = [key for key in indoor_params if np.ndim(params.get(key)) > 0]
+    if not varying:
+        return components, feasibility.resolve_params(params)
+
+    combinations, index = np.unique(np.stack([params[key] for key in varying],axis=1),axis=0,return_inverse=True)
+    fixed = {key: params[key] for key in params if key not in varying}
+    resolved = [feasibility.resolve_params(dict(fixed,**dict(zip(varying,combination)))) for combination in combinations]
+
+    resolved_params = dict(resolved[0])
+    for key in varying:
+        resolved_params[key] = params[key]
+    for key in ['w_in','T_wb_in']:
+        resolved_params[key] = np.array([values[key] for values in resolved])[index.ravel()]
+    return components, resolved_params
+
+# Returns the number of hours in each mode for every row of boundary coefficients
+def classify_grid(T_out,w_out,vertical,m,p,w_in,hum='yes',block_size=2**22):
+    T_out = np.asarray(T_out,dtype=float)
+    w_out = np.asarray(w_out,dtype=float)
+    nb_data = len(T_out)
+    nb_points, nb_modes = m.shape
+
+    lines = np.where(~vertical)[0]
+    vertical = np.where(vertical)[0]
+
+    counts = np.zeros((nb_points,nb_modes+1),dtype=np.int64)
+
+    # The grid points and the hours are processed by blocks to bound the memory used by the matrix of conditions
+    hours_step = max(1,min(nb_data,block_size//(nb_modes+1)))
+    points_step = max(1,block_size//((nb_modes+1)*hours_step))
+    for start_point in range(0,nb_points,points_step):
+        points = slice(start_point,start_point+points_step)
+        m_lines = m[points][:,lines,None]
+        p_lines = p[points][:,lines,None]
+        T_vertical = p[points][:,vertical,None]
+        nb_block = len(m_lines)
+
+        for start in range(0,nb_data,hours_step):
+            T = T_out[start:start+hours_step]
+            w = w_out[start:start+hours_step]
+
+            # One row per mode plus a last row for the hours that are in no mode
+            below = np.ones((nb_block,nb_modes+1,len(T)),dtype=bool)
+            below[:,lines] = w<m_lines*T+p_lines
+            below[:,vertical] = T<T_vertical
+
+            labels = np.argmax(below,axis=1)
+            if hum != 'yes':
+                labels[w>=w_in[points][:,None]] = nb_modes # Only active cooling is considered if humidification is not accepted
+
+            # Labels are shifted by grid point so that a single bincount gives the counts of the whole block
+            offset = np.arange(nb_block)[:,None]*(nb_modes+1)
+            counts[points] += np.bincount((labels+offset).ravel(),minlength=nb_block*(nb_modes+1)).reshape(nb_block,nb_modes+1)
+
+    return counts[:,:nb_modes]
+
+def evaluate_grid(climate_data,grid,components=None,params=None,hum='yes'):
+    if components is None:
+        components = feasibility.default_components()
+    if params is None:
+        params = {}
+
+    keys = list(grid.keys())
+    axes = {key: list(grid[key]) if isinstance(grid[key],(list,tuple,np.ndarray)) else [grid[key]] for key in keys}
+    shape = tuple(len(axes[key]) for key in keys)
+
+    # Boundaries of all the grid points at once
+    values = [value.ravel() for value in np.meshgrid(*[np.asarray(axes[key],dtype=float) for key in keys],indexing='ij')]
+    grid_components, grid_params = grid_arrays(keys,values,components,params)
+    mode_list, vertical, m, p, w_in, valid = methodology.boundary_coefficients(grid_components,grid_params,hum)
+
+    T_out = np.asarray(climate_data['T_dry'],dtype=float)
+    w_out = np.asarray(climate_data['w'],dtype=float)
+    counts = classify_grid(T_out,w_out,vertical,m,p,w_in,hum).astype(float)
+    counts[~valid] = np.nan # Grid points whose boundaries cannot be built (non-physical states)
+
+    hours = counts.reshape(shape+(len(mode_list),))
+    return hours, axes, mode_list
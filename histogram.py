@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 20:37:14 2026
+
+@author: Alanis Zeoli
+
+Objective: Classify very large datasets (multi-decade, multi-station) through a
+fine 2D histogram of their (T, w) points, so that the cost of each
+classification depends on the number of occupied bins instead of the number of hours
+
+Inputs:
+    T_out, w_out: Dry temperature [°C] and spec. humidity [kg/kg] of each hour
+    dT, dw: Size of the bins (default = 0.05 °C and 5e-5 kg/kg)
+    model: Boundary model (methodology.boundary_model)
+    max_error: Maximum number of hours that can be counted in a wrong mode (default = 0, exact counts)
+
+Outputs:
+    bins: Dictionnary with the lower corner (T, w) and the number of hours of each occupied bin,
+        and the bin of each hour (used to classify exactly the hours of the bins crossed by a limit)
+    nb_hours: Number of hours in each mode
+    error: Maximum number of hours counted in a wrong mode
+
+Method:
+    Each mode region is an intersection of half-planes, hence convex: if the 4
+    corners of a bin are in the same mode, the whole bin is. The other bins
+    are crossed by a limit. Their hours are classified one by one, unless they
+    are fewer than max_error, in which case the bin centres are classified and
+    these hours form the error bound.
+
+Usage:
+    bins = histogram.bin_climate(climate_data['T_dry'],climate_data['w'])
+    nb_hours, error = histogram.classify_bins(bins,model,climate_data['T_dry'],climate_data['w'])
+"""
+
+import numpy as np
+
+# Import own functions
+import methodology
+
+# Returns the occupied bins of a dataset and the bin of each hour
+def bin_climate(T_out,w_out,dT=0.05,dw=5e-5):
+    T_out = np.asarray(T_out,dtype=float)
+    w_out = np.asarray(w_out,dtype=float)
+
+    i = np.floor(T_out/dT).astype(np.int64)
+    j = np.floor(w_out/dw).astype(np.int64)
+    i_min, j_min = (i.min(), j.min()) if len(i) > 0 else (0, 0)
+    nb_j = (j.max()-j_min+1) if len(j) > 0 else 1
+
+    keys, index, counts = np.unique((i-i_min)*nb_j+(j-j_min),return_inverse=True,return_counts=True)
+    bins = {'T': (keys//nb_j+i_min)*dT,
+            'w': (keys%nb_j+j_min)*dw,
+            'counts': counts,
+            'index': index.ravel(),
+            'dT': dT,
+            'dw': dw}
+    return bins
+
+# Returns the number of hours in each mode from the occupied bins
+def classify_bins(bins,model,T_out=None,w_out=None,max_error=0):
+    nb_modes = len(model.mode_list)
+    T, w, dT, dw = bins['T'], bins['w'], bins['dT'], bins['dw']
+
+    # Mode of the 4 corners of each bin
+    corners = [methodology.classify(T+a*dT,w+b*dw,model)[0] for a in (0,1) for b in (0,1)]
+    uniform = (corners[0] == corners[1]) & (corners[0] == corners[2]) & (corners[0] == corners[3])
+
+    counts = np.bincount(corners[0][uniform],weights=bins['counts'][uniform],minlength=nb_modes+1)
+
+    crossed = ~uniform
+    nb_crossed = int(bins['counts'][crossed].sum())
+    error = 0
+    if nb_crossed > max_error:
+        if T_out is None or w_out is None:
+            raise ValueError("The hours are needed to classify exactly the bins crossed by a limit")
+        hours = np.where(crossed[bins['index']])[0]
+        counts = counts + np.bincount(methodology.classify(np.asarray(T_out)[hours],np.asarray(w_out)[hours],model)[0],minlength=nb_modes+1)
+    else:
+        centres = methodology.classify(T[crossed]+dT/2,w[crossed]+dw/2,model)[0]
+        counts = counts + np.bincount(centres,weights=bins['counts'][crossed],minlength=nb_modes+1)
+        error = nb_crossed
+
+    nb_hours = {mode: int(round(counts[i])) for i, mode in enumerate(model.mode_list)}
+    return nb_hours, error
+
+# Same as classify_bins, for a dataset that is classified once
+def classify_histogram(T_out,w_out,model,dT=0.05,dw=5e-5,max_error=0):
+    bins = bin_climate(T_out,w_out,dT,dw)
+    return classify_bins(bins,model,T_out,w_out,max_error)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 15:40:19 2026
+
+@author: Alanis Zeoli
+
+Objective: Re-evaluate the feasibility analysis of one climate after each
+modification of the configuration, computing again only what the modification
+can affect
+
+The limits of the operation modes form a chain (see methodology.mode_dependencies):
+only the limits built from a modified input are computed again, and only the
+hours in a mode at or after the first modified limit are classified again.
+
+Inputs:
+    climate_data: Dataframe with the columns T_dry and w (see main.load_climate_data)
+    components, params, hum: Same as in main.py (default = main.default_components() and the default parameters)
+
+Methods:
+    update: modifies some parameters (params = dictionnary of new values) and/or
+        the effectiveness of some components (epsilon = dictionnary of new values
+        by component name) and returns the number of hours in each mode.
+        The indoor humidity is kept when T_in is modified and given by the
+        last modified value among RH_in, w_in and T_wb_in.
+
+Attributes:
+    model = boundary model of the current configuration
+    labels = mode of each hour (index in model.mode_list)
+    nb_hours = dictionnary containing the number of hours in each mode
+"""
+
+import numpy as np
+
+# Import own functions
+import main as feasibility
+import methodology
+
+humidity_params = ['RH_in','w_in','T_wb_in']
+
+class design_session():
+    def __init__(self,climate_data,components=None,params=None,hum='yes'):
+        if components is None:
+            components = feasibility.default_components()
+        
+        self.T_out = np.asarray(climate_data['T_dry'],dtype=float)
+        self.w_out = np.asarray(climate_data['w'],dtype=float)
+        self.hum = hum
+        
+        # Copies, so that the configuration is only modified through update
+        self.components = {name: methodology.component(components[name].type,components[name].epsilon) for name in components}
+        self.params = {} if params is None else dict(params)
+        
+        self.model = methodology.get_boundary_model(self.components,feasibility.resolve_params(dict(self.params)),hum)
+        self.labels, counts = methodology.classify(self.T_out,self.w_out,self.model)
+        self.nb_hours = self.hours(counts)
+        
+    def hours(self,counts):
+        return {mode: int(counts[i]) for i, mode in enumerate(self.model.mode_list)}
+        
+    def update(self,params=None,epsilon=None):
+        if params is not None:
+            self.params.update(params)
+            
+            # The indoor humidity is given by the last of RH_in, w_in and T_wb_in that is modified, the others are computed again
+            given = [key for key in humidity_params if key in params]
+            if given:
+                for key in humidity_params:
+                    if key not in given:
+                        self.params.pop(key,None)
+        
+        if epsilon is not None:
+            for name in epsilon:
+                if name not in self.components:
+                    raise KeyError(name+" is not a component of the set of components")
+                self.components[name] = methodology.component(self.components[name].type,epsilon[name])
+        
+        previous = self.model
+        self.model = methodology.get_boundary_model(self.components,feasibility.resolve_params(dict(self.params)),self.hum,previous)
+        self.labels, counts = methodology.reclassify(self.T_out,self.w_out,self.labels,previous,self.model)
+        self.nb_hours = self.hours(counts)
+        return self.nb_hours
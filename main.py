@@ -31,6 +31,8 @@ Inputs:
         'future' = TMY 2041-2060
         
     climate_data: The meteorological data can be given directly as inputs in the form of a dataframe including the same columns as in the meteorological file.
+    
+    columns: List of the columns needed from the meteorological file. If given, they are read from the binary copy of the file (see climate_store.py) instead of parsing the whole file.
         
     components: Dictionnary containing the system components (based on methodology.component class) with their nominal effectiveness.
     
@@ -42,60 +44,56 @@ Inputs:
         RH_in = indoor relative humidity [-] (default = 0.5)
         w_in = indoor specific humidity [kg/kg] (default = computed with T_in and RH_in)
         T_wb_in = indoor wet bulb temperature [°C] (default = computed with T_in and RH_in)
+
+The time spent in each step and the number of CoolProp calls can be recorded with profiling.profiled (see profiling.py).
+
+For batch runs over many climates and configurations, use the command line runner (python cli.py --help).
+
+To compare the present and future periods of every climate zone in one run, use climate_change.paired_analysis.
 """
 
 import pandas as pd
-import numpy as np
-from CoolProp.CoolProp import HAPropsSI
 
 # Import own functions
+import climate_store
+import climate_zones
 import methodology
+import profiling
+import psychrometrics
+from properties import HAPropsSI # Memoized CoolProp calls
 
-def feasibility_analysis(meteo_file_path=None,climate=None,period='present',climate_data=None,components=None,params=None):
+# Returns the climate data from a file, a climate zone and period or a dataframe, with the spec. humidity column w
+def load_climate_data(meteo_file_path=None,climate=None,period='present',climate_data=None,columns=None):
     # Definition of constants
     P_atm = 101325
-    to_K = 273.15
-    to_C = -273.15
     
     # Climate data
     if meteo_file_path is None:   
         if climate is not None:
-            cities = {
-                '0A': 'Singapore',
-                '0B': 'Abu Dhabi',
-                '1A': 'Guayaquil',
-                '2A': 'Sao Paulo',
-                '3A': 'Buenos Aires',
-                '3B': 'Los Angeles',
-                '4A': 'Brussels',
-                '4C': 'Vancouver',
-                '5A': 'Copenhagen',
-                '6A': 'Montreal'    
-                }
-    
-            TMYs = {
-                'present': '2001-2020',
-                'future': '2041-2060'
-                }
-    
             # Recreate file name based on information
-            try:
-                city = cities[climate]
-            except:
+            if climate not in climate_zones.cities:
                 print("Error: "+climate+" is not a valid climate zone yet.")
                 return
-                
-            city_str = city.replace(' ','_')
              
-            try:
-                TMY = TMYs[period]
-            except:
+            if period not in climate_zones.TMYs:
                 print("Error: "+period+" is not a valid time period.")
                 return
                 
-            filename = climate + '_' + city_str + '_TMY_' + TMY
-            meteo_file_path = 'Meteo/' + filename + '.csv'
+            meteo_file_path = climate_zones.meteo_file_path(climate,period)
             
+    if meteo_file_path is not None and columns is not None:
+        try:
+            return pd.DataFrame(climate_store.load(meteo_file_path,columns))
+        except FileNotFoundError:
+            print("Error: File "+meteo_file_path+" cannot be found.")
+            return
+        except OSError as error: # The copy that cannot be written is not an error (see climate_store.load)
+            print("Error: File "+meteo_file_path+" cannot be read ("+str(error)+").")
+            return
+        except KeyError as error:
+            print("Error: "+error.args[0])
+            return
+    
     if meteo_file_path is not None:
         try:
             climate_data = pd.read_csv(meteo_file_path)
@@ -106,50 +104,82 @@ def feasibility_analysis(meteo_file_path=None,climate=None,period='present',clim
     if climate_data is not None:
         if 'T_dry' not in climate_data.columns:
             print("Error: There is no column T_dry in the given data file")
-        else:
-            nb_data = len(climate_data['T_dry'])
             
         if 'w' not in climate_data.columns:
-            print("Computation of specific humidity using HAPropsSI")
-            w = np.zeros((nb_data,1))
+            print("Computation of specific humidity")
             humidity = ['RH','T_wb','T_dp']
             
             for var in humidity:
                 if var in climate_data.columns:
-                    for h in range(nb_data):
-                        w[h] = HAPropsSI('W','T',climate_data['T_dry'][h]+to_K,var,climate_data[var][h],'P',P_atm)
+                    w = psychrometrics.humidity_ratio(climate_data['T_dry'].to_numpy(),var,climate_data[var].to_numpy(),P_atm)
                      
                     T_index = climate_data.columns.get_loc('T_dry')
                     climate_data.insert(T_index+1,'w',w)
                     break
                     
-    # Components
-    if components is None: # Definition of the default set of components
-        DEC = methodology.component('DEC',0.85)
-        IEC = methodology.component('IEC',0.75)
-        D_IEC = methodology.component('D_IEC',0.85)
-        DW = methodology.component('DW',0.85)
+    return climate_data
+
+# Definition of the default set of components
+def default_components():
+    DEC = methodology.component('DEC',0.85)
+    IEC = methodology.component('IEC',0.75)
+    D_IEC = methodology.component('D-IEC',0.85)
+    DW = methodology.component('DW',0.85)
 
-        components = {
-            'DEC':DEC,
-            'IEC':IEC,
-            'D-IEC':D_IEC,
-            'DW':DW
-            }
+    components = {
+        'DEC':DEC,
+        'IEC':IEC,
+        'D-IEC':D_IEC,
+        'DW':DW
+        }
+    return components
+
+def feasibility_analysis(meteo_file_path=None,climate=None,period='present',climate_data=None,components=None,params=None,chart='yes',verbose='yes'):
+    # Climate data
+    with profiling.span('load_climate_data'):
+        climate_data = load_climate_data(meteo_file_path,climate,period,climate_data,columns=['T_dry','w'])
+    if climate_data is None:
+        return
+    nb_data = len(climate_data['T_dry'])
+    
+    # Components
+    if components is None:
+        components = default_components()
     else:
-        valid_types = ['DEC','IEC','D-IEC','DW']
         for name in components:
-            if components[name].type not in valid_types:
+            if components[name].type not in methodology.component_types:
                 print("Error: "+components[name].type+" is not a valid component type")
             else:
                 if components[name].epsilon is None:
-                    default_epsilon = 0.85
-                    if components[name].type == 'IEC':
-                        default_epsilon = 0.75
+                    components[name].epsilon = methodology.component_types[components[name].type]
                         
-                    print("No value has been set for the "+components[name].type+" efficiency, default value is"+default_epsilon)
+                    print("No value has been set for the "+components[name].type+" efficiency, default value is "+str(components[name].epsilon))
                     
     # Parameters
+    with profiling.span('resolve_params'):
+        params = resolve_params(params)
+    
+    # Feasiblity analysis
+    with profiling.span('methodology.main',nb_data):
+        nb_hours_modes, component_dict, ax = methodology.main(components,params,climate_data,chart=chart,verbose=verbose)
+    
+    if nb_hours_modes != 0 and verbose == 'yes':
+        mode = recommended_mode(nb_hours_modes,component_dict,nb_data)
+        
+        if mode == "Active cooling":
+            print("Active cooling is necessary to guarantee indoor thermal comfort.")
+        else:
+            print("The components that are recommended to be added in the system are "+str(component_dict[mode])+" to guarantee a 98% thermal comfort.")
+        
+    return nb_hours_modes, ax
+
+# Completes the operational parameters with their default values and the indoor humidity
+def resolve_params(params=None):
+    # Definition of constants
+    P_atm = 101325
+    to_K = 273.15
+    to_C = -273.15
+    
     default_params = {'T_reg': 60,
                    'T_su_min': 16,
                    'T_su_max': 20
@@ -199,7 +229,7 @@ def feasibility_analysis(meteo_file_path=None,climate=None,period='present',clim
             for i in range(2):
                 key = known_indoor[i]
                 var.append(default_indoor[key]['var'])
-                val.append(default_indoor[key]['value'])
+                val.append(params[key])
                 if default_indoor[key]['units'] == 'C':
                     val[i+1] = val[i+1]+to_K
             
@@ -212,33 +242,27 @@ def feasibility_analysis(meteo_file_path=None,climate=None,period='present',clim
             known_indoor.append(hum)
             unknown_indoor.remove(hum)
     
-    # Feasiblity analysis
-    nb_hours_modes, component_dict, ax = methodology.main(components,params,climate_data)
+    return params
+
+# Returns the first operation mode from which the system guarantees indoor thermal comfort
+def recommended_mode(nb_hours_modes,component_dict,nb_data):
+    comfort_hours = 0
+    min_comfort_hours = 0.98*nb_data # Arbitrary for now, system should guarantee indoor thermal comfort 98% of the time
     
-    if nb_hours_modes != 0:
-        # Choice of recommended system
-        comfort_hours = 0
-        min_comfort_hours = 0.98*nb_data # Arbitrary for now, system should guarantee indoor thermal comfort 98% of the time
-        
-        for mode in component_dict:
-            comfort_hours = comfort_hours+nb_hours_modes[mode]
-            
-            if comfort_hours > min_comfort_hours:
-                break
+    for mode in component_dict:
+        comfort_hours = comfort_hours+nb_hours_modes[mode]
         
-        if mode == "Active cooling":
-            print("Active cooling is necessary to guarantee indoor thermal comfort.")
-        else:
-            print("The components that are recommended to be added in the system are "+str(component_dict[mode])+" to guarantee a 98% thermal comfort.")
-        
-    return nb_hours_modes, ax
+        if comfort_hours > min_comfort_hours:
+            break
+    return mode
 
-nb_hours_modes, ax = feasibility_analysis(meteo_file_path='Meteo/2A_Sao_Paulo_TMY_2001-2020.csv')
+if __name__ == '__main__':
+    nb_hours_modes, ax = feasibility_analysis(meteo_file_path='Meteo/2A_Sao_Paulo_TMY_2001-2020.csv')
 
 # Definition of components
 # DEC = methodology.component('DEC',0.85)
 # IEC = methodology.component('IEC',0.75)
-# D_IEC = methodology.component('D_IEC',0.85)
+# D_IEC = methodology.component('D-IEC',0.85)
 # DW = methodology.component('DW',0.85)
 
 # components = {
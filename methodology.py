@@ -5,13 +5,14 @@ Created on Mon Mar  3 13:11:48 2025
 @author: Alanis Zeoli
 """
 
-import matplotlib.pyplot as plt
-import pandas as pd
+import functools
+
 import numpy as np
-from CoolProp.CoolProp import HAPropsSI
 
-import psychrometric_diagram as psychro
-import plot_default
+import boundary_solver
+import profiling
+import properties
+from properties import HAPropsSI # Memoized CoolProp calls
 
 """
 Definition of a class for the components
@@ -39,7 +40,12 @@ Methods:
         For the DW:
             epsilon = (T_su-T_lim)/(T_su-T_ex)
 """
+# Default effectiveness of each component type (used when epsilon is not given)
+component_types = {'DEC': 0.85, 'IEC': 0.75, 'D-IEC': 0.85, 'DW': 0.85}
+
 class component():
+    __slots__ = ['type','epsilon']
+    
     def __init__(self,type_name,epsilon=None):
         self.type = type_name
         self.epsilon = epsilon
@@ -62,6 +68,44 @@ class component():
             T_su = (T_lim-epsilon*T_ex)/(1-epsilon)
         return T_su
 
+"""
+Definition of a class for arrays of components
+
+Objective: evaluate many components (types and effectiveness values) at once, used by boundary_coefficients to build the limits of many configurations
+
+Attributes:
+    type = array of component types (see component class)
+    epsilon = array of effectiveness values, broadcast with type
+
+Methods:
+    get_T_lim, get_T_su: same as for the component class, for arrays of components
+        (the formula of the DW or of the other components is selected element by element)
+    component: returns the component (component class) of index i
+"""
+class component_array():
+    __slots__ = ['type','epsilon','is_DW']
+    
+    def __init__(self,type_name,epsilon):
+        self.epsilon = np.asarray(epsilon,dtype=float)
+        self.type = np.broadcast_to(np.asarray(type_name),self.epsilon.shape)
+        self.is_DW = self.type == 'DW'
+        
+    def __len__(self):
+        return len(self.epsilon)
+        
+    def get_T_lim(self,T_su,T_ex):
+        epsilon = self.epsilon
+        return T_su + (T_ex-T_su)*np.where(self.is_DW,epsilon,1/epsilon)
+    
+    def get_T_su(self,T_lim,T_ex):
+        epsilon = self.epsilon
+        
+        numerator = np.where(self.is_DW,T_lim-epsilon*T_ex,T_ex-epsilon*T_lim)
+        return numerator/(1-epsilon)
+    
+    def component(self,i):
+        return component(str(self.type[i]),float(self.epsilon[i]))
+
 # Returns the temperature based on spec. humidity and line coefficients 
 def get_T(w,lim):
     m = lim[0]
@@ -84,7 +128,7 @@ def linear_interp(T1,w1,T2,w2):
     p = w1 - m*T1
     return [m,p]
 
-# Returns the couple (T,w) at the intersection between 2 lines
+# Returns the couple (T,w) at the intersection between 2 lines (see boundary_solver for arrays of lines)
 def lines_intersection(lim1,lim2):
     if len(lim1)>1:
         m1 = lim1[0]
@@ -95,8 +139,8 @@ def lines_intersection(lim1,lim2):
         p2 = lim2[1]
         
     if len(lim1)>1 and len(lim2)>1:
-        x = (p2-p1)/(m1-m2)
-        y = m1*x + p1
+        x, y = boundary_solver.lines_intersection(m1,p1,m2,p2)
+        x, y = float(x), float(y)
     elif len(lim1)>1:
         x = lim2[0]
         y = m1*x + p1
@@ -108,32 +152,14 @@ def lines_intersection(lim1,lim2):
         return
     return x,y
 
-# Intersection between a line and the saturation curve
-def curve_intersection(lim):
-    T_min = 0
-    T_max = 50
-    T_dp = 0
-    T = -100
-    
-    while abs(T_dp-T)>1e-2:
-        T = (T_min+T_max)/2
-        w = get_w(T,lim)
-        T_dp = saturation(w)
-        
-        if T_dp<T:
-            T_max = T
-        else:
-            T_min = T
-    return T, w
+# Intersection between a line and the saturation curve (see boundary_solver for arrays of lines)
+def curve_intersection(lim,tol=1e-6):
+    T, w = boundary_solver.curve_intersection(lim[0],lim[1],tol)
+    return float(T), float(w)
 
 # Polynomial equation for the saturation curve. Returns T based on w
 def saturation(w):
-    coef = [7.2356e12, -1.2955e12, 9.5015e10, -3.6881e9, 8.2083e7, -1.0783e6, 9.1033e3, -22.7387]
-    N = len(coef)
-    T = 0
-    for i in range(N):
-        T = T + coef[N-i-1]*w**i
-    return T
+    return boundary_solver.saturation(w)
 
 # Definition of a zone based on its limits
 def zone_def(T_out,w_out,lim,cooling_zone):
@@ -154,340 +180,748 @@ def zone_def(T_out,w_out,lim,cooling_zone):
     return new_cooling_zone, new_zone, nb_hours_zone
     
 
-def main(components,params,climate_data=None,chart='yes',hum='yes'):
-    # Definition of constants
-    P_atm = 101325
-    to_K = 273.15
-    to_C = -273.15
-    
-    # Initialise plot
-    if chart == 'yes':
-        color = plot_default.main()
-        main_colors = color['main']
-        fig, ax = plt.subplots(figsize=(7,7))
-        ax = psychro.plot_diagram(ax)
-        
-        lim_data = {
-            'Heating': ['$T_{su,min}$', main_colors['darkblue']],
-            'Ventilation': ['$T_{su,max}$', main_colors['teal']],
-            'DEC': ['$T_{wb,max}$', main_colors['darkgreen']],
-            'DEC (hum)': ['$ε_{wb,DEC}$', main_colors['verydarkgreen']],
-            'IEC': ['$ε_{wb,s,IEC}$', main_colors['darkorange']],
-            'IEC (hum)': ['$ε_{wb,s,IEC}$ (hum)', main_colors['verydarkorange']],
-            'DECS': ['$ε_{h,DW}$', main_colors['darkpink']],
-            'DECS pre-cooling': ['$ε_{dp,D-IEC}$', main_colors['black']] 
-            }
-        limits = pd.DataFrame(data=lim_data,index=['legend','color'])
-        
-        if climate_data is not None:
-            Zone = {}
-            marker_size = 6
-            mode_colors = {
-                'Heating': main_colors['teal'],
-                'Ventilation': main_colors['blue'],
-                'DEC': main_colors['lightgreen'],
-                'DEC (hum)': main_colors['green'],
-                'IEC': main_colors['lightsalmon'],
-                'IEC (hum)': main_colors['orangesalmon'],
-                'DECS': main_colors['pink'],
-                'DECS pre-cooling': main_colors['fushia'],
-                'Active cooling': main_colors['darkred']
-                }
-    else:
-        ax = []
-    
-    # Parameters
-    if 'w_in' in params.keys(): # Check to compute w_in from T_in and RH_in
-        w_in = params['w_in']
-    else:
-        w_in = 0.009
-        print('The value of w_in has not been provided and has been set to the default value of 9 g/kg.')
+# Limits from which the limit of each mode is built, a change of one of them changes the limit of the mode
+mode_dependencies = {
+    'DEC': ['Ventilation'],
+    'DEC (hum)': ['Ventilation','DEC'],
+    'IEC': ['DEC','DEC (hum)'],
+    'IEC (hum)': ['Ventilation','DEC (hum)'],
+    'DECS': ['IEC (hum)'],
+    'DECS pre-cooling': ['DECS']
+    }
+
+# Copies the limit of a mode from a previous boundary model
+def reuse_mode(previous,mode,lim,T_lim,w_lim,legend_values):
+    lim[mode] = previous.lim[mode]
+    T_lim[mode] = previous.T_lim[mode]
+    w_lim[mode] = previous.w_lim[mode]
+    if mode in previous.legend_values:
+        legend_values[mode] = previous.legend_values[mode]
+
+"""
+Definition of a class for the boundaries of the operation modes
+
+Objective: build the limit lines of each operation mode once for a set of components and parameters,
+independently from the climate data, so that they can be reused for any number of climates
+
+Inputs:
+    components: Dictionnary containing the system components (component class)
+    params: Dictionnary containing values for the system operational parameters (T_su_min, T_su_max, T_reg, w_in, T_wb_in or T_in)
+    hum: 'yes' if the humidification of the building is accepted (default = 'yes')
+    previous: Boundary model of a previous configuration, whose limits are reused when their inputs did not change (default = None)
+
+Attributes:
+    key = hashable description of the inputs, used to compare and cache boundary models
+    inputs = values on which the limit of each mode depends (see mode_dependencies)
+    reused = modes whose limits were taken from the previous model
+    mode_list = operation modes in the order in which they are tested
+    lim = values of m and p of the limit line of each mode (only T for vertical lines)
+    T_lim, w_lim = end points of the limit lines, used to plot them
+    component_dict = list of components used for each operation mode
+    legend_values = value of the parameter characterizing each limit line, used in the chart legend
+    w_in, T_max = nominal indoor spec. humidity and maximum temperature of the chart
+
+Boundary models are immutable, use get_boundary_model to benefit from the cache.
+"""
+class boundary_model():
+    def __init__(self,components,params,hum='yes',previous=None):
+        # Definition of constants
+        P_atm = 101325
+        to_K = 273.15
+        to_C = -273.15
         
-    if 'T_wb_in' in params.keys():
-        T_wb_in = params['T_wb_in']
-    else:
-        if 'T_in' in params.keys():
-            T_in = params['T_in']
-        else:
-            T_in = 24
-            print('The value of T_in has not been provided and has been set to the default value of 24°C.')
-                
-        T_wb_in = HAPropsSI('B','T',T_in+to_K,'W',w_in,'P',P_atm)+to_C
-    
-    if 'T_su_min' in params.keys():
-        T_su_min = params['T_su_min']
-    else:
-        T_su_min = 16 # Default value
-        print('The value of T_su_min has not been provided and has been set to the default value of 16°C.')
+        self.key = boundary_key(components,params,hum)
+        self.hum = hum
         
-    if 'T_su_max' in params.keys():
-        T_su_max = params['T_su_max']
-    else:
-        T_su_max = 20 # Default value
-        print('The value of T_su_max has not been provided and has been set to the default value of 20°C.')
+        # Parameters
+        profiling.step('Parameters')
+        if 'w_in' in params.keys(): # Check to compute w_in from T_in and RH_in
+            w_in = params['w_in']
+        else:
+            w_in = 0.009
+            print('The value of w_in has not been provided and has been set to the default value of 9 g/kg.')
+            
+        if 'T_wb_in' in params.keys():
+            T_wb_in = params['T_wb_in']
+        else:
+            if 'T_in' in params.keys():
+                T_in = params['T_in']
+            else:
+                T_in = 24
+                print('The value of T_in has not been provided and has been set to the default value of 24°C.')
+                    
+            T_wb_in = HAPropsSI('B','T',T_in+to_K,'W',w_in,'P',P_atm)+to_C
         
-    if 'T_reg' in params.keys():
-        T_reg = params['T_reg']
-    else:
-        T_reg = 60 # Default value
-        print('The value of T_reg has not been provided and has been set to the default value of 60°C.')
-    T_max = T_reg # Make sure to compute max values for the regerantion temperature
-    w_min = 0
-    
-    # Include calculation of w_out here instead of main
-    if climate_data is not None:
-        T_out = climate_data['T_dry'].to_numpy()
-        w_out = climate_data['w'].to_numpy()
-        nb_data = len(T_out)
-        
-        # Define hours during which passive operation is possible
-        all_hours = np.arange(0,nb_data,1)
-        if hum == 'yes':
-            cooling_zone = all_hours
+        if 'T_su_min' in params.keys():
+            T_su_min = params['T_su_min']
+        else:
+            T_su_min = 16 # Default value
+            print('The value of T_su_min has not been provided and has been set to the default value of 16°C.')
+            
+        if 'T_su_max' in params.keys():
+            T_su_max = params['T_su_max']
         else:
-            cooling_zone = np.where(w_out<w_in)[0]
+            T_su_max = 20 # Default value
+            print('The value of T_su_max has not been provided and has been set to the default value of 20°C.')
             
-        active_zone = np.setdiff1d(all_hours,cooling_zone)
+        if 'T_reg' in params.keys():
+            T_reg = params['T_reg']
+        else:
+            T_reg = 60 # Default value
+            print('The value of T_reg has not been provided and has been set to the default value of 60°C.')
+        T_max = T_reg # Make sure to compute max values for the regerantion temperature
+        w_min = 0
+        
+        # Inputs on which the limit of each mode depends, including the inputs of the limits it is built from
+        component_inputs = {name: (components[name].type,components[name].epsilon) for name in components}
+        own_inputs = {
+            'Heating': (T_su_min,),
+            'Ventilation': (T_su_max,),
+            'DEC': (T_su_max,w_in),
+            'DEC (hum)': (T_su_max,component_inputs.get('DEC')),
+            'IEC': (T_su_max,w_in,T_wb_in,component_inputs.get('IEC')),
+            'IEC (hum)': (T_su_max,T_wb_in,component_inputs.get('IEC')),
+            'DECS': (T_reg,component_inputs.get('DW')),
+            'DECS pre-cooling': (w_in,component_inputs.get('D-IEC'))
+            }
+        inputs = {}
+        for mode in own_inputs:
+            inputs[mode] = own_inputs[mode] + tuple(inputs[upstream] for upstream in mode_dependencies.get(mode,[]))
+        
+        # Limits whose inputs did not change are taken from the previous model
+        reused = set()
+        if previous is not None and previous.hum == hum:
+            reused = {mode for mode in inputs if previous.inputs.get(mode) == inputs[mode] and mode in previous.lim}
+        
+        mode_list = []
+        lim = {} # Dictionnary containing the values of m and p to determine the limits of each operation mode
+        T_lim = {} # Values of limit temperatures used to plot limits
+        w_lim = {} # Values of limit spec. humidities used to plot limits
+        component_list = [] # List of added components
+        component_dict = {} # List of components used for each operation mode
+        legend_values = {} # Values characterizing the limits in the chart legend
+        
+        " ------------- Step 1 - Heating ---------------- "
+        profiling.step('Step 1 - Heating')
+        mode = 'Heating'
+        mode_list.append(mode)
+        component_dict[mode] = component_list.copy()
     
-    nb_hours = {} # Dictionnary containing the number of operating hours in each mode
-    mode_list = []
-    lim = {} # Dictionnary containing the values of m and p to determine the limits of each operation mode
-    T_lim = {} # Values of limit temperatures used to plot limits
-    w_lim = {} # Values of limit spec. humidities used to plot limits
-    component_list = [] # List of added components
-    component_dict = {} # List of components used for each operation mode
-    
-    " ------------- Step 1 - Heating ---------------- "
-    mode = 'Heating'
-    mode_list.append(mode)
-    component_dict[mode] = component_list.copy()
-    
-    lim[mode] = np.array([T_su_min]) # Vertical line
-    T_lim[mode] = np.array([T_su_min, T_su_min]) 
-    w1 = w_min
-    w2 = HAPropsSI('W','T',T_su_min+to_K,'RH',1,'P',P_atm)
-    w_lim[mode] = np.array([w1, w2])
+        if mode in reused:
+            reuse_mode(previous,mode,lim,T_lim,w_lim,legend_values)
+        else:
+            lim[mode] = np.array([T_su_min]) # Vertical line
+            T_lim[mode] = np.array([T_su_min, T_su_min]) 
+            w1 = w_min
+            w2 = HAPropsSI('W','T',T_su_min+to_K,'RH',1,'P',P_atm)
+            w_lim[mode] = np.array([w1, w2])
         
-    if chart == 'yes':
-        limits.loc['legend',mode] = limits[mode]['legend']+" = "+str(T_su_min)+"°C"
+            legend_values[mode] = str(T_su_min)+"°C"
     
-    " ------------- Step 2 - Ventilation ---------------- "
-    mode = 'Ventilation'
-    mode_list.append(mode)
-    component_dict[mode] = component_list.copy()
+        " ------------- Step 2 - Ventilation ---------------- "
+        profiling.step('Step 2 - Ventilation')
+        mode = 'Ventilation'
+        mode_list.append(mode)
+        component_dict[mode] = component_list.copy()
     
-    lim[mode] = np.array([T_su_max]) # Vertical line
-    T_lim[mode] = np.array([T_su_max, T_su_max]) 
-    w1 = w_min
-    w2 = HAPropsSI('W','T',T_su_max+to_K,'RH',1,'P',P_atm)
-    w_lim[mode] = np.array([w1, w2])
+        if mode in reused:
+            reuse_mode(previous,mode,lim,T_lim,w_lim,legend_values)
+        else:
+            lim[mode] = np.array([T_su_max]) # Vertical line
+            T_lim[mode] = np.array([T_su_max, T_su_max]) 
+            w1 = w_min
+            w2 = HAPropsSI('W','T',T_su_max+to_K,'RH',1,'P',P_atm)
+            w_lim[mode] = np.array([w1, w2])
         
-    if chart == 'yes':
-        limits.loc['legend',mode] = limits[mode]['legend']+" = "+str(T_su_max)+"°C"
+            legend_values[mode] = str(T_su_max)+"°C"
         
-    " ------------- Step 3 - DEC ---------------- "
-    if 'DEC' in components.keys():
-        # Part 1 - No humidification of the building
-        mode = 'DEC'
-        mode_list.append(mode)
+        " ------------- Step 3 - DEC ---------------- "
+        profiling.step('Step 3 - DEC')
+        if 'DEC' in components.keys():
+            # Part 1 - No humidification of the building
+            mode = 'DEC'
+            mode_list.append(mode)
         
-        new_component = 'DEC'
-        component_list.append(new_component)
-        component_dict[mode] = component_list.copy()
+            new_component = 'DEC'
+            component_list.append(new_component)
+            component_dict[mode] = component_list.copy()
         
-        w1 = w_in
-        w2 = w_min
+            if mode in reused:
+                reuse_mode(previous,mode,lim,T_lim,w_lim,legend_values)
+            else:
+                w1 = w_in
+                w2 = w_min
 
-        T1 = T_su_max
-        T_wb_max = HAPropsSI('B','T',T1+to_K,'W',w1,'P',P_atm)+to_C
-        T2 = HAPropsSI('T','B',T_wb_max+to_K,'W',w2,'P',P_atm)+to_C
+                T1 = T_su_max
+                T_wb_max = HAPropsSI('B','T',T1+to_K,'W',w1,'P',P_atm)+to_C
+                T2 = HAPropsSI('T','B',T_wb_max+to_K,'W',w2,'P',P_atm)+to_C
 
-        m, p = linear_interp(T1,w1,T2,w2)
-        lim[mode] = np.array([m, p])
+                m, p = linear_interp(T1,w1,T2,w2)
+                lim[mode] = np.array([m, p])
         
-        T1, w1 = lines_intersection(lim['Ventilation'],lim['DEC'])
-        w_lim[mode] = np.array([w1, w2])
-        T_lim[mode] = np.array([T1, T2])
+                T1, w1 = lines_intersection(lim['Ventilation'],lim['DEC'])
+                w_lim[mode] = np.array([w1, w2])
+                T_lim[mode] = np.array([T1, T2])
             
-        # Part 2 - Humidification of th building accepted
-        if hum == 'yes':
+            # Part 2 - Humidification of th building accepted
+            # The limit is also needed for the IEC limits when the humidification is not accepted
             mode = 'DEC (hum)'
-            mode_list.append(mode)
-            component_dict[mode] = component_list.copy()
+            if hum == 'yes':
+                mode_list.append(mode)
+                component_dict[mode] = component_list.copy()
             DEC = components[new_component]
+        
+            if mode in reused:
+                reuse_mode(previous,mode,lim,T_lim,w_lim,legend_values)
+            else:
+                T1 = T_su_max
+                w1 = max(w_lim['Ventilation'])
+        
+                T2 = T1+5
+                T_wb_max = DEC.get_T_lim(T2,T_su_max)
+                w2 = HAPropsSI('W','B',T_wb_max+to_K,'T',T2+to_K,'P',P_atm)
+        
+                m, p = linear_interp(T1,w1,T2,w2)
+                lim[mode] = np.array([m, p])
+        
+                T2, w2 = lines_intersection(lim['DEC (hum)'],lim['DEC'])
+                w_lim[mode] = np.array([w1, w2])
+                T_lim[mode] = np.array([T1, T2])
             
-            T1 = T_su_max
-            w1 = max(w_lim['Ventilation'])
-            
-            T2 = T1+5
-            T_wb_max = DEC.get_T_lim(T2,T_su_max)
-            w2 = HAPropsSI('W','B',T_wb_max+to_K,'T',T2+to_K,'P',P_atm)
-            
-            m, p = linear_interp(T1,w1,T2,w2)
-            lim[mode] = np.array([m, p])
-            
-            T2, w2 = lines_intersection(lim['DEC (hum)'],lim['DEC'])
-            w_lim[mode] = np.array([w1, w2])
-            T_lim[mode] = np.array([T1, T2])
-                
-            if chart == 'yes':
-                limits.loc['legend',mode] = limits[mode]['legend']+" = "+str(DEC.epsilon)
+                legend_values[mode] = str(DEC.epsilon)
                 
-        " ------------- Step 4 - IEC ---------------- "
-        if 'IEC' in components.keys(): # In the future change for IEC and IEC+DEC
-            # Part 1 - No humidification of the building
-            mode = 'IEC'
-            mode_list.append(mode)
+            " ------------- Step 4 - IEC ---------------- "
+            profiling.step('Step 4 - IEC')
+            if 'IEC' in components.keys(): # In the future change for IEC and IEC+DEC
+                # Part 1 - No humidification of the building
+                mode = 'IEC'
+                mode_list.append(mode)
             
-            new_component = 'IEC'
-            component_list.append(new_component)
-            component_dict[mode] = component_list.copy()
+                new_component = 'IEC'
+                component_list.append(new_component)
+                component_dict[mode] = component_list.copy()
             
-            IEC = components[new_component]
+                IEC = components[new_component]
             
-            w1 = w_in
-            T1 = T_su_max
+                if mode in reused:
+                    reuse_mode(previous,mode,lim,T_lim,w_lim,legend_values)
+                else:
+                    w1 = w_in
+                    T1 = T_su_max
             
-            # The evolution inside the IEC is sensible before arriving to the DEC inlet
-            w2 = w_min
-            T_ex = get_T(w2,lim['DEC'])
-            T2 = IEC.get_T_su(T_wb_in,T_ex)
+                    # The evolution inside the IEC is sensible before arriving to the DEC inlet
+                    w2 = w_min
+                    T_ex = get_T(w2,lim['DEC'])
+                    T2 = IEC.get_T_su(T_wb_in,T_ex)
     
-            m, p = linear_interp(T1,w1,T2,w2)
-            lim[mode] = np.array([m, p])
+                    m, p = linear_interp(T1,w1,T2,w2)
+                    lim[mode] = np.array([m, p])
             
-            T1, w1 = lines_intersection(lim['IEC'],lim['DEC (hum)'])
-            w_lim[mode] = np.array([w1, w2])
-            T_lim[mode] = np.array([T1, T2])
+                    T1, w1 = lines_intersection(lim['IEC'],lim['DEC (hum)'])
+                    w_lim[mode] = np.array([w1, w2])
+                    T_lim[mode] = np.array([T1, T2])
             
-            if chart == 'yes':
-                limits.loc['legend',mode] = limits[mode]['legend']+" = "+str(IEC.epsilon)
+                    legend_values[mode] = str(IEC.epsilon)
                 
-            # Part 2 - Humidification of th building accepted
-            if hum == 'yes':
+                # Part 2 - Humidification of th building accepted
+                # The limit is also needed for the DECS limits when the humidification is not accepted
                 mode = 'IEC (hum)'
-                mode_list.append(mode)
-                component_dict[mode] = component_list.copy()
-                
-                T1 = T_su_max
-                w1 = max(w_lim['Ventilation'])
-                
-                # The evolution inside the IEC is sensible before arriving to the DEC inlet
-                w2 = w_min
-                T_ex = get_T(w2,lim['DEC (hum)'])
-                T2 = IEC.get_T_su(T_wb_in,T_ex) # The minimum reachable temperature is T_wb_in because
-                
-                m, p = linear_interp(T1,w1,T2,w2)
-                lim[mode] = np.array([m, p])
+                if hum == 'yes':
+                    mode_list.append(mode)
+                    component_dict[mode] = component_list.copy()
+            
+                if mode in reused:
+                    reuse_mode(previous,mode,lim,T_lim,w_lim,legend_values)
+                else:
+                    T1 = T_su_max
+                    w1 = max(w_lim['Ventilation'])
+            
+                    # The evolution inside the IEC is sensible before arriving to the DEC inlet
+                    w2 = w_min
+                    T_ex = get_T(w2,lim['DEC (hum)'])
+                    T2 = IEC.get_T_su(T_wb_in,T_ex) # The minimum reachable temperature is T_wb_in because
+            
+                    m, p = linear_interp(T1,w1,T2,w2)
+                    lim[mode] = np.array([m, p])
+            
+                    w_lim[mode] = np.array([w1, w2])
+                    T_lim[mode] = np.array([T1, T2])
                 
-                w_lim[mode] = np.array([w1, w2])
-                T_lim[mode] = np.array([T1, T2])
-                    
-                if chart == 'yes':
-                    limits.loc['legend',mode] = limits[mode]['legend']+" = "+str(IEC.epsilon)
+                    legend_values[mode] = str(IEC.epsilon)
              
-            " ------------- Step 5 - DECS ---------------- "
-            if 'DW' in components.keys():
-                mode = 'DECS'
-                mode_list.append(mode)
+                " ------------- Step 5 - DECS ---------------- "
+                profiling.step('Step 5 - DECS')
+                if 'DW' in components.keys():
+                    mode = 'DECS'
+                    mode_list.append(mode)
                 
-                new_component = 'DW'
-                component_list.append(new_component)
-                component_dict[mode] = component_list.copy()
+                    new_component = 'DW'
+                    component_list.append(new_component)
+                    component_dict[mode] = component_list.copy()
                 
-                DW = components[new_component]
+                    DW = components[new_component]
                 
-                T_ex = T_reg - 10 # Fix a constant pinch point in the DW
+                    if mode in reused:
+                        reuse_mode(previous,mode,lim,T_lim,w_lim,legend_values)
+                    else:
+                        T_ex = T_reg - 10 # Fix a constant pinch point in the DW
                 
-                T1 = T_ex
-                w1 = get_w(T1,lim['IEC (hum)'])
+                        T1 = T_ex
+                        w1 = get_w(T1,lim['IEC (hum)'])
                 
-                T2 = T1-10
-                T2h = DW.get_T_lim(T2, T_ex)
-                h2 = HAPropsSI('H','T',T2h+to_K,'W',w1,'P',P_atm) # By definition of T2h
-                w2 = HAPropsSI('W','T',T2+to_K,'H',h2,'P',P_atm) # By definition of the isenthalpic efficiency
+                        T2 = T1-10
+                        T2h = DW.get_T_lim(T2, T_ex)
+                        h2 = HAPropsSI('H','T',T2h+to_K,'W',w1,'P',P_atm) # By definition of T2h
+                        w2 = HAPropsSI('W','T',T2+to_K,'H',h2,'P',P_atm) # By definition of the isenthalpic efficiency
                 
-                m, p = linear_interp(T1,w1,T2,w2)
-                lim[mode] = np.array([m, p])
+                        m, p = linear_interp(T1,w1,T2,w2)
+                        lim[mode] = np.array([m, p])
                 
-                T2, w2 = curve_intersection(lim[mode])
-                w_lim[mode] = np.array([w1, w2])
-                T_lim[mode] = np.array([T1, T2])
+                        T2, w2 = curve_intersection(lim[mode])
+                        w_lim[mode] = np.array([w1, w2])
+                        T_lim[mode] = np.array([T1, T2])
                 
-                if chart == 'yes':
-                    limits.loc['legend',mode] = limits[mode]['legend']+" = "+str(DW.epsilon)
+                        legend_values[mode] = str(DW.epsilon)
                 
-                " ------------- Step 6 - DECS with pre-cooling ---------------- "
-                if 'D-IEC' in components.keys():
-                    mode = 'DECS pre-cooling'
-                    mode_list.append(mode)
+                    " ------------- Step 6 - DECS with pre-cooling ---------------- "
+                    profiling.step('Step 6 - DECS with pre-cooling')
+                    if 'D-IEC' in components.keys():
+                        mode = 'DECS pre-cooling'
+                        mode_list.append(mode)
                     
-                    new_component = 'D-IEC'
-                    component_list.append(new_component)
-                    component_dict[mode] = component_list.copy()
+                        new_component = 'D-IEC'
+                        component_list.append(new_component)
+                        component_dict[mode] = component_list.copy()
                     
-                    D_IEC = components[new_component]
+                        D_IEC = components[new_component]
                     
-                    T1 = min(T_lim['DECS'])
-                    w1 = max(w_lim['DECS'])
+                        if mode in reused:
+                            reuse_mode(previous,mode,lim,T_lim,w_lim,legend_values)
+                        else:
+                            T1 = min(T_lim['DECS'])
+                            w1 = max(w_lim['DECS'])
                     
-                    w2 = w_in # Arbitrary
-                    T_ex = get_T(w2,lim['DECS']) # Temperature at the inlet of the DW
-                    T_dp = HAPropsSI('D','W',w2,'T',T_ex+to_K,'P',P_atm)+to_C # Minimum achievable temperature
-                    T2 = D_IEC.get_T_su(T_dp, T_ex)
+                            w2 = w_in # Arbitrary
+                            T_ex = get_T(w2,lim['DECS']) # Temperature at the inlet of the DW
+                            T_dp = HAPropsSI('D','W',w2,'T',T_ex+to_K,'P',P_atm)+to_C # Minimum achievable temperature
+                            T2 = D_IEC.get_T_su(T_dp, T_ex)
                     
-                    m, p = linear_interp(T1,w1,T2,w2)
-                    lim[mode] = np.array([m, p])
+                            m, p = linear_interp(T1,w1,T2,w2)
+                            lim[mode] = np.array([m, p])
                     
-                    w_lim[mode] = np.array([w1, w2])
-                    T_lim[mode] = np.array([T1, T2])
+                            w_lim[mode] = np.array([w1, w2])
+                            T_lim[mode] = np.array([T1, T2])
                     
-                    if chart == 'yes':
-                        limits.loc['legend',mode] = limits[mode]['legend']+" = "+str(D_IEC.epsilon)
+                            legend_values[mode] = str(D_IEC.epsilon)
     
-    " ------------- Active cooling ---------------- "
-    mode = 'Active cooling'
-    mode_list.append(mode)
+        " ------------- Active cooling ---------------- "
+        profiling.step('Active cooling')
+        mode = 'Active cooling'
+        mode_list.append(mode)
     
-    new_component = 'Cooling coil'
-    component_list.append(new_component)
-    component_dict[mode] = component_list.copy()
+        new_component = 'Cooling coil'
+        component_list.append(new_component)
+        component_dict[mode] = component_list.copy()
     
-    lim[mode] = np.array([0,0.05]) # Arbitrary but makes sure that all points are in it
+        lim[mode] = np.array([0,0.05]) # Arbitrary but makes sure that all points are in it
+        
+        profiling.step(None)
+        
+        # The limits cannot be modified once computed
+        for values in [lim, T_lim, w_lim]:
+            for mode in values:
+                values[mode].setflags(write=False)
+        
+        self.mode_list = mode_list
+        self.inputs = inputs
+        self.reused = reused
+        self.lim = lim
+        
+        # Coefficients of all the limits, used to classify the hours in a single pass
+        self.vertical = np.array([len(lim[mode])==1 for mode in mode_list])
+        self.m = np.array([lim[mode][0] if len(lim[mode])>1 else 0 for mode in mode_list])
+        self.p = np.array([lim[mode][1] if len(lim[mode])>1 else lim[mode][0] for mode in mode_list])
+        for values in [self.vertical, self.m, self.p]:
+            values.setflags(write=False)
+        self.T_lim = T_lim
+        self.w_lim = w_lim
+        self.component_dict = component_dict
+        self.legend_values = legend_values
+        self.w_in = w_in
+        self.T_max = T_max
+        
+    def __hash__(self):
+        return hash(self.key)
+    
+    def __eq__(self,other):
+        return isinstance(other,boundary_model) and self.key == other.key
+
+
+# Returns the coefficients of the limits of many sets of components and parameters at once
+# Same steps as boundary_model with arrays of values, the CoolProp queries being evaluated for arrays (see properties.py)
+#   components: Dictionnary of components (component or component_array class)
+#   params: Dictionnary of operational parameters (T_su_min, T_su_max, T_reg, w_in, T_wb_in), scalars or arrays broadcast together
+# Returns mode_list, vertical (one value per mode), m and p (one row per configuration), w_in and valid
+# valid is False for the configurations leading to non-physical states that CoolProp cannot solve, whose limits are meaningless
+def boundary_coefficients(components,params,hum='yes'):
+    # Definition of constants
+    P_atm = 101325
+    to_K = 273.15
+    to_C = -273.15
+    w_min = 0
+
+    names = ['T_su_min','T_su_max','T_reg','w_in','T_wb_in']
+    epsilons = [np.asarray(components[name].epsilon,dtype=float) for name in components]
+    values = np.broadcast_arrays(*[np.asarray(params[key],dtype=float) for key in names],*epsilons)
+    values = [np.atleast_1d(value).ravel() for value in values]
+    T_su_min, T_su_max, T_reg, w_in, T_wb_in = values[:len(names)]
+    arrays = {name: component_array(components[name].type,value) for name, value in zip(components,values[len(names):])}
+
+    valid = np.ones(len(T_su_max),dtype=bool)
+    for name in arrays:
+        valid &= (arrays[name].epsilon>0) & (arrays[name].epsilon<1)
+
+    mode_list = []
+    vertical = []
+    m = []
+    p = []
+    def add_mode(mode,m_mode,p_mode,is_vertical=False):
+        mode_list.append(mode)
+        vertical.append(is_vertical)
+        m.append(np.broadcast_to(m_mode,T_su_max.shape))
+        p.append(np.broadcast_to(p_mode,T_su_max.shape))
+
+    with np.errstate(divide='ignore',invalid='ignore'):
+        # Step 1 - Heating and Step 2 - Ventilation (vertical lines)
+        add_mode('Heating',0,T_su_min,True)
+        add_mode('Ventilation',0,T_su_max,True)
+        w_ventilation = properties.HAPropsSI_array('W','T',T_su_max+to_K,'RH',1,'P',P_atm)
+
+        # Step 3 - DEC
+        if 'DEC' in arrays:
+            T_wb_max = properties.HAPropsSI_array('B','T',T_su_max+to_K,'W',w_in,'P',P_atm)+to_C
+            T2 = properties.T_from_wet_bulb(T_wb_max+to_K,w_min,P_atm)+to_C
+            m_DEC, p_DEC = boundary_solver.linear_interp(T_su_max,w_in,T2,w_min)
+            add_mode('DEC',m_DEC,p_DEC)
+
+            # The limit of the DEC with humidification is also needed for the IEC limits
+            T2 = T_su_max+5
+            T_wb_max = arrays['DEC'].get_T_lim(T2,T_su_max)
+            w2 = properties.W_from_wet_bulb(T_wb_max+to_K,T2+to_K,P_atm)
+            m_DEC_hum, p_DEC_hum = boundary_solver.linear_interp(T_su_max,w_ventilation,T2,w2)
+            if hum == 'yes':
+                add_mode('DEC (hum)',m_DEC_hum,p_DEC_hum)
+
+            # Step 4 - IEC (the evolution inside the IEC is sensible before arriving to the DEC inlet)
+            if 'IEC' in arrays:
+                T_ex = (w_min-p_DEC)/m_DEC
+                T2 = arrays['IEC'].get_T_su(T_wb_in,T_ex)
+                add_mode('IEC',*boundary_solver.linear_interp(T_su_max,w_in,T2,w_min))
+
+                T_ex = (w_min-p_DEC_hum)/m_DEC_hum
+                T2 = arrays['IEC'].get_T_su(T_wb_in,T_ex)
+                m_IEC_hum, p_IEC_hum = boundary_solver.linear_interp(T_su_max,w_ventilation,T2,w_min)
+                if hum == 'yes':
+                    add_mode('IEC (hum)',m_IEC_hum,p_IEC_hum)
+
+                # Step 5 - DECS
+                if 'DW' in arrays:
+                    T1, w1 = boundary_solver.vertical_intersection(T_reg-10,m_IEC_hum,p_IEC_hum) # Constant pinch point in the DW
+                    T2 = T1-10
+                    T2h = arrays['DW'].get_T_lim(T2,T1)
+                    h2 = properties.HAPropsSI_array('H','T',T2h+to_K,'W',w1,'P',P_atm)
+                    w2 = properties.HAPropsSI_array('W','T',T2+to_K,'H',h2,'P',P_atm)
+                    m_DECS, p_DECS = boundary_solver.linear_interp(T1,w1,T2,w2)
+                    add_mode('DECS',m_DECS,p_DECS)
+
+                    # Step 6 - DECS with pre-cooling
+                    if 'D-IEC' in arrays:
+                        T_sat, w_sat = boundary_solver.curve_intersection(m_DECS,p_DECS)
+                        T1 = np.minimum(T1,T_sat)
+                        w1 = np.maximum(w1,w_sat)
+
+                        T_ex = (w_in-p_DECS)/m_DECS # Temperature at the inlet of the DW
+                        T_dp = properties.HAPropsSI_array('D','W',w_in,'T',T_ex+to_K,'P',P_atm)+to_C
+                        T2 = arrays['D-IEC'].get_T_su(T_dp,T_ex)
+                        add_mode('DECS pre-cooling',*boundary_solver.linear_interp(T1,w1,T2,w_in))
+
+        # Active cooling
+        add_mode('Active cooling',0,0.05)
+
+    m = np.stack(m,axis=1)
+    p = np.stack(p,axis=1)
+    valid &= np.isfinite(m).all(axis=1) & np.isfinite(p).all(axis=1)
+    return mode_list, np.array(vertical), m, p, w_in, valid
+
+# Components added by each operation mode (see boundary_model)
+added_components = {'DEC': 'DEC', 'IEC': 'IEC', 'DECS': 'DW', 'DECS pre-cooling': 'D-IEC', 'Active cooling': 'Cooling coil'}
+
+# Returns the list of components used for each operation mode of a mode list
+def mode_components(mode_list):
+    component_list = []
+    component_dict = {}
+    for mode in mode_list:
+        if mode in added_components:
+            component_list.append(added_components[mode])
+        component_dict[mode] = component_list.copy()
+    return component_dict
+
+# Assigns each hour to the first operation mode of mode_list whose limit is not reached
+# Returns the mode labels (index in mode_list, len(mode_list) if the hour is not classified) and the number of hours in each mode
+# Modes before first_mode are skipped, used when the hours are known not to be in them
+def classify(T_out,w_out,model,block_size=65536,first_mode=0):
+    T_out = np.asarray(T_out,dtype=float)
+    w_out = np.asarray(w_out,dtype=float)
+    nb_data = len(T_out)
+    nb_modes = len(model.mode_list)
+    
+    lines = np.where(~model.vertical)[0]
+    vertical = np.where(model.vertical)[0]
+    m = model.m[lines][:,None]
+    p = model.p[lines][:,None]
+    T_vertical = model.p[vertical][:,None]
+    
+    labels = np.empty(nb_data,dtype=np.uint8)
+    
+    # The hours are processed by blocks to bound the memory used by the matrix of conditions
+    for start in range(0,nb_data,block_size):
+        T = T_out[start:start+block_size]
+        w = w_out[start:start+block_size]
+        
+        # One row per mode plus a last row for the hours that are in no mode
+        below = np.ones((nb_modes+1,len(T)),dtype=bool)
+        below[lines] = w<m*T+p
+        below[vertical] = T<T_vertical
+        below[:first_mode] = False
+        
+        labels[start:start+block_size] = np.argmax(below,axis=0)
+        
+    if model.hum != 'yes':
+        labels[w_out>=model.w_in] = nb_modes # Only active cooling is considered if humidification is not accepted
+    
+    counts = np.bincount(labels,minlength=nb_modes+1)[:nb_modes]
+    return labels, counts
+
+# Returns the index of the first mode whose limit differs between two boundary models (0 if the modes are different)
+def first_changed_mode(previous,model):
+    if previous.mode_list != model.mode_list or previous.hum != model.hum:
+        return 0
+    if model.hum != 'yes' and previous.w_in != model.w_in: # The hours that are not classified change
+        return 0
+    
+    changed = (previous.vertical != model.vertical) | (previous.m != model.m) | (previous.p != model.p)
+    if not changed.any():
+        return len(model.mode_list)
+    return int(np.argmax(changed))
+
+# Updates the mode labels of the hours when the boundaries change from previous to model
+# Only the hours in a mode at or after the first modified limit can change and are classified again
+def reclassify(T_out,w_out,labels,previous,model):
+    T_out = np.asarray(T_out,dtype=float)
+    w_out = np.asarray(w_out,dtype=float)
+    nb_modes = len(model.mode_list)
+    first_mode = first_changed_mode(previous,model)
+    
+    labels = labels.copy()
+    if first_mode < nb_modes:
+        hours = np.where(labels>=first_mode)[0]
+        labels[hours] = classify(T_out[hours],w_out[hours],model,first_mode=first_mode)[0]
+    
+    counts = np.bincount(labels,minlength=nb_modes+1)[:nb_modes]
+    return labels, counts
+
+# Parameters on which the boundaries depend
+boundary_params = ['T_su_min','T_su_max','T_reg','T_in','w_in','T_wb_in']
+
+# Returns a hashable description of the components and parameters defining the boundaries
+def boundary_key(components,params,hum='yes'):
+    component_key = tuple(sorted((name,components[name].type,components[name].epsilon) for name in components))
+    param_key = tuple(sorted((key,params[key]) for key in params if key in boundary_params))
+    return (component_key,param_key,hum)
+
+@functools.lru_cache(maxsize=256)
+def cached_boundary_model(key):
+    component_key, param_key, hum = key
+    components = {name: component(type_name,epsilon) for name, type_name, epsilon in component_key}
+    return boundary_model(components,dict(param_key),hum)
+
+# Returns the boundary model of a set of components and parameters, built only once for identical inputs
+# If a previous model is given, only the limits that depend on the modified inputs are computed
+def get_boundary_model(components,params,hum='yes',previous=None):
+    if previous is None:
+        return cached_boundary_model(boundary_key(components,params,hum))
+    return boundary_model(components,params,hum,previous)
+
+# Returns the colors and legends used to plot the operation modes and their limits
+def mode_styles():
+    import pandas as pd
+    
+    import colors
+    
+    color = colors.main()
+    main_colors = color['main']
+    
+    lim_data = {
+        'Heating': ['$T_{su,min}$', main_colors['darkblue']],
+        'Ventilation': ['$T_{su,max}$', main_colors['teal']],
+        'DEC': ['$T_{wb,max}$', main_colors['darkgreen']],
+        'DEC (hum)': ['$ε_{wb,DEC}$', main_colors['verydarkgreen']],
+        'IEC': ['$ε_{wb,s,IEC}$', main_colors['darkorange']],
+        'IEC (hum)': ['$ε_{wb,s,IEC}$ (hum)', main_colors['verydarkorange']],
+        'DECS': ['$ε_{h,DW}$', main_colors['darkpink']],
+        'DECS pre-cooling': ['$ε_{dp,D-IEC}$', main_colors['black']] 
+        }
+    limits = pd.DataFrame(data=lim_data,index=['legend','color'])
+    
+    mode_colors = {
+        'Heating': main_colors['teal'],
+        'Ventilation': main_colors['blue'],
+        'DEC': main_colors['lightgreen'],
+        'DEC (hum)': main_colors['green'],
+        'IEC': main_colors['lightsalmon'],
+        'IEC (hum)': main_colors['orangesalmon'],
+        'DECS': main_colors['pink'],
+        'DECS pre-cooling': main_colors['fushia'],
+        'Active cooling': main_colors['darkred']
+        }
+    return limits, mode_colors
+
+# Creates the figure of the psychrometric chart and the twin axes used for the limits
+# The figure is wide enough for the legend of the modes, which is drawn on the right of the chart
+# display = 'no' to draw on an Agg canvas without pyplot, so that the backend of the process is not modified
+# The plotting modules are only imported here so that the analysis never loads matplotlib
+def chart_axes(display='yes'):
+    import psychrometric_diagram as psychro
+    
+    fig_size = (10.5,7) # [in]
+    ax_position = (1.2,0.77,5.4,5.4) # Left, bottom, width and height of the chart [in]
+    
+    if display == 'yes':
+        import matplotlib.pyplot as plt
+        fig = plt.figure(figsize=fig_size)
+    else:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=fig_size)
+        FigureCanvasAgg(fig)
+    
+    left, bottom, width, height = ax_position
+    ax = fig.add_axes([left/fig_size[0],bottom/fig_size[1],width/fig_size[0],height/fig_size[1]])
+    ax = psychro.plot_diagram(ax)
+    
+    ax2 = ax.twinx()
+    ax_ylim = ax.get_ylim()
+    ax2.set_ylim(ax_ylim[0],ax_ylim[1])
+    ax2.get_yaxis().set_visible(False)
+    return fig, ax, ax2
+
+# Draws the hours of each mode and the limits of the modes on a chart, returns the new artists
+# layer = 'points' (one marker per hour) or 'density' (one hexagonal 2D histogram per mode, lighter for large datasets)
+def draw_modes(ax,ax2,model,T_out=None,w_out=None,labels=None,layer='points',gridsize=60):
+    limits, mode_colors = mode_styles()
+    marker_size = 6
+    
+    artists = []
+    if labels is not None:
+        if layer == 'density':
+            from matplotlib.colors import LinearSegmentedColormap
+            x_lim, y_lim = ax.get_xlim(), ax.get_ylim()
+            
+        for i, mode in enumerate(model.mode_list):
+            Zone = np.where(labels==i)[0]
+            if layer == 'density':
+                # The opacity of the mode color increases with the number of hours in each cell
+                cmap = LinearSegmentedColormap.from_list(mode,[mode_colors[mode]+(0.25,),mode_colors[mode]+(1,)])
+                artists.append(ax.hexbin(T_out[Zone],w_out[Zone],gridsize=gridsize,extent=x_lim+y_lim,mincnt=1,cmap=cmap,linewidths=0))
+                artists += ax.plot([],[],label=mode,color=mode_colors[mode],marker='h',ms=marker_size+4,ls='none') # Legend entry
+            else:
+                artists += ax.plot(T_out[Zone],w_out[Zone],label=mode,color=mode_colors[mode],marker='.',ms=marker_size,ls='none')
+        artists.append(ax.legend(loc='lower right',bbox_to_anchor=(1.6,0.15),frameon=False))
+        
+    for mode in model.mode_list[0:-1]:
+        legend = limits[mode]['legend']
+        if mode in model.legend_values:
+            legend = legend+" = "+model.legend_values[mode]
+        artists += ax2.plot(model.T_lim[mode],model.w_lim[mode],label=legend,color=limits[mode]['color'],lw=3)
+        
+    # Plot nominal indoor conditions
+    artists += ax2.plot([0,model.T_max],[model.w_in, model.w_in],'k--',label="$ω_{in,nom}$",lw=3)
+    
+    artists.append(ax2.legend(loc='upper left',frameon=False,fontsize=16))
+    return artists
+
+# Plots the limits of the operation modes on a psychrometric chart, with the hours of each mode if given
+def plot_modes(model,T_out=None,w_out=None,labels=None):
+    import matplotlib.pyplot as plt
+    
+    import plot_default
+    
+    # The default style only applies to this chart
+    with plt.rc_context(plot_default.rc_params()):
+        fig, ax, ax2 = chart_axes()
+        draw_modes(ax,ax2,model,T_out,w_out,labels)
+        plt.show()
+    return ax
+
+# Saves the charts of several results as images, the psychrometric chart being drawn only once
+# results = list of (model, T_out, w_out, labels), with T_out, w_out and labels set to None to plot the limits only
+def save_charts(results,file_paths,layer='points'):
+    import matplotlib
+    import matplotlib.image
+    
+    import plot_default
+    import psychrometric_diagram as psychro
+    
+    with matplotlib.rc_context(plot_default.rc_params()):
+        fig, ax, ax2 = chart_axes(display='no')
+        background = psychro.save_background(fig)
+        
+        for (model, T_out, w_out, labels), file_path in zip(results,file_paths):
+            artists = draw_modes(ax,ax2,model,T_out,w_out,labels,layer)
+            image = psychro.draw_on_background(fig,background,artists)
+            matplotlib.image.imsave(file_path,image)
+            
+            for artist in artists:
+                artist.remove()
+
+# If hourly = 'yes', the mode of each hour (uint8 labels, see classify) is also returned, aligned with the rows of climate_data
+def main(components=None,params=None,climate_data=None,chart='yes',hum='yes',verbose='yes',model=None,hourly='no'):
+    # Boundaries of the operation modes (independent from the climate)
+    if model is None:
+        with profiling.span('boundaries'):
+            model = get_boundary_model(components,params,hum)
+    mode_list = model.mode_list
+    component_dict = {mode: model.component_dict[mode].copy() for mode in mode_list}
+    
+    T_out, w_out, labels = None, None, None
+    if climate_data is not None:
+        T_out = np.asarray(climate_data['T_dry'],dtype=float)
+        w_out = np.asarray(climate_data['w'],dtype=float)
+        
+        with profiling.span('classification',len(T_out)):
+            labels, counts = classify(T_out,w_out,model)
+    
+    nb_hours = {} # Dictionnary containing the number of operating hours in each mode
     
     " ------------- Summary of operation mode hours ---------------- "
     if climate_data is not None:
-        for mode in mode_list:
-            cooling_zone, mode_zone, nb_hours_mode = zone_def(T_out,w_out,lim[mode],cooling_zone)
-            Zone[mode] = mode_zone
-            nb_hours[mode] = nb_hours_mode
+        for i, mode in enumerate(mode_list):
+            nb_hours[mode] = int(counts[i])
             
-            result = mode + ": " + str(nb_hours[mode]) + " hours"
-            print(result)
+            if verbose == 'yes':
+                result = mode + ": " + str(nb_hours[mode]) + " hours"
+                print(result)
     else:
         nb_hours = 0                
     
     " ------------- Plot (if asked) ---------------- "
     if chart == 'yes':
-        if climate_data is not None:
-            for mode in mode_list:
-                ax.plot(T_out[Zone[mode]],w_out[Zone[mode]],label=mode,color=mode_colors[mode],marker='.',ms=marker_size,ls='none')
-            ax.legend(loc='lower right',bbox_to_anchor=(1.6,0.15),frameon=False)
-            
-        ax2 = ax.twinx()
-        for mode in mode_list[0:-1]:
-            ax2.plot(T_lim[mode],w_lim[mode],label=limits[mode]['legend'],color=limits[mode]['color'],lw=3)
-            
-        # Plot nominal indoor conditions
-        ax2.plot([0,T_max],[w_in, w_in],'k--',label="$ω_{in,nom}$",lw=3)
-        
-        ax_ylim = ax.get_ylim()
-        ax2.set_ylim(ax_ylim[0],ax_ylim[1])
-        ax2.get_yaxis().set_visible(False)
-        ax2.legend(loc='upper left',frameon=False,fontsize=16)
-        
-        plt.show()
+        with profiling.span('chart'):
+            ax = plot_modes(model,T_out,w_out,labels)
+    else:
+        ax = []
     
+    if hourly == 'yes':
+        return nb_hours, component_dict, ax, labels
     return nb_hours, component_dict, ax
 
-        
\ No newline at end of file
@@ -8,22 +8,32 @@ Created on Mon Mar  3 08:59:38 2025
 import colors
 import matplotlib.pyplot as plt
 
+# Default parameters of the figures, to be used with plt.rc_context to avoid modifying the global rcParams
+def rc_params(color=None):
+    # Define new colors
+    if color is None:
+        color = colors.main()
+    new_colors = [color['main']['teal'], color['main']['green'], color['main']['orange'], color['main']['fushia'], color['main']['blue'], color['main']['purple'], color['main']['red']]
+    
+    params = {
+        'font.family': 'Times New Roman',       # Default font
+        'font.size': 18,                        # Default font size
+        'axes.facecolor': 'white',              # Background color of the axes
+        'axes.edgecolor': 'k',                  # Color of the axes box
+        'axes.grid': True,                      # Enable grid
+        'figure.figsize': (5,5),                # Default figure size
+        'lines.linewidth': 2,                   # Default line width
+        'axes.titlesize': 'large',              # Default title size
+        'axes.labelsize': 'medium',             # Default label size
+        'axes.prop_cycle': plt.cycler(color=new_colors) # Default line colors
+        }
+    return params
+
 def main():
     # Load colors
-    # Define new colors
     color = colors.main()
-    new_colors = [color['main']['teal'], color['main']['green'], color['main']['orange'], color['main']['fushia'], color['main']['blue'], color['main']['purple'], color['main']['red']]
     
     # Set default parameters
-    plt.rcParams['font.family'] = 'Times New Roman'     # Default font
-    plt.rcParams['font.size'] = 18                      # Default font size
-    plt.rcParams['axes.facecolor'] = 'white'            # Background color of the axes
-    plt.rcParams['axes.edgecolor'] = 'k'                # Color of the axes box
-    plt.rcParams['axes.grid'] = True                    # Enable grid
-    plt.rcParams['figure.figsize'] = (5,5)            # Default figure size
-    plt.rcParams['lines.linewidth'] = 2                 # Default line width
-    plt.rcParams['axes.titlesize'] = 'large'            # Default title size
-    plt.rcParams['axes.labelsize'] = 'medium'           # Default label size
-    plt.rcParams['axes.prop_cycle'] = plt.cycler(color=new_colors) # Default line colors
+    plt.rcParams.update(rc_params(color))
     
     return color
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 17:02:26 2026
+
+@author: Alanis Zeoli
+
+Objective: Optional instrumentation of the feasibility analysis, to find where
+the time of a run goes (boundaries, CoolProp calls, classification, chart)
+
+The instrumentation is disabled by default: span returns a shared empty
+context and step and count return immediately.
+
+Usage:
+    with profiling.profiled('trace.json') as report:
+        main.feasibility_analysis(...)
+    report['spans']     = list of the recorded spans (name, start and duration [s], depth, size of the arrays processed)
+    report['totals']    = total duration of the spans of each name [s]
+    report['counters']  = number of calls of each counted function (e.g. HAPropsSI)
+    The trace file (optional) can be opened in chrome://tracing or Perfetto.
+"""
+
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+
+enabled = False
+spans = [] # Recorded spans
+counters = {} # Number of calls of the counted functions
+stack = [] # Spans being recorded
+open_step = [None] # Step being recorded (see step)
+lock = threading.Lock()
+
+null_span = contextlib.nullcontext()
+
+class recorded_span():
+    __slots__ = ['name','size','start','depth']
+
+    def __init__(self,name,size=None):
+        self.name = name
+        self.size = size
+
+    def __enter__(self):
+        self.depth = len(stack)
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self,*exc):
+        end = time.perf_counter()
+        if open_step[0] is not None and open_step[0].depth > self.depth: # The last step of the span ends with it
+            step(None)
+        stack.pop()
+        spans.append({'name': self.name, 'start': self.start, 'duration': end-self.start, 'depth': self.depth, 'size': self.size})
+        return False
+
+# Records the duration of a block of code (with profiling.span(name,size):)
+def span(name,size=None):
+    if not enabled:
+        return null_span
+    return recorded_span(name,size)
+
+# Ends the step being recorded and starts a new one, used for consecutive steps that are not blocks of code (None to end the last step)
+def step(name):
+    if not enabled:
+        return
+    if open_step[0] is not None:
+        current = open_step[0]
+        open_step[0] = None
+        current.__exit__(None,None,None)
+    if name is not None:
+        open_step[0] = recorded_span(name).__enter__()
+
+# Increments a counter
+def count(name,n=1):
+    if enabled:
+        with lock:
+            counters[name] = counters.get(name,0)+n
+
+# Returns a function counting its calls in the counter name
+def counted(function,name=None):
+    if name is None:
+        name = function.__name__
+
+    @functools.wraps(function)
+    def wrapper(*args,**kwargs):
+        if enabled:
+            count(name)
+        return function(*args,**kwargs)
+    return wrapper
+
+def reset():
+    spans.clear()
+    counters.clear()
+    stack.clear()
+    open_step[0] = None
+
+def enable():
+    global enabled
+    reset()
+    enabled = True
+
+def disable():
+    global enabled
+    step(None)
+    enabled = False
+
+# Returns the recorded spans and counters
+def report():
+    origin = min([span['start'] for span in spans],default=0)
+    records = sorted(({**span, 'start': span['start']-origin} for span in spans),key=lambda span: span['start'])
+
+    totals = {}
+    for span in records:
+        totals[span['name']] = totals.get(span['name'],0)+span['duration']
+    return {'spans': records, 'totals': totals, 'counters': dict(counters)}
+
+# Writes the spans in the Chrome trace event format
+def write_trace(file_path,records=None):
+    if records is None:
+        records = report()
+    pid = os.getpid()
+
+    events = []
+    for span in records['spans']:
+        event = {'name': span['name'], 'ph': 'X', 'ts': span['start']*1e6, 'dur': span['duration']*1e6, 'pid': pid, 'tid': 0}
+        if span['size'] is not None:
+            event['args'] = {'size': span['size']}
+        events.append(event)
+    for name in records['counters']:
+        events.append({'name': name, 'ph': 'C', 'ts': 0, 'pid': pid, 'tid': 0, 'args': {'calls': records['counters'][name]}})
+
+    with open(file_path,'w') as file:
+        json.dump({'traceEvents': events},file)
+
+# Enables the instrumentation in a block of code and fills the report at the end of the block
+@contextlib.contextmanager
+def profiled(trace_file=None):
+    records = {}
+    enable()
+    try:
+        yield records
+    finally:
+        disable()
+        records.update(report())
+        if trace_file is not None:
+            write_trace(trace_file,records)
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 17:40:51 2026
+
+@author: Alanis Zeoli
+
+Objective: Memoized access to the humid air properties of CoolProp, so that
+identical scalar queries (saturation at T_su_min/T_su_max, wet bulb at w_in,
+indoor conditions, chart isolines...) are computed only once
+
+Inputs:
+    HAPropsSI: same inputs as CoolProp.CoolProp.HAPropsSI (output, 3 couples of input name and value)
+    maxsize: maximum number of results kept in memory, the least recently used are removed first (default = 4096)
+    tolerance: if given, dictionnary of the tolerance of each input name (e.g. {'T': 0.01, 'W': 1e-6, 'RH': 1e-4}),
+        the values of these inputs are rounded to a multiple of their tolerance before the call,
+        so that nearby queries share the same result (default = None, exact values).
+        The inputs that are not in the dictionnary are not rounded.
+
+HAPropsSI_array evaluates the same queries for arrays of input values, e.g.
+for the boundaries of many configurations at once (methodology.boundary_coefficients).
+The queries with a wet bulb input, which CoolProp solves iteratively and slowly,
+are solved for arrays with W_from_wet_bulb and T_from_wet_bulb from the same
+enthalpy balance as CoolProp, evaluated with its humid air enthalpy.
+
+Outputs:
+    stats: number of hits and misses of the cache, hit rate and current size
+"""
+
+import functools
+import importlib.metadata
+
+import numpy as np
+
+# Import own functions
+import profiling
+
+settings = {'maxsize': 4096, 'tolerance': None}
+T_triple = 273.16 # Triple point of water [K]
+
+# Returns the CoolProp module, only imported at the first query since its import takes several seconds
+def coolprop():
+    from CoolProp import CoolProp
+    return CoolProp
+
+# Returns the version of CoolProp, read from the installed package without importing it if possible
+def coolprop_version():
+    try:
+        return importlib.metadata.version('CoolProp')
+    except importlib.metadata.PackageNotFoundError:
+        return coolprop().get_global_param_string('version')
+
+# Calls to CoolProp, i.e. misses of the cache (counted if profiling is enabled)
+def coolprop_call(output,name1,value1,name2,value2,name3,value3):
+    return coolprop().HAPropsSI(output,name1,value1,name2,value2,name3,value3)
+coolprop_call = profiling.counted(coolprop_call,'HAPropsSI')
+
+def new_cache():
+    return functools.lru_cache(maxsize=settings['maxsize'])(coolprop_call)
+
+cached_call = new_cache()
+
+# Returns the tolerance of an input name of the cache (None if the values are not rounded)
+def input_tolerance(name):
+    tolerance = settings['tolerance']
+    if tolerance is None:
+        return None
+    return tolerance.get(name)
+
+# Rounds a value of the input name to its tolerance
+def rounded(name,value):
+    tolerance = input_tolerance(name)
+    if tolerance is None:
+        return float(value)
+    return round(float(value)/tolerance)*tolerance
+
+def HAPropsSI(output,name1,value1,name2,value2,name3,value3):
+    return cached_call(output,name1,rounded(name1,value1),name2,rounded(name2,value2),name3,rounded(name3,value3))
+
+# Modifies the size of the cache and the rounding tolerance (the cache is emptied)
+def configure(maxsize=None,tolerance=False):
+    global cached_call
+    if maxsize is not None:
+        settings['maxsize'] = maxsize
+    if tolerance is not False:
+        if tolerance is not None and not isinstance(tolerance,dict):
+            raise ValueError("The tolerance should be a dictionnary of the tolerance of each input name, e.g. {'T': 0.01, 'W': 1e-6, 'RH': 1e-4}")
+        settings['tolerance'] = None if tolerance is None else dict(tolerance)
+    cached_call = new_cache()
+
+def clear():
+    cached_call.cache_clear()
+
+def stats():
+    info = cached_call.cache_info()
+    calls = info.hits+info.misses
+    return {'hits': info.hits,
+            'misses': info.misses,
+            'hit_rate': info.hits/calls if calls > 0 else 0,
+            'size': info.currsize,
+            'maxsize': info.maxsize}
+
+# Rounds arrays of values of the input name to its tolerance (same as rounded)
+def rounded_array(name,values):
+    tolerance = input_tolerance(name)
+    if tolerance is None:
+        return values
+    return np.round(values/tolerance)*tolerance
+
+# Same as HAPropsSI for arrays of input values, each distinct query being computed once (without the cache)
+# The queries that CoolProp cannot solve (states out of its range of validity) return nan
+def HAPropsSI_array(output,name1,values1,name2,values2,name3,values3):
+    values = np.broadcast_arrays(*[np.asarray(value,dtype=float) for value in (values1,values2,values3)])
+    queries, index = np.unique(np.stack([rounded_array(name,value.ravel()) for name, value in zip((name1,name2,name3),values)],axis=1),axis=0,return_inverse=True)
+    results = np.full(len(queries),np.nan)
+
+    solvable = np.isfinite(queries).all(axis=1)
+    if solvable.any():
+        value1, value2, value3 = queries[solvable].T
+        profiling.count('HAPropsSI',len(value1))
+        try:
+            results[solvable] = coolprop().HAPropsSI(output,name1,value1,name2,value2,name3,value3)
+        except ValueError: # At least one query is out of range, they are computed one by one
+            for i in np.where(solvable)[0]:
+                try:
+                    results[i] = coolprop().HAPropsSI(output,name1,queries[i,0],name2,queries[i,1],name3,queries[i,2])
+                except ValueError:
+                    pass
+    return results[index.ravel()].reshape(values[0].shape)
+
+# Spec. enthalpy of liquid water at the temperature T [K] and the pressure P [Pa], nan below the triple point
+def liquid_enthalpy(T,P):
+    T = np.asarray(T,dtype=float)
+    h_w = np.full(T.shape,np.nan)
+    liquid = np.isfinite(T) & (T>=T_triple)
+    if liquid.any():
+        h_w[liquid] = coolprop().PropsSI('H','T',T[liquid],'P',P,'Water')
+    return h_w
+
+# Solves function(x) = target with secant iterations from x0 and x1 (function being almost linear)
+def secant(function,target,x0,x1,tol,max_iter=20):
+    f0 = function(x0)-target
+    for _ in range(max_iter):
+        f1 = function(x1)-target
+        with np.errstate(divide='ignore',invalid='ignore'):
+            step = np.where(f1 == f0,0,f1*(x1-x0)/(f1-f0))
+        x0, f0 = x1, f1
+        x1 = x1-step
+        if not np.any(np.abs(step) > tol):
+            break
+    return x1
+
+# Enthalpy balance of the wet bulb temperature T_wb [K] (same as CoolProp): h(T,W) + (W_s-W)*h_w = h_s
+# Returns W_s and h_s-W_s*h_w, nan below the triple point (solved with HAPropsSI_array instead)
+def wet_bulb_balance(T_wb,P):
+    W_s = HAPropsSI_array('W','T',T_wb,'RH',1,'P',P)
+    h_w = liquid_enthalpy(T_wb,P)
+    h_s = HAPropsSI_array('H','T',T_wb,'W',W_s,'P',P)
+    return h_w, h_s-W_s*h_w
+
+# Same as HAPropsSI('W','B',T_wb,'T',T,'P',P) for arrays, solved from the enthalpy balance
+def W_from_wet_bulb(T_wb,T,P):
+    T_wb, T = np.broadcast_arrays(np.asarray(T_wb,dtype=float),np.asarray(T,dtype=float))
+    h_w, balance = wet_bulb_balance(T_wb,P)
+    W = secant(lambda W: HAPropsSI_array('H','T',T,'W',W,'P',P)-W*h_w,balance,np.zeros(T.shape),np.full(T.shape,0.01),1e-12)
+
+    ice = ~np.isfinite(h_w)
+    if ice.any():
+        W[ice] = HAPropsSI_array('W','B',T_wb[ice],'T',T[ice],'P',P)
+    return W
+
+# Same as HAPropsSI('T','B',T_wb,'W',W,'P',P) for arrays, solved from the enthalpy balance
+def T_from_wet_bulb(T_wb,W,P):
+    T_wb, W = np.broadcast_arrays(np.asarray(T_wb,dtype=float),np.asarray(W,dtype=float))
+    h_w, balance = wet_bulb_balance(T_wb,P)
+    T = secant(lambda T: HAPropsSI_array('H','T',T,'W',W,'P',P),balance+W*h_w,T_wb,T_wb+10,1e-9)
+
+    ice = ~np.isfinite(h_w)
+    if ice.any():
+        T[ice] = HAPropsSI_array('T','B',T_wb[ice],'W',W[ice],'P',P)
+    return T
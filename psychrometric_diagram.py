@@ -18,11 +18,99 @@ Inputs:
     'Carrier'
     'IsoB' is a 'yes'/'no' string stating if iso-wet bulb lines should be
     drawn
+
+The iso-RH and iso-wet bulb lines are computed once for each set of inputs
+and kept in memory and in chart_cache. To draw many charts, the rendered
+chart can be saved with save_background and only the new lines are drawn
+on top of it with draw_on_background.
 """
 
+import functools
+import hashlib
+import os
+
 import numpy as np
 import matplotlib.pyplot as plt
-from CoolProp.CoolProp import HAPropsSI
+
+import profiling
+from properties import HAPropsSI # Memoized CoolProp calls
+
+cache_folder = 'chart_cache'
+
+# Computes the iso-RH and iso-wet bulb lines of a chart (T [°C] and w [kg/kg])
+def compute_isolines(T_min, T_max, isoB):
+    T_plot = np.arange(T_min, T_max+1, 1)
+    RH = np.arange(0.1, 1.1, 0.1)
+    
+    P = 101325  # Pressure in Pa
+
+    lines = {'RH': [], 'wb': []}
+    for i in range(len(RH)):
+        w_RH = np.array([HAPropsSI('W', 'T', T + 273.15, 'RH', RH[i], 'P', P) for T in T_plot])
+        lines['RH'].append((RH[i], T_plot, w_RH))
+
+    if isoB == 'yes':
+        T_wb = np.arange(0, T_plot[-1] + 1, 5)
+        for T_w in T_wb:
+            # Calculate wet bulb line
+            w_wb = [HAPropsSI('W', 'T', T_w + 273.15, 'RH', 1, 'P', P)]
+            T_db = [T_w]
+
+            method = 'w_min'
+            T_max = T_plot[-1]
+
+            for _ in range(2):
+                if method == 'w_min':
+                    w_wb.append(0.0005)
+                    T_db.append(HAPropsSI('T', 'B', T_w + 273.15, 'W', w_wb[-1], 'P', P) - 273.15)
+
+                    if T_db[-1] > T_max - 10:
+                        method = 'T_max'
+                else:
+                    T_db.append(T_max)
+                    w_wb.append(HAPropsSI('W', 'T', T_db[-1] + 273.15, 'B', T_w + 273.15, 'P', P))
+
+            lines['wb'].append((np.array(T_db), np.array(w_wb)))
+    return lines
+
+# Returns the isolines of a chart, computed only once per set of options (in memory and in cache_folder)
+@functools.lru_cache(maxsize=32)
+def isolines(units, chart_type, axes_value, isoB):
+    if chart_type == 'Carrier':
+        T_min, T_max = axes_value[0], axes_value[1]
+    else:
+        T_min, T_max = axes_value[2], axes_value[3]
+
+    # The lines only depend on the temperature range (units and chart type only change the way they are drawn)
+    key = repr((float(T_min), float(T_max), isoB))
+    path = os.path.join(cache_folder, 'isolines_'+hashlib.sha256(key.encode()).hexdigest()[:16]+'.npz')
+
+    try:
+        with np.load(path) as data:
+            nb_RH, nb_wb = data['size']
+            lines = {'RH': [(data['RH'][i], data['RH_T'][i], data['RH_w'][i]) for i in range(nb_RH)],
+                     'wb': [(data['wb_T'][i], data['wb_w'][i]) for i in range(nb_wb)]}
+        return lines
+    except (OSError, KeyError, ValueError):
+        pass
+
+    lines = compute_isolines(T_min, T_max, isoB)
+
+    try:
+        os.makedirs(cache_folder, exist_ok=True)
+        tmp_path = path+'.'+str(os.getpid())+'.tmp.npz'
+        np.savez(tmp_path,
+                 size=np.array([len(lines['RH']), len(lines['wb'])]),
+                 RH=np.array([line[0] for line in lines['RH']]),
+                 RH_T=np.array([line[1] for line in lines['RH']]),
+                 RH_w=np.array([line[2] for line in lines['RH']]),
+                 wb_T=np.array([line[0] for line in lines['wb']]).reshape(-1, 3),
+                 wb_w=np.array([line[1] for line in lines['wb']]).reshape(-1, 3))
+        os.replace(tmp_path, path)
+    except OSError: # The chart can still be drawn without the cache
+        pass
+    return lines
+
 
 def plot_diagram(ax=None,**kwargs):
     if ax is None:
@@ -72,51 +160,40 @@ def plot_diagram(ax=None,**kwargs):
         ax.set_xlabel(w_label)
         ax.set_xlim(axes_value[0], axes_value[1])
 
-    T_plot = np.arange(T_min, T_max+1, 1)
-
     # Check if iso-wet bulb should be drawn
     isoB = kwargs.get('IsoB', 'yes')
 
-    RH = np.arange(0.1, 1.1, 0.1)
-    
-    P = 101325  # Pressure in Pa
-
-    for i in range(len(RH)):
-        w_RH = [HAPropsSI('W', 'T', T + 273.15, 'RH', RH[i], 'P', P) for T in T_plot]
+    with profiling.span('isolines'):
+        lines = isolines(units, chart_type, tuple(axes_value), isoB)
 
-        linewidth = 3 if RH[i] == 1 else 0.5
-        linecolor = darkgrey if RH[i] == 1 else grey
-        linestyle = '-' if RH[i] == 1 else '--'
+    for RH, T_plot, w_RH in lines['RH']:
+        linewidth = 3 if RH == 1 else 0.5
+        linecolor = darkgrey if RH == 1 else grey
+        linestyle = '-' if RH == 1 else '--'
 
         if chart_type == 'Carrier':
-            ax.plot(T_plot, np.array(w_RH)*units, linestyle=linestyle, color=linecolor, linewidth=linewidth)
+            ax.plot(T_plot, w_RH*units, linestyle=linestyle, color=linecolor, linewidth=linewidth)
         else:
-            ax.plot(np.array(w_RH)*units, T_plot, linestyle=linestyle, color=linecolor, linewidth=linewidth)
+            ax.plot(w_RH*units, T_plot, linestyle=linestyle, color=linecolor, linewidth=linewidth)
 
-    if isoB == 'yes':
-        T_wb = np.arange(0, T_plot[-1] + 1, 5)
-        for T_w in T_wb:
-            # Calculate wet bulb line
-            w_wb = [HAPropsSI('W', 'T', T_w + 273.15, 'RH', 1, 'P', P)]
-            T_db = [T_w]
-
-            method = 'w_min'
-            T_max = T_plot[-1]
-
-            for _ in range(2):
-                if method == 'w_min':
-                    w_wb.append(0.0005)
-                    T_db.append(HAPropsSI('T', 'B', T_w + 273.15, 'W', w_wb[-1], 'P', P) - 273.15)
-
-                    if T_db[-1] > T_max - 10:
-                        method = 'T_max'
-                else:
-                    T_db.append(T_max)
-                    w_wb.append(HAPropsSI('W', 'T', T_db[-1] + 273.15, 'B', T_w + 273.15, 'P', P))
-
-            if chart_type == 'Carrier':
-                ax.plot(T_db, np.array(w_wb)*units, color=grey, linewidth=1)
-            else:
-                ax.plot(np.array(w_wb)*units, T_db, color=grey, linewidth=1)
+    for T_db, w_wb in lines['wb']:
+        if chart_type == 'Carrier':
+            ax.plot(T_db, w_wb*units, color=grey, linewidth=1)
+        else:
+            ax.plot(w_wb*units, T_db, color=grey, linewidth=1)
                 
-    return ax
\ No newline at end of file
+    return ax
+
+# Renders the figure once and returns its pixels, to be restored before drawing new artists
+def save_background(fig):
+    fig.canvas.draw()
+    return fig.canvas.copy_from_bbox(fig.bbox)
+
+# Restores the background of the figure, draws only the given artists on it and returns the image (RGBA array)
+def draw_on_background(fig, background, artists):
+    canvas = fig.canvas
+    canvas.restore_region(background)
+    for artist in artists:
+        fig.draw_artist(artist)
+    canvas.blit(fig.bbox)
+    return np.array(canvas.buffer_rgba())
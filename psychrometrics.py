@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 09:12:40 2026
+
+@author: Alanis Zeoli
+
+Objective: Vectorized psychrometric relations for moist air, used instead of
+per-hour HAPropsSI calls when whole climate files have to be processed
+
+Inputs:
+    T_dry = Dry temperature [°C] (scalar or array)
+    RH = Relative humidity [-]
+    T_wb = Wet bulb temperature [°C]
+    T_dp = Dew point temperature [°C]
+    P = Total pressure [Pa] (default = 101325 Pa)
+
+Method:
+    Saturation pressure: Hyland-Wexler correlations (ASHRAE Fundamentals) over
+    liquid water above the triple point and over ice below it.
+    Enhancement factor: Buck (1981) correlation, which accounts for the
+    non-ideal mixing taken into account by CoolProp.
+    Wet bulb: adiabatic saturation balance (ASHRAE Fundamentals).
+
+    Compared to HAPropsSI at 101325 Pa between -30°C and 50°C, the humidity
+    ratio computed from RH or T_dp is within 3e-6 kg/kg and the one computed
+    from T_wb is within 3e-5 kg/kg (checked by tests/test_psychrometrics.py).
+"""
+
+import numpy as np
+
+# Definition of constants
+P_atm = 101325
+to_K = 273.15
+T_triple = 0.01 # Triple point of water [°C]
+eps_w = 0.621945 # Ratio of the molar masses of water and dry air
+
+# Saturation pressure of water vapour [Pa] (Hyland-Wexler)
+def saturation_pressure(T):
+    T_K = np.asarray(T,dtype=float)+to_K
+
+    ln_p_water = (-5.8002206e3/T_K + 1.3914993 - 4.8640239e-2*T_K + 4.1764768e-5*T_K**2
+                  - 1.4452093e-8*T_K**3 + 6.5459673*np.log(T_K))
+    ln_p_ice = (-5.6745359e3/T_K + 6.3925247 - 9.677843e-3*T_K + 6.2215701e-7*T_K**2
+                + 2.0747825e-9*T_K**3 - 9.484024e-13*T_K**4 + 4.1635019*np.log(T_K))
+
+    p_ws = np.exp(np.where(T_K>=T_triple+to_K,ln_p_water,ln_p_ice))
+    return p_ws
+
+# Enhancement factor of water vapour in air [-] (Buck)
+def enhancement_factor(T,P=P_atm):
+    T = np.asarray(T,dtype=float)
+    P_hPa = P/100
+
+    f_water = 1.00072 + P_hPa*(3.2e-6 + 5.9e-10*T**2)
+    f_ice = 1.00022 + P_hPa*(3.83e-6 + 6.4e-10*T**2)
+
+    f = np.where(T>=T_triple,f_water,f_ice)
+    return f
+
+# Returns the spec. humidity based on the partial pressure of water vapour
+def w_from_p_w(p_w,P=P_atm):
+    w = eps_w*p_w/(P-p_w)
+    return w
+
+# Spec. humidity at saturation [kg/kg]
+def w_sat(T,P=P_atm):
+    p_w = enhancement_factor(T,P)*saturation_pressure(T)
+    return w_from_p_w(p_w,P)
+
+# Spec. humidity based on dry temperature and relative humidity
+def w_from_RH(T_dry,RH,P=P_atm):
+    p_w = np.asarray(RH,dtype=float)*enhancement_factor(T_dry,P)*saturation_pressure(T_dry)
+    return w_from_p_w(p_w,P)
+
+# Spec. humidity based on dew point temperature
+def w_from_T_dp(T_dp,P=P_atm):
+    return w_sat(T_dp,P)
+
+# Spec. humidity based on dry and wet bulb temperatures
+def w_from_T_wb(T_dry,T_wb,P=P_atm):
+    T_dry = np.asarray(T_dry,dtype=float)
+    T_wb = np.asarray(T_wb,dtype=float)
+    w_s = w_sat(T_wb,P)
+
+    # Above freezing, the water is evaporated from a liquid film, otherwise from ice
+    w_water = ((2501-2.326*T_wb)*w_s - 1.006*(T_dry-T_wb))/(2501 + 1.86*T_dry - 4.186*T_wb)
+    w_ice = ((2830-0.24*T_wb)*w_s - 1.006*(T_dry-T_wb))/(2830 + 1.86*T_dry - 2.1*T_wb)
+
+    w = np.where(T_wb>=0,w_water,w_ice)
+    return w
+
+# Spec. humidity of a whole dataset based on one of the humidity variables 'RH', 'T_wb' or 'T_dp'
+def humidity_ratio(T_dry,var,values,P=P_atm):
+    if var == 'RH':
+        w = w_from_RH(T_dry,values,P)
+    elif var == 'T_wb':
+        w = w_from_T_wb(T_dry,values,P)
+    elif var == 'T_dp':
+        w = w_from_T_dp(values,P)
+    else:
+        raise ValueError(var+" is not a valid humidity variable, it should be 'RH', 'T_wb' or 'T_dp'")
+    return w
+
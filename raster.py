@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 21:02:51 2026
+
+@author: Alanis Zeoli
+
+Objective: Rasterize the mode regions of a boundary model on the domain of the
+psychrometric chart (0-50 °C, 0-0.05 kg/kg), so that the hours of any climate
+are classified by an integer index lookup, the raster being saved and reused
+for all the climates analysed with the same design
+
+Inputs:
+    model: Boundary model (methodology.boundary_model or methodology.get_boundary_model)
+    dT, dw: Size of the cells (default = 0.01 °C and 1e-5 kg/kg, i.e. 5000 x 5000 cells)
+    folder: Folder of the saved rasters (default = raster_cache)
+
+Output:
+    mode_raster with the method classify(T_out,w_out), returning (labels, counts) as methodology.classify
+
+Exact classification:
+    Each mode region is an intersection of half-planes and the hours that are in
+    no mode are above all the limits, so a cell whose 4 corners are in the same
+    mode is entirely in this mode. The other cells are marked as crossed, and the
+    hours in a crossed cell or outside of the domain are classified with the
+    limits, which are saved with the raster.
+
+Usage:
+    lookup = raster.get_raster(methodology.get_boundary_model(components,params,hum))
+    labels, counts = lookup.classify(climate_data['T_dry'],climate_data['w'])
+"""
+
+import hashlib
+import os
+
+import numpy as np
+
+# Import own functions
+import methodology
+
+cache_folder = 'raster_cache'
+domain = (0,50,0,0.05) # T_min, T_max [°C], w_min, w_max [kg/kg]
+crossed = 255 # Label of the cells crossed by a limit
+
+"""
+Definition of a class for the raster of the mode regions
+
+Attributes:
+    mode_list, vertical, m, p, w_in, hum: Same as the boundary model (used for the crossed cells)
+    T_min, w_min, dT, dw: Origin and size of the cells
+    cells: Mode of each cell (nb_T x nb_w, crossed if the cell is crossed by a limit)
+"""
+class mode_raster():
+    def __init__(self,mode_list,vertical,m,p,w_in,hum,T_min,w_min,dT,dw,cells):
+        self.mode_list = list(mode_list)
+        self.vertical = np.asarray(vertical,dtype=bool)
+        self.m = np.asarray(m,dtype=float)
+        self.p = np.asarray(p,dtype=float)
+        self.w_in = float(w_in)
+        self.hum = hum
+        self.T_min = float(T_min)
+        self.w_min = float(w_min)
+        self.dT = float(dT)
+        self.dw = float(dw)
+        self.cells = cells
+
+    def classify(self,T_out,w_out):
+        T_out = np.asarray(T_out,dtype=float)
+        w_out = np.asarray(w_out,dtype=float)
+        nb_T, nb_w = self.cells.shape
+        nb_modes = len(self.mode_list)
+
+        i = np.floor((T_out-self.T_min)/self.dT)
+        j = np.floor((w_out-self.w_min)/self.dw)
+        inside = (i >= 0) & (i < nb_T) & (j >= 0) & (j < nb_w)
+
+        labels = np.full(len(T_out),crossed,dtype=np.uint8)
+        labels[inside] = self.cells.ravel()[i[inside].astype(np.int64)*nb_w+j[inside].astype(np.int64)]
+
+        exact = np.where(labels == crossed)[0]
+        if len(exact) > 0:
+            labels[exact] = methodology.classify(T_out[exact],w_out[exact],self)[0]
+
+        counts = np.bincount(labels,minlength=nb_modes+1)[:nb_modes]
+        return labels, counts
+
+    def save(self,path):
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder,exist_ok=True)
+        tmp_path = path+'.'+str(os.getpid())+'.tmp.npz'
+        try:
+            np.savez_compressed(tmp_path,mode_list=np.array(self.mode_list),vertical=self.vertical,m=self.m,p=self.p,
+                                w_in=self.w_in,hum=self.hum,cells=self.cells,
+                                grid=np.array([self.T_min,self.w_min,self.dT,self.dw]))
+            os.replace(tmp_path,path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+def load(path):
+    with np.load(path) as data:
+        T_min, w_min, dT, dw = data['grid']
+        return mode_raster(data['mode_list'].tolist(),data['vertical'],data['m'],data['p'],data['w_in'],str(data['hum']),
+                           T_min,w_min,dT,dw,data['cells'])
+
+# Returns the raster of a boundary model
+def rasterize(model,dT=0.01,dw=1e-5,block_size=256):
+    T_min, T_max, w_min, w_max = domain
+    nb_T = int(round((T_max-T_min)/dT))
+    nb_w = int(round((w_max-w_min)/dw))
+    T_edges = T_min+np.arange(nb_T+1)*dT
+    w_edges = w_min+np.arange(nb_w+1)*dw
+
+    # Mode of the corners of the cells, by blocks of temperatures to bound the memory used
+    corners = np.empty((nb_T+1,nb_w+1),dtype=np.uint8)
+    for start in range(0,nb_T+1,block_size):
+        T, w = np.meshgrid(T_edges[start:start+block_size],w_edges,indexing='ij')
+        corners[start:start+block_size] = methodology.classify(T.ravel(),w.ravel(),model)[0].reshape(T.shape)
+
+    cells = corners[:-1,:-1].copy()
+    uniform = (cells == corners[1:,:-1]) & (cells == corners[:-1,1:]) & (cells == corners[1:,1:])
+    cells[~uniform] = crossed
+
+    return mode_raster(model.mode_list,model.vertical,model.m,model.p,model.w_in,model.hum,T_min,w_min,dT,dw,cells)
+
+# Returns the path of the saved raster of a boundary model
+def raster_path(model,dT=0.01,dw=1e-5,folder=cache_folder):
+    digest = hashlib.sha256()
+    digest.update(repr((list(model.mode_list),model.hum,float(model.w_in),domain,float(dT),float(dw))).encode())
+    for values in [model.vertical,model.m,model.p]:
+        digest.update(np.ascontiguousarray(values,dtype=np.float64).tobytes())
+    return os.path.join(folder,'raster_'+digest.hexdigest()[:16]+'.npz')
+
+rasters = {} # Rasters loaded in this process
+
+# Returns the raster of a boundary model, loaded from the folder if it has already been computed
+def get_raster(model,dT=0.01,dw=1e-5,folder=cache_folder):
+    path = raster_path(model,dT,dw,folder)
+    if path in rasters:
+        return rasters[path]
+
+    try:
+        raster = load(path)
+    except (OSError,KeyError,ValueError):
+        raster = rasterize(model,dT,dw)
+        try:
+            raster.save(path)
+        except OSError: # The raster can still be used without being saved
+            pass
+
+    rasters[path] = raster
+    return raster
+
+# Classifies the hours of several climates against one design, returns the number of hours in each mode of each climate
+def classify_climates(climates,model,dT=0.01,dw=1e-5,folder=cache_folder):
+    raster = get_raster(model,dT,dw,folder)
+    nb_hours = {}
+    for name in climates:
+        counts = raster.classify(climates[name]['T_dry'],climates[name]['w'])[1]
+        nb_hours[name] = {mode: int(counts[i]) for i, mode in enumerate(raster.mode_list)}
+    return nb_hours
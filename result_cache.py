@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 19:58:03 2026
+
+@author: Alanis Zeoli
+
+Objective: Keep the results of the feasibility analysis on disk (SQLite), so
+that a combination of climate data, components and parameters that has already
+been evaluated is never computed again, across sessions and processes
+
+Key of a result: hash of the arrays T_dry and w, of the type and effectiveness
+of each component, of the resolved parameters, of hum and of the rounding
+tolerance of the CoolProp queries (properties.settings).
+
+Stored values: nb_hours_modes, component_dict and, if asked, the mode of each hour (compressed uint8 labels).
+
+Invalidation: each result records the version of the methodology (hash of the
+source of methodology.py, boundary_solver.py and properties.py, and version of
+CoolProp), the results of other versions are removed when the store is opened.
+
+Eviction: when the stored results exceed max_size bytes, the least recently
+used ones are removed.
+
+Usage:
+    nb_hours_modes, component_dict = result_cache.cached_main(components,params,climate_data)
+    nb_hours_modes = result_cache.cached_feasibility_analysis(climate='4A',period='future')
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import zlib
+
+import numpy as np
+
+# Import own functions
+import main as feasibility
+import methodology
+import properties
+
+default_path = 'results_cache.sqlite'
+default_max_size = 256*1024**2 # [bytes]
+
+# Returns the hash of the source files of the methodology and of the version of CoolProp, changing when the methodology is modified
+def methodology_version():
+    digest = hashlib.sha256()
+    for module in ['methodology.py','boundary_solver.py','properties.py']:
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)),module),'rb') as file:
+            digest.update(file.read())
+    digest.update(properties.coolprop_version().encode())
+    return digest.hexdigest()[:16]
+
+# Returns the hash of a result
+def result_key(T_out,w_out,components,params,hum='yes'):
+    digest = hashlib.sha256()
+    for values in [T_out,w_out]:
+        digest.update(np.ascontiguousarray(values,dtype=np.float64).tobytes())
+        digest.update(b'|')
+    configuration = {'components': sorted((name,components[name].type,components[name].epsilon) for name in components),
+                     'params': sorted((key,float(params[key])) for key in params),
+                     'hum': hum,
+                     'tolerance': sorted(properties.settings['tolerance'].items()) if properties.settings['tolerance'] else None}
+    digest.update(json.dumps(configuration).encode())
+    return digest.hexdigest()
+
+"""
+Definition of a class for the on-disk store of results
+
+Inputs:
+    path: Path of the SQLite database (default = results_cache.sqlite)
+    max_size: Maximum size of the stored results [bytes] (default = 256 MB)
+
+Methods:
+    get: returns (nb_hours_modes, component_dict, labels) for a key, None if the result is not stored (labels is None if not stored)
+    put: stores a result
+    clear: removes all the results
+"""
+class result_store():
+    def __init__(self,path=default_path,max_size=default_max_size):
+        self.path = path
+        self.max_size = max_size
+        self.version = methodology_version()
+
+        self.connection = sqlite3.connect(path,timeout=30)
+        with self.connection:
+            self.connection.execute("""CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                version TEXT,
+                nb_hours TEXT,
+                component_dict TEXT,
+                labels BLOB,
+                size INTEGER,
+                last_access REAL)""")
+            self.connection.execute("DELETE FROM results WHERE version != ?",(self.version,))
+
+    def get(self,key,labels=False):
+        row = self.connection.execute("SELECT nb_hours, component_dict, labels FROM results WHERE key = ? AND version = ?",(key,self.version)).fetchone()
+        if row is None or (labels and row[2] is None):
+            return None
+
+        with self.connection:
+            self.connection.execute("UPDATE results SET last_access = ? WHERE key = ?",(time.time(),key))
+
+        mode_labels = None
+        if row[2] is not None:
+            mode_labels = np.frombuffer(zlib.decompress(row[2]),dtype=np.uint8)
+        return json.loads(row[0]), json.loads(row[1]), mode_labels
+
+    def put(self,key,nb_hours,component_dict,labels=None):
+        nb_hours = json.dumps(nb_hours)
+        component_dict = json.dumps(component_dict)
+        blob = None if labels is None else zlib.compress(np.ascontiguousarray(labels,dtype=np.uint8).tobytes())
+        size = len(nb_hours)+len(component_dict)+(0 if blob is None else len(blob))
+
+        with self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO results VALUES (?,?,?,?,?,?,?)",
+                                    (key,self.version,nb_hours,component_dict,blob,size,time.time()))
+        self.evict()
+
+    # Removes the least recently used results until the size of the store is below max_size
+    def evict(self):
+        total = self.connection.execute("SELECT COALESCE(SUM(size),0) FROM results").fetchone()[0]
+        if total <= self.max_size:
+            return
+
+        removed = []
+        for key, size in self.connection.execute("SELECT key, size FROM results ORDER BY last_access"):
+            if total <= self.max_size:
+                break
+            removed.append((key,))
+            total = total-size
+        with self.connection:
+            self.connection.executemany("DELETE FROM results WHERE key = ?",removed)
+
+    def clear(self):
+        with self.connection:
+            self.connection.execute("DELETE FROM results")
+
+    def close(self):
+        self.connection.close()
+
+stores = {} # Stores opened in this process
+
+def get_store(path=default_path,max_size=default_max_size):
+    if path not in stores:
+        stores[path] = result_store(path,max_size)
+    return stores[path]
+
+# Same as methodology.main without chart, the results being taken from the store when possible
+def cached_main(components,params,climate_data,hum='yes',hourly='no',store=None):
+    if store is None:
+        store = get_store()
+
+    T_out = np.asarray(climate_data['T_dry'],dtype=float)
+    w_out = np.asarray(climate_data['w'],dtype=float)
+    key = result_key(T_out,w_out,components,params,hum)
+
+    result = store.get(key,labels=hourly == 'yes')
+    if result is None:
+        output = methodology.main(components,params,{'T_dry': T_out, 'w': w_out},chart='no',hum=hum,verbose='no',hourly=hourly)
+        labels = output[3] if hourly == 'yes' else None
+        store.put(key,output[0],output[1],labels)
+        result = (output[0],output[1],labels)
+
+    nb_hours, component_dict, labels = result
+    if hourly == 'yes':
+        return nb_hours, component_dict, labels
+    return nb_hours, component_dict
+
+# Same as main.feasibility_analysis without chart, the results being taken from the store when possible
+def cached_feasibility_analysis(meteo_file_path=None,climate=None,period='present',climate_data=None,components=None,params=None,hum='yes',verbose='yes',store=None):
+    climate_data = feasibility.load_climate_data(meteo_file_path,climate,period,climate_data,columns=['T_dry','w'])
+    if climate_data is None:
+        return
+    nb_data = len(climate_data['T_dry'])
+
+    if components is None:
+        components = feasibility.default_components()
+    params = feasibility.resolve_params(None if params is None else dict(params))
+
+    nb_hours_modes, component_dict = cached_main(components,params,climate_data,hum,store=store)
+
+    if verbose == 'yes':
+        for mode in nb_hours_modes:
+            print(mode + ": " + str(nb_hours_modes[mode]) + " hours")
+
+        mode = feasibility.recommended_mode(nb_hours_modes,component_dict,nb_data)
+        if mode == "Active cooling":
+            print("Active cooling is necessary to guarantee indoor thermal comfort.")
+        else:
+            print("The components that are recommended to be added in the system are "+str(component_dict[mode])+" to guarantee a 98% thermal comfort.")
+    return nb_hours_modes
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 16:05:44 2026
+
+@author: Alanis Zeoli
+
+Objective: Operation schedules built from the mode of each hour, for energy
+models and operational studies
+
+Inputs:
+    labels: Mode of each row of the climate data, as returned by methodology.classify
+        (uint8 index in mode_list, len(mode_list) for the rows in no mode)
+    nb_modes: Number of operation modes (len(mode_list))
+    climate_data: Climate data with the calendar columns MM (month), DD (day) and hh (hour)
+
+Outputs:
+    calendar_counts: Array (12 months x 24 hours x nb_modes) of the number of rows in each mode
+    daily_counts: Array (12 months x 31 days x nb_modes) of the number of rows in each mode
+    run_lengths: Run-length encoding of the labels (mode, first row and number of rows of each run)
+    mode_switches: Number of changes of operation mode
+"""
+
+import numpy as np
+
+# Returns the number of rows in each mode for each combination of values of the keys (0-based integers smaller than sizes)
+def aggregate(labels,keys,sizes,nb_modes):
+    labels = np.asarray(labels)
+    index = np.zeros(len(labels),dtype=np.int64)
+    for key, size in zip(keys,sizes):
+        index = index*size + np.asarray(key,dtype=np.int64)
+    index = index*(nb_modes+1) + labels
+
+    counts = np.bincount(index,minlength=int(np.prod(sizes))*(nb_modes+1))
+    return counts.reshape(tuple(sizes)+(nb_modes+1,))[...,:nb_modes]
+
+# Number of rows in each mode per month and hour of the day
+def calendar_counts(labels,climate_data,nb_modes):
+    month = np.asarray(climate_data['MM'],dtype=np.int64)-1
+    hour = np.asarray(climate_data['hh'],dtype=np.int64)
+    return aggregate(labels,[month,hour],[12,24],nb_modes)
+
+# Number of rows in each mode per month and day of the month
+def daily_counts(labels,climate_data,nb_modes):
+    month = np.asarray(climate_data['MM'],dtype=np.int64)-1
+    day = np.asarray(climate_data['DD'],dtype=np.int64)-1
+    return aggregate(labels,[month,day],[12,31],nb_modes)
+
+# Returns the mode, the first row and the number of rows of each run of consecutive rows in the same mode
+def run_lengths(labels):
+    labels = np.asarray(labels)
+    if len(labels) == 0:
+        return labels[:0], np.zeros(0,dtype=np.int64), np.zeros(0,dtype=np.int64)
+
+    starts = np.concatenate(([0],np.flatnonzero(labels[1:]!=labels[:-1])+1))
+    lengths = np.diff(np.append(starts,len(labels)))
+    return labels[starts], starts, lengths
+
+# Returns the labels from their run-length encoding
+def expand_runs(modes,lengths):
+    return np.repeat(np.asarray(modes,dtype=np.uint8),lengths)
+
+# Number of changes of operation mode
+def mode_switches(labels):
+    labels = np.asarray(labels)
+    return int(np.count_nonzero(labels[1:]!=labels[:-1]))
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 14:52:08 2026
+
+@author: Alanis Zeoli
+
+Objective: Perform the feasibility analysis on long or high-resolution weather
+records (multi-year, sub-hourly) by reading them in chunks, with a memory use
+that does not depend on the length of the record
+
+Inputs:
+    meteo_file_path: Path of the meteorological file (see main.py for the columns)
+    chunks: Alternative way to give the climate data, as an iterable of dataframes with the same columns
+    components, params, hum: Same as in main.py (default = main.default_components() and the default parameters)
+    model: Boundary model (methodology.boundary_model), built from components, params and hum if not given
+    period: Column (e.g. 'MM') or function returning one key per row of a chunk (e.g. the year), used to tally the modes per period (default = None)
+    chunk_size: Number of rows read at once from the file (default = 100 000)
+    sep: Separator of the meteorological file (default = ',')
+
+Output:
+    nb_hours: Dictionnary containing the number of rows in each mode (hours for hourly data)
+    tallies: Dataframe with one row per period and one column per mode (None if no period is given)
+"""
+
+import numpy as np
+import pandas as pd
+
+# Import own functions
+import main as feasibility
+import methodology
+import psychrometrics
+
+# Returns the chunks of a meteorological file, with only the columns that are needed and the spec. humidity w
+def read_chunks(meteo_file_path,columns=None,chunk_size=100000,sep=','):
+    header = pd.read_csv(meteo_file_path,sep=sep,nrows=0).columns
+    humidity = None
+    if 'w' not in header:
+        for var in ['RH','T_wb','T_dp']:
+            if var in header:
+                humidity = var
+                break
+        if humidity is None:
+            raise KeyError("There is no column w, RH, T_wb or T_dp in "+meteo_file_path)
+
+    usecols = set(['T_dry','w' if humidity is None else humidity])
+    if columns is not None:
+        usecols.update(columns)
+
+    for chunk in pd.read_csv(meteo_file_path,sep=sep,usecols=lambda col: col in usecols,chunksize=chunk_size):
+        if humidity is not None:
+            chunk['w'] = psychrometrics.humidity_ratio(chunk['T_dry'].to_numpy(),humidity,chunk[humidity].to_numpy())
+        yield chunk
+
+def stream_analysis(meteo_file_path=None,chunks=None,components=None,params=None,hum='yes',model=None,period=None,chunk_size=100000,sep=','):
+    # Boundaries of the operation modes, built once for the whole record
+    if model is None:
+        if components is None:
+            components = feasibility.default_components()
+        params = feasibility.resolve_params(None if params is None else dict(params))
+        model = methodology.get_boundary_model(components,params,hum)
+    mode_list = model.mode_list
+    nb_modes = len(mode_list)
+
+    if chunks is None:
+        columns = [period] if isinstance(period,str) else None
+        chunks = read_chunks(meteo_file_path,columns,chunk_size,sep)
+
+    counts = np.zeros(nb_modes,dtype=np.int64)
+    period_counts = {} # Counts of each period, only as many rows as periods
+
+    for chunk in chunks:
+        labels, chunk_counts = methodology.classify(chunk['T_dry'].to_numpy(),chunk['w'].to_numpy(),model)
+        counts += chunk_counts
+
+        if period is not None:
+            keys = chunk[period].to_numpy() if isinstance(period,str) else np.asarray(period(chunk))
+            values, index = np.unique(keys,return_inverse=True)
+
+            # One bincount gives the counts of every period of the chunk
+            tally = np.bincount(index*(nb_modes+1)+labels,minlength=len(values)*(nb_modes+1)).reshape(len(values),nb_modes+1)
+            for value, row in zip(values.tolist(),tally[:,:nb_modes]):
+                if value in period_counts:
+                    period_counts[value] += row
+                else:
+                    period_counts[value] = row.astype(np.int64)
+
+    nb_hours = {mode: int(counts[i]) for i, mode in enumerate(mode_list)}
+
+    tallies = None
+    if period is not None:
+        keys = sorted(period_counts)
+        tallies = pd.DataFrame([period_counts[key] for key in keys],index=keys,columns=mode_list)
+        tallies.index.name = period if isinstance(period,str) else 'period'
+    return nb_hours, tallies
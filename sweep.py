@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 10:31:02 2026
+
+@author: Alanis Zeoli
+
+Objective: Perform the feasibility analysis on every combination of climate
+files, sets of components and operational parameters, in parallel
+
+Inputs:
+    climates: List of climate zones taken from climate_zones.cities (default = all zones if no meteo_files are given)
+    periods: List of periods taken from climate_zones.TMYs (default = all periods)
+    meteo_files: List of paths of meteorological files analysed in addition to the climate zones
+    components: List of dictionnaries of components (default = [main.default_components()])
+    params: Operational parameters (see main.py), either a dictionnary of lists of values that are all combined together or a list of dictionnaries (default = [{}])
+    hum: 'yes' if the humidification of the building is accepted (default = 'yes')
+    workers: Number of worker processes (default = number of CPUs, 1 = everything runs in the current process)
+    chunk_size: Number of configurations evaluated by a worker on the same climate file
+
+Output:
+    results: Dataframe with one row per run and operation mode, containing:
+        run = index of the run
+        climate, period, meteo_file_path = climate data of the run
+        variant = index of the set of components in the list of components
+        epsilon_<name> = effectiveness of each component of the set
+        <param> = value of each operational parameter, once completed with the default values
+        mode, hours = operation mode and number of hours in this mode
+        recommended_mode, recommended_components = first mode guaranteeing the indoor thermal comfort and its components
+"""
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+# Import own functions
+import climate_store
+import climate_zones
+import main as feasibility
+import methodology
+
+# Returns the list of parameter dictionnaries to evaluate
+def param_sets(params=None):
+    if params is None:
+        return [{}]
+
+    if isinstance(params,dict): # Grid of parameters
+        keys = list(params.keys())
+        values = [params[key] if isinstance(params[key],(list,tuple)) else [params[key]] for key in keys]
+        return [dict(zip(keys,combination)) for combination in itertools.product(*values)]
+
+    return [dict(param) for param in params]
+
+# Returns the list of climate cases to evaluate
+def climate_cases(climates=None,periods=None,meteo_files=None):
+    if climates is None and meteo_files is None:
+        climates = list(climate_zones.cities.keys())
+    if periods is None:
+        periods = list(climate_zones.TMYs.keys())
+
+    cases = []
+    for climate in climates or []:
+        for period in periods:
+            cases.append({'climate': climate,
+                          'period': period,
+                          'meteo_file_path': climate_zones.meteo_file_path(climate,period)})
+
+    for meteo_file_path in meteo_files or []:
+        cases.append({'climate': None,
+                      'period': None,
+                      'meteo_file_path': meteo_file_path})
+    return cases
+
+# Evaluates a list of configurations on a single climate file
+def run_case(case,runs,hum='yes'):
+    # Memory-mapped columns, shared by all the workers through the page cache
+    try:
+        climate_data = climate_store.load(case['meteo_file_path'],['T_dry','w'])
+    except OSError:
+        print("Error: File "+case['meteo_file_path']+" cannot be found.")
+        return []
+    nb_data = len(climate_data['T_dry'])
+
+    rows = []
+    for run, variant, components, params in runs:
+        params = feasibility.resolve_params(dict(params))
+        nb_hours_modes, component_dict, ax = methodology.main(components,params,climate_data,chart='no',hum=hum,verbose='no')
+        mode_rec = feasibility.recommended_mode(nb_hours_modes,component_dict,nb_data)
+
+        description = dict(case)
+        description['run'] = run
+        description['variant'] = variant
+        for name in components:
+            description['epsilon_'+name] = components[name].epsilon
+        description.update(params)
+
+        for mode in nb_hours_modes:
+            row = dict(description)
+            row['mode'] = mode
+            row['hours'] = nb_hours_modes[mode]
+            row['recommended_mode'] = mode_rec
+            row['recommended_components'] = ', '.join(component_dict[mode_rec])
+            rows.append(row)
+    return rows
+
+# Returns the tasks of a sweep, each one being a chunk of configurations (run, variant, components, params) on one climate file
+# The binary copies of the climate files are built once, before the workers read them
+def sweep_tasks(climates=None,periods=None,meteo_files=None,components=None,params=None,chunk_size=50):
+    if components is None:
+        components = [feasibility.default_components()]
+    elif isinstance(components,dict):
+        components = [components]
+
+    cases = climate_cases(climates,periods,meteo_files)
+    variants = list(itertools.product(enumerate(components),param_sets(params)))
+
+    tasks = []
+    run = 0
+    for case in cases:
+        runs = []
+        for (variant, component_set), param_set in variants:
+            runs.append((run,variant,component_set,param_set))
+            run = run+1
+
+        for i in range(0,len(runs),chunk_size):
+            tasks.append((case,runs[i:i+chunk_size]))
+
+    for case in cases:
+        try:
+            climate_store.update(case['meteo_file_path'])
+        except OSError:
+            pass
+    return tasks
+
+# Runs function(case,runs,*args) on every task, in parallel if workers > 1, and returns all the rows in the order of the tasks
+def run_tasks(function,tasks,args=(),workers=None):
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    rows = []
+    if workers == 1 or len(tasks) <= 1:
+        for case, runs in tasks:
+            rows.extend(function(case,runs,*args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(function,case,runs,*args) for case, runs in tasks]
+            for future in futures:
+                rows.extend(future.result())
+    return rows
+
+def run_sweep(climates=None,periods=None,meteo_files=None,components=None,params=None,hum='yes',workers=None,chunk_size=50):
+    # Each task evaluates a chunk of configurations on one climate file
+    tasks = sweep_tasks(climates,periods,meteo_files,components,params,chunk_size)
+    rows = run_tasks(run_case,tasks,(hum,),workers)
+
+    results = pd.DataFrame(rows)
+    return results
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+"""
+Configuration of the tests: the modules of the repository are imported from its
+root folder, which is also the working directory (relative paths of Meteo/)
+"""
+
+import os
+import sys
+
+import pytest
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root not in sys.path:
+    sys.path.insert(0,root)
+
+@pytest.fixture(autouse=True)
+def repository_folder(monkeypatch):
+    monkeypatch.chdir(root)
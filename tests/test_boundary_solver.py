@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of boundary_solver.py: the intersections with the saturation curve are
+the ones of the previous bisection loop of methodology.py and converge to the
+given tolerance, and the arrays of lines give the scalar intersections
+"""
+
+import numpy as np
+import pytest
+
+import boundary_solver
+import main as feasibility
+import methodology
+
+# Previous bisection loop of methodology.curve_intersection (stops when the temperatures differ by less than 1e-2 °C)
+def bisection(m,p):
+    T_min = 0
+    T_max = 50
+    T_dp = 0
+    T = -100
+
+    while abs(T_dp-T)>1e-2:
+        T = (T_min+T_max)/2
+        w = m*T+p
+        T_dp = boundary_solver.saturation(w)
+
+        if T_dp<T:
+            T_max = T
+        else:
+            T_min = T
+    return T, w
+
+# Lines of the DECS limit for several effectiveness values of the desiccant wheel and regeneration temperatures
+def DECS_lines():
+    lines = []
+    for epsilon in [0.5,0.7,0.85,0.95]:
+        for T_reg in [50,60,70]:
+            components = feasibility.default_components()
+            components['DW'].epsilon = epsilon
+            model = methodology.get_boundary_model(components,feasibility.resolve_params({'T_reg': T_reg}))
+            lines.append(model.lim['DECS'])
+    return np.array(lines)
+
+def test_matches_previous_bisection():
+    lines = DECS_lines()
+    T, w = boundary_solver.curve_intersection(lines[:,0],lines[:,1])
+
+    for i, (m, p) in enumerate(lines):
+        T_ref, w_ref = bisection(m,p)
+        assert abs(T[i]-T_ref) < 1e-2
+        assert abs(w[i]-w_ref) < 1e-5
+
+    # The end point of the DECS limit of the boundary model is the same intersection
+    model = methodology.get_boundary_model(feasibility.default_components(),feasibility.resolve_params({}))
+    assert np.isclose(min(model.T_lim['DECS']),bisection(*model.lim['DECS'])[0],atol=1e-2)
+
+@pytest.mark.parametrize('tol',[1e-2,1e-6,1e-9])
+def test_converges_to_tolerance(tol):
+    rng = np.random.default_rng(0)
+    m = rng.uniform(-8e-4,-1e-4,200)
+    p = 0.005-40*m # Lines through (40, 0.005), below the saturation curve at 50 °C and above it at 0 °C
+
+    T, w = boundary_solver.curve_intersection(m,p,tol=tol)
+    assert np.all((T>0) & (T<50))
+    assert np.all(np.abs(boundary_solver.saturation(w)-T) <= tol)
+    assert np.allclose(w,m*T+p,rtol=0,atol=1e-15)
+
+def test_lines_intersection():
+    lines = DECS_lines()
+    others = np.column_stack((np.full(len(lines),-1e-4),np.linspace(0.008,0.012,len(lines))))
+    T, w = boundary_solver.lines_intersection(lines[:,0],lines[:,1],others[:,0],others[:,1])
+
+    for i in range(len(lines)):
+        assert (T[i], w[i]) == methodology.lines_intersection(lines[i],others[i])
+    assert np.allclose(w,others[:,0]*T+others[:,1])
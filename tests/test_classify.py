@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of methodology.classify: the hours are in the same modes as with the
+first-match procedure of zone_def applied mode after mode, with and without
+humidification of the building, including when the first modes are skipped
+"""
+
+import numpy as np
+import pytest
+
+import climate_store
+import climate_zones
+import main as feasibility
+import methodology
+
+# Mode of each hour with zone_def, the hours in no mode are labelled with the number of modes
+def zone_def_labels(T_out,w_out,model):
+    nb_data = len(T_out)
+    labels = np.full(nb_data,len(model.mode_list))
+
+    if model.hum == 'yes':
+        cooling_zone = np.arange(nb_data)
+    else:
+        cooling_zone = np.where(w_out<model.w_in)[0]
+
+    for i, mode in enumerate(model.mode_list):
+        cooling_zone, mode_zone, nb_hours_mode = methodology.zone_def(T_out,w_out,model.lim[mode],cooling_zone)
+        labels[mode_zone] = i
+    return labels
+
+@pytest.mark.parametrize('hum',['yes','no'])
+def test_classify_matches_zone_def(hum):
+    climate_data = climate_store.load(climate_zones.meteo_file_path('2A','present'),['T_dry','w'])
+    T_out, w_out = climate_data['T_dry'], climate_data['w']
+    model = methodology.get_boundary_model(feasibility.default_components(),feasibility.resolve_params({}),hum)
+
+    labels, counts = methodology.classify(T_out,w_out,model)
+    expected = zone_def_labels(T_out,w_out,model)
+    assert np.array_equal(labels,expected)
+    assert list(counts) == [np.sum(expected==i) for i in range(len(model.mode_list))]
+
+    nb_hours = methodology.main(feasibility.default_components(),feasibility.resolve_params({}),climate_data,chart='no',hum=hum,verbose='no')[0]
+    assert [nb_hours[mode] for mode in model.mode_list] == list(counts)
+
+    # The hours in the first mode classified again are in the same modes
+    for first_mode in range(len(model.mode_list)):
+        hours = np.where(labels>=first_mode)[0]
+        assert np.array_equal(methodology.classify(T_out[hours],w_out[hours],model,first_mode=first_mode)[0],labels[hours])
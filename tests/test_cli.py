@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of cli.py: the components of a spec file get the default effectiveness
+of their type, and the invalid components, missing spec files and unmatched
+meteorological files are reported before any run
+"""
+
+import json
+
+import pytest
+
+import cli
+
+def write_spec(tmp_path,spec):
+    spec_file = tmp_path/'spec.json'
+    spec_file.write_text(json.dumps(spec))
+    return str(spec_file)
+
+def test_default_epsilon(tmp_path):
+    spec_file = write_spec(tmp_path,{'components': {'DEC': {'type': 'DEC'}, 'IEC': {'type': 'IEC'}, 'DW': {'type': 'DW', 'epsilon': 0.7}}})
+    components = cli.read_spec(spec_file)[0][0]
+
+    assert components['DEC'].epsilon == 0.85
+    assert components['IEC'].epsilon == 0.75
+    assert components['DW'].epsilon == 0.7
+
+@pytest.mark.parametrize('description',[{'epsilon': 0.8}, {'type': 'D_IEC'}, {'type': 'DEC', 'epsilon': 1.2}, {'type': 'DEC', 'epsilon': '0.8'}])
+def test_invalid_component(tmp_path,description):
+    spec_file = write_spec(tmp_path,{'components': {'DEC': description}})
+    with pytest.raises(ValueError):
+        cli.read_spec(spec_file)
+
+def test_invalid_spec_stops_the_run(tmp_path,capsys):
+    spec_file = write_spec(tmp_path,{'components': {'DEC': {'type': 'XYZ'}}})
+    assert cli.main(['--climates','2A','--spec',spec_file,'--no-chart','--output',str(tmp_path/'results.csv')]) == 2
+    assert capsys.readouterr().out.startswith("Error: XYZ is not a valid type")
+    assert not (tmp_path/'results.csv').exists()
+
+def test_missing_spec_stops_the_run(tmp_path,capsys):
+    spec_file = str(tmp_path/'missing.json')
+    assert cli.main(['--climates','2A','--spec',spec_file,'--no-chart','--output',str(tmp_path/'results.csv')]) == 2
+    assert capsys.readouterr().out.startswith("Error: File "+spec_file+" cannot be read")
+    assert not (tmp_path/'results.csv').exists()
+
+def test_unmatched_files_stop_the_run(tmp_path,capsys):
+    pattern = str(tmp_path/'*.csv')
+    assert cli.main(['--files',pattern,'--no-chart','--output',str(tmp_path/'results.csv')]) == 2
+    assert capsys.readouterr().out == "Error: No meteorological file matches "+pattern+"\n"
+    assert not (tmp_path/'results.csv').exists()
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of climate_files_management.py: the preprocessing can be run any number
+of times, the relative humidity in % is only converted once, and a failed write
+leaves the original file untouched
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import climate_files_management
+import psychrometrics
+
+@pytest.fixture
+def meteo_file(tmp_path):
+    meteo_file_path = tmp_path/'station.csv'
+    meteo_file_path.write_text("T_dry;RH\n20.0;50\n30.0;80\n25.0;1\n")
+    return str(meteo_file_path)
+
+def test_second_run_up_to_date(meteo_file):
+    assert climate_files_management.preprocess_file(meteo_file) == 'updated'
+    climate_data = pd.read_csv(meteo_file)
+    assert list(climate_data.columns) == ['T_dry','w','RH']
+    assert np.allclose(climate_data['RH'],[0.5,0.8,0.01])
+    assert np.allclose(climate_data['w'],psychrometrics.humidity_ratio(np.array([20.,30.,25.]),'RH',np.array([0.5,0.8,0.01]),101325))
+
+    content = open(meteo_file).read()
+    assert climate_files_management.preprocess_file(meteo_file) == 'up to date'
+    assert climate_files_management.preprocess(os.path.dirname(meteo_file),workers=1) == {meteo_file: 'up to date'}
+    assert open(meteo_file).read() == content # The relative humidity is not divided by 100 again
+
+@pytest.mark.parametrize('failure',['write','replace'])
+def test_failed_write_keeps_file(meteo_file,monkeypatch,failure):
+    content = open(meteo_file).read()
+
+    if failure == 'write':
+        def to_csv(climate_data,file,index):
+            file.write("T_dry,w") # Partial file
+            raise OSError("No space left on device")
+        monkeypatch.setattr(pd.DataFrame,'to_csv',to_csv)
+    else:
+        def replace(source,destination):
+            raise OSError("Permission denied")
+        monkeypatch.setattr(climate_files_management.os,'replace',replace)
+
+    with pytest.raises(OSError):
+        climate_files_management.preprocess_file(meteo_file)
+    assert os.listdir(os.path.dirname(meteo_file)) == ['station.csv'] # No temporary file left
+    assert open(meteo_file).read() == content
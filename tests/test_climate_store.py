@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of climate_store.py: a touched file is only hashed once, rebuilding a
+copy does not remove the columns that other processes may be reading, and the
+copies are written next to the files or skipped if they cannot be written
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+import climate_store
+import main as feasibility
+
+@pytest.fixture
+def meteo_file(tmp_path,monkeypatch):
+    monkeypatch.setattr(climate_store,'cache_folder',str(tmp_path/'cache'))
+    meteo_file_path = tmp_path/'station.csv'
+    meteo_file_path.write_text("T_dry,w\n20.0,0.008\n30.0,0.012\n")
+    return str(meteo_file_path)
+
+def test_touched_file_records_new_time(meteo_file,monkeypatch):
+    path, info = climate_store.update(meteo_file)
+    stat = os.stat(meteo_file)
+    os.utime(meteo_file,ns=(stat.st_atime_ns,stat.st_mtime_ns+10**9))
+
+    assert climate_store.update(meteo_file)[1]['folder'] == info['folder'] # Not rebuilt
+    assert climate_store.read_info(path)['mtime_ns'] == stat.st_mtime_ns+10**9
+
+    # The content is not hashed again
+    monkeypatch.setattr(climate_store,'file_hash',lambda path: pytest.fail("hashed again"))
+    climate_store.update(meteo_file)
+
+def test_rebuild_keeps_previous_columns(meteo_file):
+    path, info = climate_store.update(meteo_file)
+    previous = climate_store.columns_path(path,info)
+
+    with open(meteo_file,'a') as file:
+        file.write("25.0,0.010\n")
+    climate_data = climate_store.load(meteo_file)
+
+    assert np.array_equal(climate_data['T_dry'],[20,30,25])
+    assert np.array_equal(np.load(os.path.join(previous,'T_dry.npy')),[20,30]) # Still readable by the other processes
+
+def test_stale_columns_removed(meteo_file,monkeypatch):
+    path, info = climate_store.update(meteo_file)
+    previous = climate_store.columns_path(path,info)
+
+    monkeypatch.setattr(climate_store,'stale_age',-1)
+    climate_store.build(meteo_file)
+    assert not os.path.exists(previous)
+    assert len(os.listdir(path)) == 2 # Description and current columns
+
+def test_copy_next_to_source(tmp_path):
+    meteo_file_path = tmp_path/'station.csv'
+    meteo_file_path.write_text("T_dry,RH\n20.0,0.5\n")
+    climate_data = climate_store.load(str(meteo_file_path),['T_dry','w'])
+
+    assert os.path.dirname(climate_store.store_path(str(meteo_file_path))) == str(tmp_path/'cache')
+    assert os.path.isdir(tmp_path/'cache')
+    assert climate_data['w'][0] > 0
+
+def test_copy_not_written(meteo_file,tmp_path,monkeypatch,capsys):
+    (tmp_path/'not_a_folder').write_text("")
+    monkeypatch.setattr(climate_store,'cache_folder',str(tmp_path/'not_a_folder'))
+    climate_data = climate_store.load(meteo_file,['T_dry'])
+
+    assert np.array_equal(climate_data['T_dry'],[20,30])
+    assert capsys.readouterr().out.startswith("Warning: The copy of")
+
+def test_read_errors_reported(tmp_path,capsys):
+    assert feasibility.load_climate_data(str(tmp_path/'missing.csv'),columns=['T_dry','w']) is None
+    assert "cannot be found" in capsys.readouterr().out
+
+    assert feasibility.load_climate_data(str(tmp_path),columns=['T_dry','w']) is None # A folder cannot be read
+    assert "cannot be read" in capsys.readouterr().out
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of design_solver.py: the threshold of each design variable separates
+feasible and not feasible designs of the feasibility analysis
+"""
+
+import pytest
+
+import climate_store
+import climate_zones
+import design_solver
+import main as feasibility
+import methodology
+
+# Returns True if the passive modes cover more than min_comfort of the hours (scalar boundary model)
+def comfort_reached(climate_data,key,value,min_comfort=0.98):
+    components = feasibility.default_components()
+    params = {}
+    if key.startswith('epsilon_'):
+        components[key[len('epsilon_'):]].epsilon = value
+    else:
+        params[key] = value
+    nb_hours = methodology.main(components,feasibility.resolve_params(params),climate_data,chart='no',verbose='no')[0]
+    return sum(nb_hours.values())-nb_hours['Active cooling'] > min_comfort*len(climate_data['T_dry'])
+
+@pytest.mark.parametrize('key',['epsilon_'+name for name in feasibility.default_components()])
+def test_threshold_of_each_component(key):
+    climate_data = climate_store.load(climate_zones.meteo_file_path('2A','present'),['T_dry','w'])
+    tol = 1e-3
+    value, side = design_solver.solve_threshold(climate_data,key,tol=tol)
+
+    if value is None:
+        assert side is None
+        return
+    outside = value-tol if side == 'above' else value+tol
+    assert comfort_reached(climate_data,key,value)
+    if value in design_solver.valid_bounds(key,0.05,0.99,feasibility.default_components(),{}): # Feasible in the whole interval
+        return
+    try:
+        assert not comfort_reached(climate_data,key,outside)
+    except ValueError: # Non-physical design, not feasible either
+        pass
+
+def test_threshold_of_a_parameter():
+    climate_data = climate_store.load(climate_zones.meteo_file_path('2A','present'),['T_dry','w'])
+    value, side = design_solver.solve_threshold(climate_data,'T_su_max',[16,24],tol=1e-2)
+
+    assert side == 'above'
+    assert comfort_reached(climate_data,'T_su_max',value)
+    assert not comfort_reached(climate_data,'T_su_max',value-1e-2)
+
+def test_feasible_everywhere():
+    climate_data = climate_store.load(climate_zones.meteo_file_path('2A','present'),['T_dry','w'])
+    assert design_solver.solve_threshold(climate_data,'epsilon_D-IEC') == (0.05,'above')
+    assert design_solver.solve_threshold(climate_data,'T_su_max',[20,24]) == (20,'above')
+
+def test_feasible_nowhere():
+    climate_data = climate_store.load(climate_zones.meteo_file_path('2A','present'),['T_dry','w'])
+    assert design_solver.solve_threshold(climate_data,'T_su_max',[10,12]) == (None,None)
+    assert not comfort_reached(climate_data,'T_su_max',12)
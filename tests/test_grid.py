@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of grid.py: the batched boundaries of the grid points give the same
+hours as the feasibility analysis of each point
+"""
+
+import numpy as np
+
+import climate_store
+import climate_zones
+import grid
+import main as feasibility
+import methodology
+
+def test_grid_matches_main():
+    climate_data = climate_store.load(climate_zones.meteo_file_path('2A','present'),['T_dry','w'])
+    values = {'epsilon_DEC': [0.6,0.85], 'epsilon_DW': [0.5,0.85], 'T_su_max': [18,20], 'T_in': [24,26]}
+    hours, axes, mode_list = grid.evaluate_grid(climate_data,values)
+
+    for i, epsilon_DEC in enumerate(values['epsilon_DEC']):
+        for j, epsilon_DW in enumerate(values['epsilon_DW']):
+            for k, T_su_max in enumerate(values['T_su_max']):
+                for l, T_in in enumerate(values['T_in']):
+                    components = feasibility.default_components()
+                    components['DEC'].epsilon = epsilon_DEC
+                    components['DW'].epsilon = epsilon_DW
+                    params = feasibility.resolve_params({'T_su_max': T_su_max, 'T_in': T_in})
+                    nb_hours = methodology.main(components,params,climate_data,chart='no',verbose='no')[0]
+                    assert list(hours[i,j,k,l]) == [nb_hours[mode] for mode in mode_list]
+
+def test_grid_flags_invalid_points():
+    climate_data = climate_store.load(climate_zones.meteo_file_path('2A','present'),['T_dry','w'])
+    hours = grid.evaluate_grid(climate_data,{'epsilon_DEC': [0.05,0.85]})[0]
+
+    assert np.isnan(hours[0]).all()
+    assert hours[1].sum() == len(climate_data['T_dry'])
+
+def test_indoor_axes_change_hours():
+    climate_data = climate_store.load(climate_zones.meteo_file_path('2A','present'),['T_dry','w'])
+    values = {'T_in': [22,24,28], 'RH_in': [0.3,0.6]}
+    hours, axes, mode_list = grid.evaluate_grid(climate_data,values)
+
+    for i, T_in in enumerate(values['T_in']):
+        for j, RH_in in enumerate(values['RH_in']):
+            params = feasibility.resolve_params({'T_in': T_in, 'RH_in': RH_in})
+            nb_hours = methodology.main(feasibility.default_components(),params,climate_data,chart='no',verbose='no')[0]
+            assert list(hours[i,j]) == [nb_hours[mode] for mode in mode_list]
+
+    # The indoor humidity, hence the limits, depend on both axes
+    assert len({tuple(hours[i,j]) for i in range(3) for j in range(2)}) == 6
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of histogram.py: the hours of each mode are the ones of the feasibility
+analysis, exactly or within the error bound when the crossed bins are
+classified by their centre
+"""
+
+import numpy as np
+import pytest
+
+import climate_store
+import climate_zones
+import histogram
+import main as feasibility
+import methodology
+
+@pytest.mark.parametrize('climate',['2A','4A'])
+@pytest.mark.parametrize('hum',['yes','no'])
+def test_counts_match_feasibility_analysis(climate,hum):
+    climate_data = climate_store.load(climate_zones.meteo_file_path(climate,'present'),['T_dry','w'])
+    T_out, w_out = climate_data['T_dry'], climate_data['w']
+    model = methodology.get_boundary_model(feasibility.default_components(),feasibility.resolve_params({}),hum)
+
+    expected = methodology.main(feasibility.default_components(),feasibility.resolve_params({}),climate_data,chart='no',hum=hum,verbose='no')[0]
+    counts = methodology.classify(T_out,w_out,model)[1]
+    assert [expected[mode] for mode in model.mode_list] == list(counts)
+
+    nb_hours, error = histogram.classify_histogram(T_out,w_out,model)
+    assert nb_hours == {mode: expected[mode] for mode in model.mode_list}
+    assert error == 0
+
+    # Approximate counts: each hour of a crossed bin counted in a wrong mode (or in no mode) changes two counts by one
+    bins = histogram.bin_climate(T_out,w_out,dT=0.5,dw=5e-4)
+    nb_hours, error = histogram.classify_bins(bins,model,max_error=len(T_out))
+    differences = [nb_hours[mode]-expected[mode] for mode in model.mode_list]
+    assert error > 0
+    assert sum(np.abs(differences))+abs(sum(differences)) <= 2*error
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the import path of the analysis: main, sweep and grid load quickly,
+without any plotting module and without CoolProp, which is only imported at
+the first property query (see properties.py)
+"""
+
+import os
+import subprocess
+import sys
+
+budget = 2.0 # Maximum import time [s]
+
+def imported_modules(code):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable,'-c',code],cwd=root,capture_output=True,text=True,check=True).stdout
+    return output.split()
+
+def test_import_time_and_modules():
+    import_time, plotting, coolprop = imported_modules(
+        "import sys, time; start = time.perf_counter(); import main, sweep, grid; "
+        "modules = {name.split('.')[0] for name in sys.modules}; "
+        "print(time.perf_counter()-start, 'matplotlib' in modules, 'CoolProp' in modules)")
+
+    assert plotting == 'False'
+    assert coolprop == 'False'
+    assert float(import_time) < budget
+
+def test_coolprop_imported_at_first_query():
+    coolprop = imported_modules(
+        "import sys, properties; print('CoolProp' in sys.modules); "
+        "properties.HAPropsSI('W','T',293.15,'RH',0.5,'P',101325); print('CoolProp' in sys.modules)")
+
+    assert coolprop == ['False','True']
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of incremental.py: after each modification, the hours of the design
+session are the ones of a full feasibility analysis of the same configuration
+"""
+
+import climate_store
+import climate_zones
+import incremental
+import main as feasibility
+import methodology
+
+def test_updates_match_full_analysis():
+    climate_data = climate_store.load(climate_zones.meteo_file_path('2A','present'),['T_dry','w'])
+    session = incremental.design_session(climate_data)
+
+    # Modification and equivalent configuration of a full analysis
+    steps = [({'T_in': 26}, None, {'T_in': 26}),
+             ({'RH_in': 0.6}, None, {'T_in': 26, 'RH_in': 0.6}),
+             ({'w_in': 0.011}, None, {'T_in': 26, 'w_in': 0.011}),
+             ({'T_in': 25}, None, {'T_in': 25, 'w_in': 0.011}),
+             (None, {'DEC': 0.7, 'DW': 0.6}, {'T_in': 25, 'w_in': 0.011}),
+             ({'T_su_max': 21, 'T_wb_in': 18}, None, {'T_in': 25, 'T_wb_in': 18, 'T_su_max': 21}),
+             ({'RH_in': 0.4}, {'IEC': 0.8}, {'T_in': 25, 'RH_in': 0.4, 'T_su_max': 21})]
+
+    components = feasibility.default_components()
+    previous_w_in = session.model.w_in
+    for params, epsilon, full_params in steps:
+        nb_hours = session.update(params,epsilon)
+        for name in epsilon or {}:
+            components[name].epsilon = epsilon[name]
+
+        resolved = feasibility.resolve_params(dict(full_params))
+        expected = methodology.main(components,resolved,climate_data,chart='no',verbose='no')[0]
+        assert nb_hours == expected
+        assert session.model.w_in == resolved['w_in']
+
+        if params is not None and 'T_in' in params and 'w_in' not in full_params:
+            assert session.model.w_in != previous_w_in # The indoor humidity follows the indoor temperature
+        previous_w_in = session.model.w_in
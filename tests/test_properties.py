@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of properties.py: the cached queries are the CoolProp ones, and with a
+tolerance per input name the results stay within the rounding of the inputs
+"""
+
+import numpy as np
+import pytest
+from CoolProp.CoolProp import HAPropsSI as coolprop_HAPropsSI
+
+import properties
+
+P_atm = 101325
+to_K = 273.15
+
+@pytest.fixture
+def tolerance():
+    tolerance = {'T': 0.01, 'W': 1e-6, 'RH': 1e-4}
+    properties.configure(tolerance=tolerance)
+    yield tolerance
+    properties.configure(tolerance=None)
+
+def test_exact_without_tolerance():
+    assert properties.HAPropsSI('W','T',25.123+to_K,'RH',0.4567,'P',P_atm) == coolprop_HAPropsSI('W','T',25.123+to_K,'RH',0.4567,'P',P_atm)
+
+def test_results_within_tolerance(tolerance):
+    rng = np.random.default_rng(0)
+    for T, RH, W in zip(rng.uniform(-10,45,50)+to_K,rng.uniform(0.05,1,50),rng.uniform(5e-4,0.02,50)):
+        # Spec. humidity: dW/dT < 2e-3 kg/kg/K and dW/dRH < 0.07 kg/kg up to 45 °C
+        W_exact = coolprop_HAPropsSI('W','T',T,'RH',RH,'P',P_atm)
+        assert abs(properties.HAPropsSI('W','T',T,'RH',RH,'P',P_atm)-W_exact) <= 2e-3*tolerance['T']+0.07*tolerance['RH']
+
+        # Enthalpy: dH/dT < 1.1e3 J/kg/K and dH/dW < 2.6e6 J/kg, i.e. the small humidity ratios keep their precision
+        H_exact = coolprop_HAPropsSI('H','T',T,'W',W,'P',P_atm)
+        assert abs(properties.HAPropsSI('H','T',T,'W',W,'P',P_atm)-H_exact) <= 1.1e3*tolerance['T']+2.6e6*tolerance['W']
+
+    # The pressure is not in the dictionnary, so it is not rounded
+    assert properties.rounded('P',P_atm+0.3) == P_atm+0.3
+
+def test_array_rounding_matches_scalar(tolerance):
+    T = np.array([20.004,20.006,35.5])+to_K
+    W = np.array([0.0081234,0.0081236,0.0123])
+    expected = [properties.HAPropsSI('H','T',T_i,'W',W_i,'P',P_atm) for T_i, W_i in zip(T,W)]
+    assert np.allclose(properties.HAPropsSI_array('H','T',T,'W',W,'P',P_atm),expected,rtol=0,atol=1e-6)
+
+def test_scalar_tolerance_rejected():
+    with pytest.raises(ValueError):
+        properties.configure(tolerance=0.01)
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of psychrometrics.py: the vectorized humidity ratios stay within the
+documented accuracy of HAPropsSI at 101325 Pa between -30°C and 50°C
+"""
+
+import numpy as np
+import pytest
+from CoolProp.CoolProp import HAPropsSI
+
+import psychrometrics
+
+P_atm = 101325
+to_K = 273.15
+
+# Maximum error on the humidity ratio computed from each humidity variable [kg/kg]
+tolerance = {'RH': 3e-6, 'T_wb': 3e-5, 'T_dp': 3e-6}
+
+@pytest.fixture(scope='module')
+def reference():
+    rng = np.random.default_rng(0)
+    nb_points = 2000
+    T_dry = rng.uniform(-30,50,nb_points)
+    RH = rng.uniform(0.02,1,nb_points)
+
+    w_ref = np.array([HAPropsSI('W','T',T+to_K,'RH',rh,'P',P_atm) for T, rh in zip(T_dry,RH)])
+    inputs = {'RH': RH,
+              'T_wb': np.array([HAPropsSI('B','T',T+to_K,'RH',rh,'P',P_atm)-to_K for T, rh in zip(T_dry,RH)]),
+              'T_dp': np.array([HAPropsSI('D','T',T+to_K,'RH',rh,'P',P_atm)-to_K for T, rh in zip(T_dry,RH)])}
+    return T_dry, inputs, w_ref
+
+@pytest.mark.parametrize('var',['RH','T_wb','T_dp'])
+def test_humidity_ratio_matches_coolprop(reference,var):
+    T_dry, inputs, w_ref = reference
+    error = np.max(np.abs(psychrometrics.humidity_ratio(T_dry,var,inputs[var])-w_ref))
+    assert error < tolerance[var]
+
+def test_saturation_is_continuous_at_triple_point():
+    T = np.array([psychrometrics.T_triple-1e-9,psychrometrics.T_triple])
+    w = psychrometrics.w_sat(T)
+    assert abs(w[1]-w[0]) < 1e-6
+
+def test_invalid_humidity_variable():
+    with pytest.raises(ValueError):
+        psychrometrics.humidity_ratio(20,'H',0.5)
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of raster.py: the hours of each mode are the ones of the feasibility
+analysis, with a new raster and with the raster loaded from its file
+"""
+
+import numpy as np
+import pytest
+
+import climate_store
+import climate_zones
+import main as feasibility
+import methodology
+import raster
+
+@pytest.mark.parametrize('hum',['yes','no'])
+def test_counts_match_feasibility_analysis(tmp_path,monkeypatch,hum):
+    monkeypatch.setattr(raster,'rasters',{})
+    climates = {climate: climate_store.load(climate_zones.meteo_file_path(climate,'present'),['T_dry','w']) for climate in ['2A','4A']}
+    model = methodology.get_boundary_model(feasibility.default_components(),feasibility.resolve_params({}),hum)
+
+    lookup = raster.get_raster(model,dT=0.1,dw=1e-4,folder=str(tmp_path))
+    saved = raster.load(raster.raster_path(model,dT=0.1,dw=1e-4,folder=str(tmp_path)))
+    nb_hours = raster.classify_climates(climates,model,dT=0.1,dw=1e-4,folder=str(tmp_path))
+
+    for climate in climates:
+        T_out, w_out = climates[climate]['T_dry'], climates[climate]['w']
+        labels, counts = methodology.classify(T_out,w_out,model)
+        expected = methodology.main(feasibility.default_components(),feasibility.resolve_params({}),climates[climate],chart='no',hum=hum,verbose='no')[0]
+
+        assert nb_hours[climate] == {mode: expected[mode] for mode in model.mode_list}
+        for mode_raster in [lookup, saved]:
+            raster_labels, raster_counts = mode_raster.classify(T_out,w_out)
+            assert np.array_equal(raster_labels,labels)
+            assert np.array_equal(raster_counts,counts)
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of result_cache.py: the results computed with another rounding
+tolerance or another version of CoolProp are not reused
+"""
+
+import numpy as np
+
+import main as feasibility
+import properties
+import result_cache
+
+def test_key_depends_on_tolerance():
+    T_out, w_out = np.array([20.,30.]), np.array([0.008,0.012])
+    components = feasibility.default_components()
+    params = {'T_su_max': 20}
+
+    exact = result_cache.result_key(T_out,w_out,components,params)
+    properties.configure(tolerance={'T': 0.01, 'W': 1e-6})
+    try:
+        rounded = result_cache.result_key(T_out,w_out,components,params)
+    finally:
+        properties.configure(tolerance=None)
+
+    assert rounded != exact
+    assert result_cache.result_key(T_out,w_out,components,params) == exact
+
+def test_version_depends_on_coolprop(monkeypatch):
+    version = result_cache.methodology_version()
+    monkeypatch.setattr(properties,'coolprop_version',lambda: '0.0.0')
+    assert result_cache.methodology_version() != version
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of uncertainty.py: the samples leading to non-physical states are flagged
+and left out, the others (including sampled indoor conditions) give the same
+hours as the feasibility analysis
+"""
+
+import numpy as np
+import pytest
+
+import climate_store
+import climate_zones
+import main as feasibility
+import methodology
+import uncertainty
+
+def test_monte_carlo_drops_invalid_samples():
+    climate_data = climate_store.load(climate_zones.meteo_file_path('2A','present'),['T_dry','w'])
+    epsilons = np.array([0.05,0.85,0.6,0.1])
+    samples, hours, summary, recommendation = uncertainty.monte_carlo(climate_data,{'epsilon_DEC': lambda rng, n: epsilons},nb_samples=len(epsilons))
+
+    assert list(samples['valid']) == [False,True,True,False]
+    assert hours.loc[~samples['valid']].isna().all().all()
+    assert samples.loc[~samples['valid'],'recommended_mode'].isna().all()
+    assert np.isclose(recommendation['frequency'].sum(),1)
+
+    for i in np.where(samples['valid'])[0]:
+        components = feasibility.default_components()
+        components['DEC'].epsilon = epsilons[i]
+        nb_hours = methodology.main(components,feasibility.resolve_params({}),climate_data,chart='no',verbose='no')[0]
+        assert list(hours.loc[i]) == [nb_hours[mode] for mode in hours.columns]
+
+def test_monte_carlo_indoor_conditions():
+    climate_data = climate_store.load(climate_zones.meteo_file_path('2A','present'),['T_dry','w'])
+    T_in, RH_in = np.array([22.,24.,28.]), np.array([0.3,0.5,0.6])
+    samples, hours = uncertainty.monte_carlo(climate_data,{'T_in': lambda rng, n: T_in,'RH_in': lambda rng, n: RH_in},nb_samples=3)[:2]
+
+    for i in range(3):
+        params = feasibility.resolve_params({'T_in': T_in[i], 'RH_in': RH_in[i]})
+        nb_hours = methodology.main(feasibility.default_components(),params,climate_data,chart='no',verbose='no')[0]
+        assert list(hours.loc[i]) == [nb_hours[mode] for mode in hours.columns]
+    assert len({tuple(hours.loc[i]) for i in range(3)}) == 3
+
+def test_monte_carlo_without_valid_sample():
+    climate_data = climate_store.load(climate_zones.meteo_file_path('2A','present'),['T_dry','w'])
+    with pytest.raises(ValueError):
+        uncertainty.monte_carlo(climate_data,{'epsilon_DEC': ('uniform',0.01,0.05)},nb_samples=20,seed=0)
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 17 19:24:48 2026
+
+@author: Alanis Zeoli
+
+Objective: Propagate the uncertainty on the component effectiveness and on the
+operational parameters to the number of hours in each mode and to the
+recommended components, by Monte Carlo sampling
+
+Inputs:
+    climate_data: Dataframe or dictionnary with the columns T_dry and w
+    distributions: Dictionnary of the uncertain variables (same keys as in grid.py: epsilon_<name> or a parameter), each given as:
+        ('normal', mean, standard deviation)
+        ('uniform', low, high)
+        ('triangular', low, mode, high)
+        or a function returning n samples from a numpy random generator: function(rng,n)
+    nb_samples: Number of samples (default = 1000)
+    components, params, hum: Same as in main.py, the uncertain variables being replaced by their samples
+    percentiles: Percentiles of the hours in each mode (default = [5, 50, 95])
+    min_comfort: Fraction of the hours used to recommend the components (default = 0.98, see main.recommended_mode)
+    seed: Seed of the random generator (default = None)
+
+Outputs:
+    samples: Dataframe of the sampled values (one row per sample), with the columns valid and recommended_mode
+    hours: Dataframe of the number of hours in each mode (one row per sample, one column per mode, nan for the invalid samples)
+    summary: Dataframe with the mean, standard deviation and percentiles of the hours in each mode
+    recommendation: Dataframe with the frequency of each recommended mode and its components
+
+The limits of all the samples are built at once (methodology.boundary_coefficients),
+then all the samples are classified together against the climate arrays (grid.classify_grid).
+The samples leading to non-physical states (e.g. a very low effectiveness) are
+flagged in the column valid of samples and left out of hours, summary and recommendation
+(ValueError if no sample is valid).
+"""
+
+import numpy as np
+import pandas as pd
+
+# Import own functions
+import grid
+import main as feasibility
+import methodology
+
+# Returns n samples of a distribution
+def sample(distribution,rng,n):
+    if callable(distribution):
+        return np.asarray(distribution(rng,n),dtype=float)
+
+    law = distribution[0]
+    if law == 'normal':
+        return rng.normal(distribution[1],distribution[2],n)
+    if law == 'uniform':
+        return rng.uniform(distribution[1],distribution[2],n)
+    if law == 'triangular':
+        return rng.triangular(distribution[1],distribution[2],distribution[3],n)
+    raise ValueError(str(law)+" is not a valid distribution, it should be 'normal', 'uniform' or 'triangular'")
+
+# Returns the index of the recommended mode of each sample (see main.recommended_mode)
+def recommended_modes(counts,nb_data,min_comfort=0.98):
+    reached = np.cumsum(counts,axis=1) > min_comfort*nb_data
+    index = np.argmax(reached,axis=1)
+    return np.where(reached.any(axis=1),index,counts.shape[1]-1) # The last mode is recommended if the comfort is never reached
+
+def monte_carlo(climate_data,distributions,nb_samples=1000,components=None,params=None,hum='yes',percentiles=(5,50,95),min_comfort=0.98,seed=None):
+    if components is None:
+        components = feasibility.default_components()
+    if params is None:
+        params = {}
+
+    rng = np.random.default_rng(seed)
+    keys = list(distributions.keys())
+    values = {key: sample(distributions[key],rng,nb_samples) for key in keys}
+    for key in keys:
+        if key.startswith('epsilon_'):
+            values[key] = np.clip(values[key],1e-3,1-1e-3) # The effectiveness is strictly between 0 and 1
+    samples = pd.DataFrame(values)
+
+    # Boundaries of all the samples at once
+    sample_components, sample_params = grid.grid_arrays(keys,[values[key] for key in keys],components,params)
+    mode_list, vertical, m, p, w_in, valid = methodology.boundary_coefficients(sample_components,sample_params,hum)
+    samples['valid'] = valid
+    if not valid.any():
+        raise ValueError("None of the "+str(nb_samples)+" samples leads to physical states, the distributions should be modified")
+
+    # Classification of all the valid samples at once, the non-physical ones are dropped
+    T_out = np.asarray(climate_data['T_dry'],dtype=float)
+    w_out = np.asarray(climate_data['w'],dtype=float)
+    counts = grid.classify_grid(T_out,w_out,vertical,m[valid],p[valid],w_in[valid],hum)
+
+    hours = pd.DataFrame(np.nan,index=samples.index,columns=mode_list)
+    hours.loc[valid] = counts
+
+    summary = pd.DataFrame({'mean': counts.mean(axis=0), 'std': counts.std(axis=0)},index=mode_list)
+    for percentile, value in zip(percentiles,np.percentile(counts,percentiles,axis=0)):
+        summary['p'+str(percentile)] = value
+
+    component_dict = methodology.mode_components(mode_list)
+    recommended = recommended_modes(counts,len(T_out),min_comfort)
+    frequency = np.bincount(recommended,minlength=len(mode_list))/max(1,len(counts))
+    recommendation = pd.DataFrame({'frequency': frequency,
+                                   'components': [', '.join(component_dict[mode]) for mode in mode_list]},index=mode_list)
+    samples['recommended_mode'] = None
+    samples.loc[valid,'recommended_mode'] = [mode_list[i] for i in recommended]
+    return samples, hours, summary, recommendation